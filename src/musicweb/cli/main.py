@@ -392,7 +392,7 @@ def dedup_youtube_music_command(args):
     print(f"Loaded {len(songs)} library songs")
 
     print("\n🧭 Scanning for duplicates...")
-    groups = dedup.find_duplicates(similarity_threshold=args.threshold)
+    groups = dedup.find_duplicates(similarity_threshold=args.threshold, songs=songs)
     total_dup_tracks = sum(len(g["duplicates"]) for g in groups)
     can_remove = sum(len(g["duplicates"]) - 1 for g in groups)
 
@@ -483,7 +483,7 @@ def clean_youtube_music_command(args):
     print(f"Loaded {len(songs)} library songs")
 
     print("\n🧭 Scanning for duplicates...")
-    groups = dedup.find_duplicates(similarity_threshold=args.threshold)
+    groups = dedup.find_duplicates(similarity_threshold=args.threshold, songs=songs)
     print(f"Found {len(groups)} duplicate groups")
 
     # Filter by groups if specified
@@ -3,15 +3,43 @@ Library comparison functionality for finding matches and differences between pla
 """
 
 import csv
+import functools
 import json
+import re
 import time
-from collections import defaultdict
-from dataclasses import asdict, dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    HAVE_ORJSON = False
+
 from ..core.models import Library, Track, TrackMatcher
 
+# Version/edition markers dropped to find the base title, fused into one pass.
+# "radio edit" and "<year> remaster" need no patterns of their own: the
+# standalone "edit"/"remaster" words always took precedence, keeping "radio"
+# and the year.
+_VERSION_RE = re.compile(
+    r"\b(?:remaster(?:ed)?|remix|version|live|acoustic|instrumental|deluxe"
+    r"|extended|edit|demo|mono|stereo|explicit|clean)\b",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+
+# Source libraries smaller than this are compared in-process even when
+# workers are configured; process start-up would outweigh the split
+_PARALLEL_MIN_TRACKS = 500
+
 
 @dataclass
 class MatchResult:
@@ -54,24 +82,33 @@ class ComparisonResult:
     match_rate: float = 0.0
     avg_confidence: float = 0.0
 
+    # Column views of `matches` for vectorized rendering and reductions
+    confidences: np.ndarray = field(init=False, repr=False, compare=False)
+    match_types: np.ndarray = field(init=False, repr=False, compare=False)
+    src_titles: List[str] = field(init=False, repr=False, compare=False)
+    tgt_titles: List[str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Calculate statistics after initialization."""
         self.total_matches = len(self.matches)
 
+        self.confidences = np.fromiter(
+            (m.confidence for m in self.matches),
+            dtype=np.float64,
+            count=self.total_matches,
+        )
+        self.match_types = np.array([m.match_type for m in self.matches], dtype=str)
+        self.src_titles = [m.source_track.title for m in self.matches]
+        self.tgt_titles = [m.target_track.title for m in self.matches]
+
         if self.matches:
             # Count match types
-            for match in self.matches:
-                if match.match_type == "exact":
-                    self.exact_matches += 1
-                elif match.match_type == "fuzzy":
-                    self.fuzzy_matches += 1
-                elif match.match_type == "isrc":
-                    self.isrc_matches += 1
+            self.exact_matches += int((self.match_types == "exact").sum())
+            self.fuzzy_matches += int((self.match_types == "fuzzy").sum())
+            self.isrc_matches += int((self.match_types == "isrc").sum())
 
             # Calculate averages
-            self.avg_confidence = sum(m.confidence for m in self.matches) / len(
-                self.matches
-            )
+            self.avg_confidence = float(self.confidences.mean())
 
         # Calculate match rate
         if self.music_source_tracks > 0:
@@ -137,79 +174,83 @@ class ComparisonResult:
     def _save_matches_csv(self, file_path: Path) -> None:
         """Save matched tracks to CSV."""
         with open(file_path, "w", newline="", encoding="utf-8") as f:
-            fieldnames = [
-                "source_title",
-                "source_artist",
-                "source_album",
-                "source_duration",
-                "target_title",
-                "target_artist",
-                "target_album",
-                "target_duration",
-                "confidence",
-                "match_type",
-                "source_platform",
-                "target_platform",
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for match in self.matches:
-                writer.writerow(
-                    {
-                        "source_title": match.source_track.title,
-                        "source_artist": match.source_track.artist,
-                        "source_album": match.source_track.album or "",
-                        "source_duration": match.source_track.duration or "",
-                        "target_title": match.target_track.title,
-                        "target_artist": match.target_track.artist,
-                        "target_album": match.target_track.album or "",
-                        "target_duration": match.target_track.duration or "",
-                        "confidence": round(match.confidence * 100, 2),
-                        "match_type": match.match_type,
-                        "source_platform": match.source_track.platform or "",
-                        "target_platform": match.target_track.platform or "",
-                    }
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "source_title",
+                    "source_artist",
+                    "source_album",
+                    "source_duration",
+                    "target_title",
+                    "target_artist",
+                    "target_album",
+                    "target_duration",
+                    "confidence",
+                    "match_type",
+                    "source_platform",
+                    "target_platform",
+                ]
+            )
+            # Rows stream straight from the matches, no per-row dicts
+            writer.writerows(
+                (
+                    m.source_track.title,
+                    m.source_track.artist,
+                    m.source_track.album or "",
+                    m.source_track.duration or "",
+                    m.target_track.title,
+                    m.target_track.artist,
+                    m.target_track.album or "",
+                    m.target_track.duration or "",
+                    round(m.confidence * 100, 2),
+                    m.match_type,
+                    m.source_track.platform or "",
+                    m.target_track.platform or "",
                 )
+                for m in self.matches
+            )
 
     def _save_missing_csv(self, file_path: Path) -> None:
         """Save missing tracks to CSV."""
         with open(file_path, "w", newline="", encoding="utf-8") as f:
-            fieldnames = [
-                "title",
-                "artist",
-                "album",
-                "duration",
-                "isrc",
-                "platform",
-                "track_id",
-                "url",
-                "year",
-                "genre",
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for track in self.missing_tracks:
-                writer.writerow(
-                    {
-                        "title": track.title,
-                        "artist": track.artist,
-                        "album": track.album or "",
-                        "duration": track.duration or "",
-                        "isrc": track.isrc or "",
-                        "platform": track.platform or "",
-                        "track_id": track.track_id or "",
-                        "url": track.url or "",
-                        "year": track.year or "",
-                        "genre": track.genre or "",
-                    }
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "title",
+                    "artist",
+                    "album",
+                    "duration",
+                    "isrc",
+                    "platform",
+                    "track_id",
+                    "url",
+                    "year",
+                    "genre",
+                ]
+            )
+            writer.writerows(
+                (
+                    t.title,
+                    t.artist,
+                    t.album or "",
+                    t.duration or "",
+                    t.isrc or "",
+                    t.platform or "",
+                    t.track_id or "",
+                    t.url or "",
+                    t.year or "",
+                    t.genre or "",
                 )
+                for t in self.missing_tracks
+            )
 
     def _save_summary_json(self, file_path: Path) -> None:
         """Save summary statistics to JSON."""
+        if HAVE_ORJSON:
+            file_path.write_bytes(
+                orjson.dumps(self.get_stats(), option=orjson.OPT_INDENT_2)
+            )
+            return
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(self.get_stats(), f, indent=2, ensure_ascii=False)
 
@@ -223,9 +264,12 @@ class LibraryComparator:
         enable_duration: bool = True,
         enable_album: bool = False,
         progress_callback: Optional[callable] = None,
+        workers: int = 1,
     ):
         self.matcher = TrackMatcher(strict_mode, enable_duration, enable_album)
         self.progress_callback = progress_callback
+        # Worker processes for large comparisons; 1 keeps everything in-process
+        self.workers = workers
 
     def compare_libraries(
         self, source_library: Library, target_library: Library
@@ -240,20 +284,13 @@ class LibraryComparator:
         missing_tracks = []
         processed = 0
 
-        # Create lookup indices for faster matching
-        target_by_isrc = {}
-        target_by_normalized = {}
+        # Lookup indices for faster matching; the library caches the exact
+        # ones across comparisons until it changes
+        target_by_isrc = target_library.tracks_by_isrc
+        target_by_normalized = target_library.tracks_by_key
         target_by_base = {}
 
         for track in target_music:
-            if track.isrc:
-                target_by_isrc[track.isrc.lower()] = track
-
-            key = (track.normalized_title, track.normalized_artist)
-            if key not in target_by_normalized:
-                target_by_normalized[key] = []
-            target_by_normalized[key].append(track)
-
             # Build a secondary index ignoring version/remaster/live tokens in titles
             base_title = self._strip_version_tokens(track.normalized_title)
             base_key = (base_title, track.normalized_artist)
@@ -261,6 +298,13 @@ class LibraryComparator:
                 target_by_base[base_key] = []
             target_by_base[base_key].append(track)
 
+        if self.workers > 1 and len(source_music) >= _PARALLEL_MIN_TRACKS:
+            return self._compare_in_workers(
+                source_library,
+                target_library,
+                (target_music, target_by_isrc, target_by_normalized, target_by_base),
+            )
+
         # Process each source track
         for source_track in source_music:
             if self.progress_callback:
@@ -297,6 +341,68 @@ class LibraryComparator:
             missing_tracks=missing_tracks,
         )
 
+    def _compare_in_workers(
+        self, source_library: Library, target_library: Library, target_indices: tuple
+    ) -> ComparisonResult:
+        """`compare_libraries` with source tracks sharded across processes.
+
+        Each worker receives the target indices once, at start-up. Chunks
+        report back (target position, confidence, match type) tuples so the
+        results reference the caller's own Track objects.
+        """
+        source_music = source_library.music_tracks
+        target_music = target_indices[0]
+        settings = (
+            self.matcher.strict_mode,
+            self.matcher.enable_duration,
+            self.matcher.enable_album,
+        )
+        # A few chunks per worker keeps progress updates flowing
+        size = -(-len(source_music) // (self.workers * 4))
+        chunks = [source_music[i : i + size] for i in range(0, len(source_music), size)]
+
+        matches = []
+        missing_tracks = []
+        processed = 0
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_match_worker,
+            initargs=(settings, target_indices),
+        ) as pool:
+            for chunk, found in zip(chunks, pool.map(_match_chunk, chunks)):
+                for source_track, hit in zip(chunk, found):
+                    if hit is None:
+                        missing_tracks.append(source_track)
+                        continue
+                    position, confidence, match_type = hit
+                    matches.append(
+                        MatchResult(
+                            source_track=source_track,
+                            target_track=target_music[position],
+                            confidence=confidence,
+                            match_type=match_type,
+                        )
+                    )
+                processed += len(chunk)
+                if self.progress_callback:
+                    self.progress_callback(
+                        processed, len(source_music), f"Processed {processed} tracks"
+                    )
+
+        if self.progress_callback:
+            self.progress_callback(processed, len(source_music), "Comparison complete")
+
+        return ComparisonResult(
+            source_library=source_library.name,
+            target_library=target_library.name,
+            total_source_tracks=source_library.total_tracks,
+            total_target_tracks=target_library.total_tracks,
+            music_source_tracks=len(source_music),
+            music_target_tracks=len(target_music),
+            matches=matches,
+            missing_tracks=missing_tracks,
+        )
+
     def _find_match(
         self,
         source_track: Track,
@@ -382,6 +488,7 @@ class LibraryComparator:
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def _strip_version_tokens(title: str) -> str:
         """Remove common version/remaster/live tokens from a normalized title.
 
@@ -389,32 +496,7 @@ class LibraryComparator:
         """
         if not title:
             return ""
-        # Remove common version keywords
-        patterns = [
-            r"\bremaster(?:ed)?\b",
-            r"\bremix\b",
-            r"\bversion\b",
-            r"\blive\b",
-            r"\bacoustic\b",
-            r"\binstrumental\b",
-            r"\bdeluxe\b",
-            r"\bextended\b",
-            r"\bedit\b",
-            r"\bradio\s+edit\b",
-            r"\bdemo\b",
-            r"\bmono\b",
-            r"\bstereo\b",
-            r"\bexplicit\b",
-            r"\bclean\b",
-            r"\b\d{2,4}\s+remaster(?:ed)?\b",
-        ]
-        import re
-
-        cleaned = title
-        for p in patterns:
-            cleaned = re.sub(p, " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        return cleaned
+        return _WS_RE.sub(" ", _VERSION_RE.sub(" ", title)).strip()
 
     def analyze_libraries(self, libraries: List[Library]) -> Dict[str, Any]:
         """Analyze multiple libraries for overlap and statistics."""
@@ -463,34 +545,36 @@ class LibraryComparator:
         if not libraries:
             return []
 
-        # Start with the first library's tracks
-        universal_candidates = set()
-        for track in libraries[0].music_tracks:
-            universal_candidates.add((track.normalized_title, track.normalized_artist))
-
-        # Check each subsequent library
-        for library in libraries[1:]:
-            library_tracks = set()
-            for track in library.music_tracks:
-                library_tracks.add((track.normalized_title, track.normalized_artist))
-
-            universal_candidates &= library_tracks
-
-        # Convert back to track info
+        # Intersect starting from the smallest library so each `&=` only
+        # probes the (already small) running candidate set
+        by_size = sorted(libraries, key=lambda lib: len(lib.music_tracks))
+        universal_candidates = {
+            (track.normalized_title, track.normalized_artist)
+            for track in by_size[0].music_tracks
+        }
+        for library in by_size[1:]:
+            if not universal_candidates:
+                break
+            universal_candidates &= {
+                (track.normalized_title, track.normalized_artist)
+                for track in library.music_tracks
+            }
+
+        # Convert back to track info, taking the first representative track
+        # from the first library in a single pass
         universal_tracks = []
-        for title, artist in universal_candidates:
-            # Find a representative track from the first library
-            for track in libraries[0].music_tracks:
-                if (track.normalized_title, track.normalized_artist) == (title, artist):
-                    universal_tracks.append(
-                        {
-                            "title": track.title,
-                            "artist": track.artist,
-                            "album": track.album,
-                            "appears_in": len(libraries),
-                        }
-                    )
-                    break
+        for track in libraries[0].music_tracks:
+            key = (track.normalized_title, track.normalized_artist)
+            if key in universal_candidates:
+                universal_candidates.discard(key)
+                universal_tracks.append(
+                    {
+                        "title": track.title,
+                        "artist": track.artist,
+                        "album": track.album,
+                        "appears_in": len(libraries),
+                    }
+                )
 
         return sorted(universal_tracks, key=lambda x: (x["artist"], x["title"]))
 
@@ -498,45 +582,24 @@ class LibraryComparator:
         self, libraries: List[Library]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Find tracks unique to each library."""
-        unique_tracks = {}
-
-        for i, library in enumerate(libraries):
-            library_unique = []
-            library_tracks = set()
-
-            for track in library.music_tracks:
-                library_tracks.add((track.normalized_title, track.normalized_artist))
-
-            # Check against all other libraries
-            for track in library.music_tracks:
-                track_key = (track.normalized_title, track.normalized_artist)
-                is_unique = True
-
-                for j, other_library in enumerate(libraries):
-                    if i == j:
-                        continue
-
-                    for other_track in other_library.music_tracks:
-                        other_key = (
-                            other_track.normalized_title,
-                            other_track.normalized_artist,
-                        )
-                        if track_key == other_key:
-                            is_unique = False
-                            break
-
-                    if not is_unique:
-                        break
-
-                if is_unique:
-                    library_unique.append(
-                        {
-                            "title": track.title,
-                            "artist": track.artist,
-                            "album": track.album,
-                        }
-                    )
+        key_sets = [
+            {(t.normalized_title, t.normalized_artist) for t in library.music_tracks}
+            for library in libraries
+        ]
+        # A key is unique to a library when no other library holds it
+        owners = Counter(key for keys in key_sets for key in keys)
 
+        unique_tracks = {}
+        for library in libraries:
+            library_unique = [
+                {
+                    "title": track.title,
+                    "artist": track.artist,
+                    "album": track.album,
+                }
+                for track in library.music_tracks
+                if owners[(track.normalized_title, track.normalized_artist)] == 1
+            ]
             unique_tracks[library.name] = sorted(
                 library_unique, key=lambda x: (x["artist"], x["title"])
             )
@@ -585,3 +648,27 @@ class LibraryComparator:
         )[:20]
 
         return artist_analysis
+
+
+# State of a comparison worker process, set once by _init_match_worker
+_worker_state: Optional[Tuple[Any, ...]] = None
+
+
+def _init_match_worker(settings: Tuple[bool, bool, bool], target_indices: tuple):
+    global _worker_state
+    target_music = target_indices[0]
+    positions = {id(t): i for i, t in enumerate(target_music)}
+    _worker_state = (LibraryComparator(*settings), target_indices, positions)
+
+
+def _match_chunk(chunk: List[Track]) -> List[Optional[Tuple[int, float, str]]]:
+    comparator, target_indices, positions = _worker_state
+    found = []
+    for source_track in chunk:
+        match = comparator._find_match(source_track, *target_indices)
+        found.append(
+            None
+            if match is None
+            else (positions[id(match.target_track)], match.confidence, match.match_type)
+        )
+    return found
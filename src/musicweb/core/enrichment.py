@@ -2,17 +2,51 @@
 Music metadata enrichment using MusicBrainz and other services.
 """
 
+import hashlib
 import json
 import re
+import shelve
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..core.models import Track
 
 
+class TokenBucket:
+    """Thread-safe token bucket allowing short bursts at a fixed average rate."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._stamp) * self.rate
+                )
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class MusicBrainzEnricher:
     """Enrich track metadata using MusicBrainz API."""
 
@@ -20,7 +54,13 @@ class MusicBrainzEnricher:
         self.base_url = "https://musicbrainz.org/ws/2"
         self.headers = {"User-Agent": user_agent, "Accept": "application/json"}
         self.rate_limit_delay = 1.2  # MusicBrainz requires 1 request per second
-        self.last_request_time = 0
+        # Shared across lookup threads; a small burst lets workers start together
+        self._bucket = TokenBucket(rate=1 / self.rate_limit_delay, burst=2)
+        # Keep-alive connections reused by every lookup thread
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("https://", adapter)
 
     def enrich_track(self, track: Track) -> Optional[Dict[str, Any]]:
         """Enrich a single track with MusicBrainz data."""
@@ -76,13 +116,7 @@ class MusicBrainzEnricher:
 
     def _respect_rate_limit(self) -> None:
         """Ensure we don't exceed MusicBrainz rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-
-        self.last_request_time = time.time()
+        self._bucket.acquire()
 
     def _search_by_isrc(self, isrc: str) -> Optional[Dict[str, Any]]:
         """Search MusicBrainz by ISRC."""
@@ -90,9 +124,7 @@ class MusicBrainzEnricher:
             url = f"{self.base_url}/recording"
             params = {"query": f"isrc:{isrc}", "fmt": "json", "limit": 1}
 
-            response = requests.get(
-                url, headers=self.headers, params=params, timeout=10
-            )
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -132,9 +164,7 @@ class MusicBrainzEnricher:
                     "limit": 5,  # Get multiple results to find best match
                 }
 
-                response = requests.get(
-                    url, headers=self.headers, params=params, timeout=10
-                )
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
 
                 data = response.json()
@@ -176,9 +206,7 @@ class MusicBrainzEnricher:
             for query in queries:
                 params = {"query": query, "fmt": "json", "limit": 3}
 
-                response = requests.get(
-                    url, headers=self.headers, params=params, timeout=10
-                )
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
 
                 data = response.json()
@@ -357,19 +385,68 @@ class MusicBrainzEnricher:
             return {}
 
 
+def lookup_fingerprint(track: Track) -> str:
+    """Stable key for a MusicBrainz lookup of (artist, title, album)."""
+
+    def norm(value: Optional[str]) -> str:
+        return unicodedata.normalize("NFKD", value or "").casefold().strip()
+
+    key = f"{norm(track.artist)}|{norm(track.title)}|{norm(track.album)}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
 class EnrichmentManager:
     """Manage enrichment from multiple sources."""
 
-    def __init__(self):
+    # Recent results kept in memory; one manager may serve every session, and
+    # the on-disk store already keeps older lookups
+    CACHE_SIZE = 2048
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
         self.musicbrainz = MusicBrainzEnricher()
-        self.cache = {}  # Simple in-memory cache
+        self.cache = OrderedDict()  # LRU of recent results
+        self._cache_lock = threading.Lock()
+        # Optional on-disk store of MusicBrainz hits, reused across runs
+        self._store = None
+        self._store_lock = threading.Lock()
+        if cache_path is not None:
+            try:
+                Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+                self._store = shelve.open(str(cache_path))
+            except Exception as e:
+                print(f"MusicBrainz cache unavailable at {cache_path}: {e}")
+
+    def _lookup_musicbrainz(self, track: Track) -> Optional[Dict[str, Any]]:
+        """MusicBrainz lookup, served from the on-disk store when seen before."""
+        if self._store is None:
+            return self.musicbrainz.enrich_track(track)
+
+        key = lookup_fingerprint(track)
+        with self._store_lock:
+            mb_data = self._store.get(key)
+        if mb_data is None:
+            mb_data = self.musicbrainz.enrich_track(track)
+            # Only hits are persisted so transient failures get retried
+            if mb_data:
+                with self._store_lock:
+                    self._store[key] = mb_data
+        return mb_data
+
+    def flush(self) -> None:
+        """Write pending on-disk cache entries."""
+        if self._store is not None:
+            with self._store_lock:
+                self._store.sync()
 
     def enrich_track(self, track: Track) -> Dict[str, Any]:
         """Enrich track from multiple sources with caching."""
         cache_key = f"{track.normalized_title}|{track.normalized_artist}"
 
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        with self._cache_lock:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.cache.move_to_end(cache_key)
+                return cached
 
         enrichment_data = {
             "original_track": track.to_dict(),
@@ -378,7 +455,7 @@ class EnrichmentManager:
         }
 
         # Try MusicBrainz
-        mb_data = self.musicbrainz.enrich_track(track)
+        mb_data = self._lookup_musicbrainz(track)
         if mb_data:
             enrichment_data["musicbrainz"] = mb_data
 
@@ -396,8 +473,11 @@ class EnrichmentManager:
                 top_tags = [tag["name"] for tag in mb_data["tags"][:3]]
                 enrichment_data["enriched_fields"]["genre"] = ", ".join(top_tags)
 
-        # Cache result
-        self.cache[cache_key] = enrichment_data
+        # Cache result, evicting the least recently used beyond CACHE_SIZE
+        with self._cache_lock:
+            self.cache[cache_key] = enrichment_data
+            if len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
         return enrichment_data
 
     def apply_enrichment(self, track: Track, enrichment_data: Dict[str, Any]) -> Track:
@@ -422,21 +502,49 @@ class EnrichmentManager:
         return enhanced_track
 
     def bulk_enrich(
-        self, tracks: List[Track], progress_callback: Optional[callable] = None
+        self,
+        tracks: List[Track],
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 1,
     ) -> List[Tuple[Track, Dict[str, Any]]]:
-        """Enrich multiple tracks and return enhanced versions."""
-        enriched_tracks = []
-
-        for i, track in enumerate(tracks):
-            if progress_callback:
-                progress_callback(i, len(tracks), f"Enriching: {track.title}")
-
-            enrichment_data = self.enrich_track(track)
-            enhanced_track = self.apply_enrichment(track, enrichment_data)
-
-            enriched_tracks.append((enhanced_track, enrichment_data))
+        """Enrich multiple tracks and return enhanced versions.
+
+        With ``max_workers > 1`` lookups run on a thread pool so network round
+        trips overlap; the MusicBrainz rate limiter still paces the requests.
+        Results keep the input order and progress is reported on the calling
+        thread.
+        """
+        total = len(tracks)
+        if max_workers <= 1:
+            enriched_tracks = []
+            for i, track in enumerate(tracks):
+                if progress_callback:
+                    progress_callback(i, total, f"Enriching: {track.title}")
+
+                enrichment_data = self.enrich_track(track)
+                enhanced_track = self.apply_enrichment(track, enrichment_data)
+
+                enriched_tracks.append((enhanced_track, enrichment_data))
+        else:
+            enriched_tracks = [None] * total
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(self.enrich_track, track): i
+                    for i, track in enumerate(tracks)
+                }
+                for done, future in enumerate(as_completed(futures)):
+                    i = futures[future]
+                    track = tracks[i]
+                    if progress_callback:
+                        progress_callback(done, total, f"Enriching: {track.title}")
+                    enrichment_data = future.result()
+                    enriched_tracks[i] = (
+                        self.apply_enrichment(track, enrichment_data),
+                        enrichment_data,
+                    )
 
+        self.flush()
         if progress_callback:
-            progress_callback(len(tracks), len(tracks), "Enrichment complete")
+            progress_callback(total, total, "Enrichment complete")
 
         return enriched_tracks
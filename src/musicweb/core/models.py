@@ -2,12 +2,15 @@
 Core data structures and matching algorithms for music library management.
 """
 
+import functools
 import hashlib
 import math
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
 
 # Optional dependencies with fallbacks
 try:
@@ -37,7 +40,7 @@ class Track:
     # Computed fields
     normalized_title: Optional[str] = None
     normalized_artist: Optional[str] = None
-    artist_tokens: Optional[Set[str]] = None
+    artist_tokens: Optional[FrozenSet[str]] = None
     is_music: Optional[bool] = None
 
     def __post_init__(self):
@@ -47,7 +50,7 @@ class Track:
         if self.normalized_artist is None:
             self.normalized_artist = TrackNormalizer.normalize_artist(self.artist)
         if self.artist_tokens is None:
-            self.artist_tokens = TrackNormalizer.extract_artist_tokens(self.artist)
+            self.artist_tokens = TrackNormalizer.interned_artist_tokens(self.artist)
         if self.is_music is None:
             self.is_music = ContentFilter.is_music_content(self.title, self.artist)
 
@@ -68,7 +71,11 @@ class Library:
         self.platform = platform
         self.tracks: List[Track] = []
         self._music_tracks: Optional[List[Track]] = None
-        self._artist_counts: Optional[Dict[str, int]] = None
+        self._artist_counts: Optional[Counter] = None
+        self._isrcs: Optional[np.ndarray] = None
+        self._durations: Optional[np.ndarray] = None
+        self._by_isrc: Optional[Dict[str, Track]] = None
+        self._by_key: Optional[Dict[Tuple[str, str], List[Track]]] = None
 
     def add_track(self, track: Track) -> None:
         """Add a track to the library."""
@@ -77,6 +84,10 @@ class Library:
         # Invalidate cached computations
         self._music_tracks = None
         self._artist_counts = None
+        self._isrcs = None
+        self._durations = None
+        self._by_isrc = None
+        self._by_key = None
 
     def add_tracks(self, tracks: List[Track]) -> None:
         """Add multiple tracks to the library."""
@@ -90,6 +101,41 @@ class Library:
             self._music_tracks = [t for t in self.tracks if t.is_music]
         return self._music_tracks
 
+    @property
+    def isrcs(self) -> np.ndarray:
+        """ISRC of each music track (object array, None/"" where missing)."""
+        if self._isrcs is None:
+            self._isrcs = np.array([t.isrc for t in self.music_tracks], dtype=object)
+        return self._isrcs
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Duration of each music track in seconds (float array, NaN where missing)."""
+        if self._durations is None:
+            self._durations = np.fromiter(
+                (t.duration or np.nan for t in self.music_tracks),
+                dtype=np.float64,
+                count=len(self.music_tracks),
+            )
+        return self._durations
+
+    @property
+    def tracks_by_isrc(self) -> Dict[str, Track]:
+        """Music tracks by lower-cased ISRC (the last track wins on duplicates)."""
+        if self._by_isrc is None:
+            self._by_isrc = {t.isrc.lower(): t for t in self.music_tracks if t.isrc}
+        return self._by_isrc
+
+    @property
+    def tracks_by_key(self) -> Dict[Tuple[str, str], List[Track]]:
+        """Music tracks grouped by (normalized_title, normalized_artist)."""
+        if self._by_key is None:
+            self._by_key = defaultdict(list)
+            for t in self.music_tracks:
+                self._by_key[(t.normalized_title, t.normalized_artist)].append(t)
+            self._by_key = dict(self._by_key)
+        return self._by_key
+
     @property
     def total_tracks(self) -> int:
         """Total number of tracks in library."""
@@ -108,16 +154,20 @@ class Library:
     @property
     def artist_counts(self) -> Dict[str, int]:
         """Count tracks by artist."""
-        if self._artist_counts is None:
-            self._artist_counts = defaultdict(int)
-            for track in self.music_tracks:
-                self._artist_counts[track.normalized_artist] += 1
-        return dict(self._artist_counts)
+        return dict(self._artist_counter())
 
     @property
     def top_artists(self) -> List[Tuple[str, int]]:
         """Get top artists by track count."""
-        return sorted(self.artist_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        return self._artist_counter().most_common(10)
+
+    def _artist_counter(self) -> Counter:
+        """Cached per-artist music track counts, keyed by normalized artist."""
+        if self._artist_counts is None:
+            self._artist_counts = Counter(
+                t.normalized_artist for t in self.music_tracks
+            )
+        return self._artist_counts
 
     def get_stats(self) -> Dict[str, Any]:
         """Get library statistics."""
@@ -131,6 +181,35 @@ class Library:
             "top_artists": self.top_artists[:5],
         }
 
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get library statistics, including per-artist and duration figures."""
+        known = self.durations[~np.isnan(self.durations)]
+        if known.size:
+            duration_stats = {
+                "count": int(known.size),
+                "total": float(known.sum()),
+                "mean": float(known.mean()),
+                "std": float(known.std()),
+                "min": float(known.min()),
+                "max": float(known.max()),
+            }
+        else:
+            duration_stats = {
+                "count": 0,
+                "total": 0.0,
+                "mean": 0.0,
+                "std": 0.0,
+                "min": 0.0,
+                "max": 0.0,
+            }
+
+        return {
+            **self.get_stats(),
+            "music_count": self.music_count,
+            "artist_counts": self.artist_counts,
+            "duration_stats": duration_stats,
+        }
+
 
 class TrackNormalizer:
     """Utilities for normalizing track metadata for comparison."""
@@ -157,40 +236,52 @@ class TrackNormalizer:
         r"\([^)]*[Ee]xtended[^)]*\)",
     ]
 
+    # Compiled once at class creation; the normalizers run for every track
+    _FEATURING_RES = [re.compile(p, re.IGNORECASE) for p in FEATURING_PATTERNS]
+    _VERSION_RES = [re.compile(p, re.IGNORECASE) for p in VERSION_PATTERNS]
+    _WS_RE = re.compile(r"\s+")
+    _PARENS_RE = re.compile(r"\([^)]*\)")
+    _BRACKETS_RE = re.compile(r"\[[^\]]*\]")
+    _LEADING_THE_RE = re.compile(r"^(the\s+)")
+    _TRAILING_THE_RE = re.compile(r"\s+(the)$")
+    _PUNCT_RE = re.compile(r"[^\w\s]")
+    _ARTIST_SUFFIX_RE = re.compile(r"\s+(jr\.?|sr\.?|iii?|iv)$", re.IGNORECASE)
+
     @staticmethod
     def normalize_title(title: str) -> str:
         """Normalize track title for comparison."""
         if not title:
             return ""
 
+        ws = TrackNormalizer._WS_RE
+
         # Basic cleaning
         normalized = title.strip().lower()
 
         # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = ws.sub(" ", normalized)
 
         # Preserve version info but remove other parentheses
         versions = []
-        for pattern in TrackNormalizer.VERSION_PATTERNS:
-            matches = re.findall(pattern, normalized, re.IGNORECASE)
-            versions.extend(matches)
-            normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+        for pattern in TrackNormalizer._VERSION_RES:
+            versions.extend(pattern.findall(normalized))
+            normalized = pattern.sub("", normalized)
 
         # Remove other parentheses content
-        normalized = re.sub(r"\([^)]*\)", "", normalized)
-        normalized = re.sub(r"\[[^\]]*\]", "", normalized)
+        normalized = TrackNormalizer._PARENS_RE.sub("", normalized)
+        normalized = TrackNormalizer._BRACKETS_RE.sub("", normalized)
 
         # Add back version info
         if versions:
             normalized += " " + " ".join(versions)
 
         # Remove common prefixes/suffixes
-        normalized = re.sub(r"^(the\s+)", "", normalized)
-        normalized = re.sub(r"\s+(the)$", "", normalized)
+        normalized = TrackNormalizer._LEADING_THE_RE.sub("", normalized)
+        normalized = TrackNormalizer._TRAILING_THE_RE.sub("", normalized)
 
         # Remove punctuation
-        normalized = re.sub(r"[^\w\s]", " ", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = TrackNormalizer._PUNCT_RE.sub(" ", normalized)
+        normalized = ws.sub(" ", normalized).strip()
 
         return normalized
 
@@ -203,16 +294,14 @@ class TrackNormalizer:
         normalized = artist.strip().lower()
 
         # Remove featuring artists
-        for pattern in TrackNormalizer.FEATURING_PATTERNS:
-            normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+        for pattern in TrackNormalizer._FEATURING_RES:
+            normalized = pattern.sub("", normalized)
 
         # Remove common suffixes
-        normalized = re.sub(
-            r"\s+(jr\.?|sr\.?|iii?|iv)$", "", normalized, flags=re.IGNORECASE
-        )
+        normalized = TrackNormalizer._ARTIST_SUFFIX_RE.sub("", normalized)
 
         # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = TrackNormalizer._WS_RE.sub(" ", normalized).strip()
 
         return normalized
 
@@ -246,9 +335,27 @@ class TrackNormalizer:
 
         return clean_tokens
 
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def interned_artist_tokens(artist: str) -> FrozenSet[str]:
+        """Immutable `extract_artist_tokens`, shared by tracks of one artist."""
+        return frozenset(TrackNormalizer.extract_artist_tokens(artist))
+
     @staticmethod
     def parse_duration(duration_str: str) -> Optional[int]:
         """Parse duration string to seconds."""
+        if isinstance(duration_str, str):
+            # Imports repeat the same few duration strings many times over
+            return TrackNormalizer._parse_duration_str(duration_str)
+        return TrackNormalizer._parse_duration(duration_str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_duration_str(duration_str: str) -> Optional[int]:
+        return TrackNormalizer._parse_duration(duration_str)
+
+    @staticmethod
+    def _parse_duration(duration_str: Any) -> Optional[int]:
         if not duration_str:
             return None
 
@@ -488,8 +595,14 @@ class TrackMatcher:
         # If no word matches, limit search for performance
         return all_candidates[: min(50, len(all_candidates))]
 
-    def calculate_match_confidence(self, track1: Track, track2: Track) -> float:
-        """Calculate overall match confidence between two tracks."""
+    def calculate_match_confidence(
+        self, track1: Track, track2: Track, title_score: Optional[float] = None
+    ) -> float:
+        """Calculate overall match confidence between two tracks.
+
+        `title_score` may carry a title similarity already computed in bulk
+        by `_title_similarities`.
+        """
 
         # ISRC exact match - instant 100% confidence
         if (
@@ -502,9 +615,10 @@ class TrackMatcher:
         scores = {}
 
         # Title similarity (45% weight)
-        title_score = self._calculate_title_similarity(
-            track1.normalized_title, track2.normalized_title
-        )
+        if title_score is None:
+            title_score = self._calculate_title_similarity(
+                track1.normalized_title, track2.normalized_title
+            )
         scores["title"] = (title_score, 0.45)
 
         # Artist similarity (35% weight)
@@ -536,6 +650,46 @@ class TrackMatcher:
 
         return total_score / total_weight if total_weight > 0 else 0.0
 
+    def _title_similarities(self, title: str, others: List[str]) -> List[float]:
+        """`_calculate_title_similarity` of `title` against each of `others`.
+
+        Scores every pair with one rapidfuzz `cdist` call per scorer instead
+        of three Python-level calls per pair; values are identical.
+        """
+        if not HAVE_RAPIDFUZZ or not title or not others:
+            return [self._calculate_title_similarity(title, o) for o in others]
+
+        def scores(scorer) -> np.ndarray:
+            return (
+                process.cdist([title], others, scorer=scorer, dtype=np.float64)[0]
+                / 100.0
+            )
+
+        combined = (
+            scores(fuzz.token_set_ratio) * 0.4
+            + scores(fuzz.token_sort_ratio) * 0.4
+            + scores(fuzz.partial_ratio) * 0.2
+        )
+
+        # Same dynamic thresholds as _calculate_title_similarity
+        words = len(title.split())
+        word_count = np.fromiter(
+            (max(words, len(o.split())) for o in others),
+            dtype=np.int64,
+            count=len(others),
+        )
+        if self.strict_mode:
+            threshold = np.where(word_count < 3, 0.96, 0.92)
+        else:
+            threshold = np.where(word_count < 3, 0.92, 0.85)
+        boosted = np.where(
+            combined >= threshold, np.minimum(1.0, combined * 1.02), combined
+        )
+
+        # Empty titles score 0.0, as in _calculate_title_similarity
+        empty = np.fromiter((not o for o in others), dtype=bool, count=len(others))
+        return np.where(empty, 0.0, boosted).tolist()
+
     def _calculate_title_similarity(self, title1: str, title2: str) -> float:
         """Calculate title similarity with dynamic thresholds."""
         if not title1 or not title2:
@@ -579,14 +733,15 @@ class TrackMatcher:
                 track1.normalized_artist, track2.normalized_artist
             )
 
-        # Jaccard similarity (intersection over union)
-        intersection = tokens1.intersection(tokens2)
-        union = tokens1.union(tokens2)
-        jaccard = len(intersection) / len(union) if union else 0.0
+        # Jaccard similarity (intersection over union); only the one set
+        # operation is needed, the union size follows from inclusion-exclusion
+        shared = len(tokens1 & tokens2)
+        union = len(tokens1) + len(tokens2) - shared
+        jaccard = shared / union if union else 0.0
 
         # Check for subset relationships (bonus scoring)
         containment = 0.0
-        if tokens1.issubset(tokens2) or tokens2.issubset(tokens1):
+        if shared == len(tokens1) or shared == len(tokens2):
             containment = 0.3
 
         # Combined score
@@ -640,14 +795,35 @@ class TrackMatcher:
         # Get optimized subset of candidates
         candidates_to_check = self._get_candidate_subset(target_track, candidate_tracks)
 
+        candidates_to_check = [c for c in candidates_to_check if c.is_music]
+        title_scores = self._title_similarities(
+            target_track.normalized_title,
+            [c.normalized_title for c in candidates_to_check],
+        )
+
+        # Require a minimum confidence that varies with strictness
+        min_conf = 0.80 if self.strict_mode else 0.72
+
+        # With artist, album and duration all perfect, confidence is at most
+        # (0.45 * title + 0.5) / 0.95; lower titles can never reach min_conf
+        min_title = (min_conf * 0.95 - 0.5) / 0.45 - 1e-9
+        target_isrc = (target_track.isrc or "").strip().lower()
+
         best_match = None
         best_confidence = 0.0
 
-        for candidate in candidates_to_check:
-            if not candidate.is_music:  # Skip non-music content
+        for candidate, title_score in zip(candidates_to_check, title_scores):
+            # ISRC matches score 1.0 regardless of title, so never skip them
+            if title_score < min_title and not (
+                target_isrc
+                and candidate.isrc
+                and candidate.isrc.strip().lower() == target_isrc
+            ):
                 continue
 
-            confidence = self.calculate_match_confidence(target_track, candidate)
+            confidence = self.calculate_match_confidence(
+                target_track, candidate, title_score
+            )
 
             if confidence > best_confidence:
                 best_match = candidate
@@ -657,8 +833,6 @@ class TrackMatcher:
                 if confidence >= 0.98:
                     break
 
-        # Require a minimum confidence that varies with strictness
-        min_conf = 0.80 if self.strict_mode else 0.72
         return (
             (best_match, best_confidence)
             if best_match and best_confidence >= min_conf
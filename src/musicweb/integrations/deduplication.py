@@ -8,18 +8,30 @@ and optionally create a playlist containing the duplicates.
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 try:
     from ytmusicapi import YTMusic  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     YTMusic = None  # type: ignore
 
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
+    HAVE_RAPIDFUZZ = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAVE_RAPIDFUZZ = False
+
+# Rows of the candidate score matrix computed per rapidfuzz batch
+_CANDIDATE_BLOCK = 256
+
 
 @dataclass
 class RankedDuplicate:
@@ -94,19 +106,36 @@ class YouTubeMusicDeduplicator:
         return SequenceMatcher(None, cls._normalize(a), cls._normalize(b)).ratio()
 
     def find_duplicates(
-        self, similarity_threshold: float = 0.85
+        self,
+        similarity_threshold: float = 0.85,
+        songs: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """Group likely duplicates using title+artist similarity.
 
-        Returns a list of groups with ranked duplicate entries.
+        Scans `songs` when given, otherwise the songs cached by the last
+        `get_library_songs` call. Returns a list of groups with ranked
+        duplicate entries.
         """
-        if not self.library_songs:
+        library_songs = self.library_songs if songs is None else songs
+        if not library_songs:
             return []
 
         groups: List[Dict[str, Any]] = []
         processed: set[int] = set()
 
-        for i, song1 in enumerate(self.library_songs):
+        titles = [self._normalize(s.get("title", "")) for s in library_songs]
+        artists = [
+            self._normalize(a[0].get("name", "") if a else "")
+            for a in (s.get("artists", []) for s in library_songs)
+        ]
+        candidates = self._candidates(titles, artists, similarity_threshold)
+
+        @functools.lru_cache(maxsize=None)
+        def ratio(a: str, b: str) -> float:
+            # Repeated titles/artists make many comparisons recur verbatim
+            return 1.0 if a == b else SequenceMatcher(None, a, b).ratio()
+
+        for i, (song1, others) in enumerate(zip(library_songs, candidates)):
             if i in processed:
                 continue
 
@@ -120,18 +149,16 @@ class YouTubeMusicDeduplicator:
             rep_title_sim = 1.0
             rep_artist_sim = 1.0
 
-            for j, song2 in enumerate(self.library_songs[i + 1 :], i + 1):
+            for j in others:
                 if j in processed:
                     continue
 
-                title2 = song2.get("title", "")
-                artists2 = [a.get("name", "") for a in song2.get("artists", [])]
-                artist2 = artists2[0] if artists2 else ""
-
-                t_sim = self._similarity(title1, title2)
-                a_sim = self._similarity(artist1, artist2)
-                if t_sim >= similarity_threshold and a_sim >= similarity_threshold:
-                    current_group.append(song2)
+                t_sim = ratio(titles[i], titles[j])
+                if t_sim < similarity_threshold:
+                    continue
+                a_sim = ratio(artists[i], artists[j])
+                if a_sim >= similarity_threshold:
+                    current_group.append(library_songs[j])
                     idx_group.add(j)
                     rep_title_sim = min(rep_title_sim, t_sim)
                     rep_artist_sim = min(rep_artist_sim, a_sim)
@@ -155,6 +182,48 @@ class YouTubeMusicDeduplicator:
         self.duplicate_groups = groups
         return groups
 
+    @staticmethod
+    def _candidates(
+        titles: Sequence[str], artists: Sequence[str], threshold: float
+    ) -> Iterator[Sequence[int]]:
+        """Yield, for each song i, the indices j > i worth comparing with it.
+
+        rapidfuzz's `fuzz.ratio` (LCS based) is never below difflib's ratio,
+        so pairs it scores under the threshold cannot match and are skipped
+        without running SequenceMatcher. Results are unchanged.
+        """
+        n = len(titles)
+        if not HAVE_RAPIDFUZZ or threshold <= 0:
+            for i in range(n):
+                yield range(i + 1, n)
+            return
+
+        # Small slack so float rounding never drops a borderline pair
+        cutoff = threshold * 100 - 1e-6
+
+        # Score each distinct string once and expand to song indices;
+        # libraries repeat artists (and often titles) heavily.
+        title_keys = np.unique(np.asarray(titles, dtype=object), return_inverse=True)
+        artist_keys = np.unique(np.asarray(artists, dtype=object), return_inverse=True)
+
+        def block_hits(keys: Tuple["np.ndarray", "np.ndarray"], rows: slice):
+            uniq, inverse = keys
+            row_keys, row_inverse = np.unique(inverse[rows], return_inverse=True)
+            scores = process.cdist(
+                uniq[row_keys].tolist(),
+                uniq.tolist(),
+                scorer=fuzz.ratio,
+                score_cutoff=cutoff,
+                workers=-1,
+            )
+            return (scores > 0)[row_inverse][:, inverse]
+
+        for start in range(0, n, _CANDIDATE_BLOCK):
+            rows = slice(start, min(start + _CANDIDATE_BLOCK, n))
+            hits = block_hits(title_keys, rows) & block_hits(artist_keys, rows)
+            for i in range(rows.start, rows.stop):
+                yield (np.flatnonzero(hits[i - start, i + 1 :]) + i + 1).tolist()
+
     def _rank_duplicates(
         self, duplicates: List[Dict[str, Any]]
     ) -> List[RankedDuplicate]:
@@ -213,9 +213,15 @@ class PlaylistManager:
     def _add_tracks_to_playlist(
         self, playlist_id: str, tracks: List[Track], search_fallback: bool
     ) -> Dict[str, List]:
-        """Add a batch of tracks to a playlist."""
+        """Add a batch of tracks to a playlist.
+
+        Tracks are matched one search at a time, then every matched video is
+        added with a single request. If that request is rejected, the videos
+        are retried one by one so failures are attributed to their tracks.
+        """
         added_tracks = []
         failed_tracks = []
+        matched = []
 
         for track in tracks:
             try:
@@ -226,36 +232,7 @@ class PlaylistManager:
                     video_id = match["youtube_track"].get("videoId")
 
                     if video_id:
-                        # Add to playlist with error handling
-                        try:
-                            result = self.ytmusic.add_playlist_items(
-                                playlist_id, [video_id]
-                            )
-                            if result:  # Check if addition was successful
-                                added_tracks.append(
-                                    {
-                                        "original_track": track.to_dict(),
-                                        "youtube_match": match,
-                                        "confidence": match["confidence"],
-                                    }
-                                )
-                            else:
-                                failed_tracks.append(
-                                    {
-                                        "track": track.to_dict(),
-                                        "reason": "Failed to add to playlist",
-                                    }
-                                )
-                        except Exception as add_error:
-                            error_msg = str(add_error)
-                            if "Expecting value" in error_msg:
-                                error_msg = f"YouTube Music API returned invalid response (possible rate limit or authentication issue): {error_msg}"
-                            failed_tracks.append(
-                                {
-                                    "track": track.to_dict(),
-                                    "reason": f"Add to playlist error: {error_msg}",
-                                }
-                            )
+                        matched.append((track, match, video_id))
                     else:
                         failed_tracks.append(
                             {"track": track.to_dict(), "reason": "No video ID found"}
@@ -271,8 +248,63 @@ class PlaylistManager:
             except Exception as e:
                 failed_tracks.append({"track": track.to_dict(), "reason": str(e)})
 
+        if not matched:
+            return {"added": added_tracks, "failed": failed_tracks}
+
+        try:
+            result = self.ytmusic.add_playlist_items(
+                playlist_id, [video_id for _, _, video_id in matched]
+            )
+        except Exception:
+            result = None
+
+        if self._add_succeeded(result):
+            added_tracks.extend(
+                self._added_entry(track, match) for track, match, _ in matched
+            )
+            return {"added": added_tracks, "failed": failed_tracks}
+
+        for track, match, video_id in matched:
+            # Add to playlist with error handling
+            try:
+                result = self.ytmusic.add_playlist_items(playlist_id, [video_id])
+                if self._add_succeeded(result):
+                    added_tracks.append(self._added_entry(track, match))
+                else:
+                    failed_tracks.append(
+                        {
+                            "track": track.to_dict(),
+                            "reason": "Failed to add to playlist",
+                        }
+                    )
+            except Exception as add_error:
+                error_msg = str(add_error)
+                if "Expecting value" in error_msg:
+                    error_msg = f"YouTube Music API returned invalid response (possible rate limit or authentication issue): {error_msg}"
+                failed_tracks.append(
+                    {
+                        "track": track.to_dict(),
+                        "reason": f"Add to playlist error: {error_msg}",
+                    }
+                )
+
         return {"added": added_tracks, "failed": failed_tracks}
 
+    @staticmethod
+    def _add_succeeded(result: Any) -> bool:
+        """Whether an `add_playlist_items` response reports success."""
+        if isinstance(result, dict) and "status" in result:
+            return "SUCCEEDED" in str(result["status"])
+        return bool(result)
+
+    @staticmethod
+    def _added_entry(track: Track, match: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "original_track": track.to_dict(),
+            "youtube_match": match,
+            "confidence": match["confidence"],
+        }
+
     def _youtube_result_to_track(self, result: Dict[str, Any]) -> Optional[Track]:
         """Convert YouTube search result to Track object."""
         try:
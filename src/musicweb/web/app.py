@@ -6,19 +6,38 @@ A comprehensive web interface for comparing and managing music libraries
 across multiple streaming platforms.
 """
 
+import codecs
+import dataclasses
+import functools
+import hashlib
+import importlib.util
+import inspect
 import io
+import itertools
 import json
+import math
+import operator
+import pickle
+import queue
+import re
+import shutil
 import sqlite3
 
 # Handle imports for deployment environments
 import sys
 import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from string import Template
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Add src directory to path for Streamlit Cloud deployment
 try:
@@ -73,32 +92,101 @@ try:
     from musicweb.integrations.cleaner import YTMusicCleaner
 except Exception:
     YTMusicCleaner = None
-from musicweb.web.playlist_audit import audit_playlist, parse_playlist_bytes
+from musicweb.web.playlist_audit import (
+    audit_playlist,
+    build_indices,
+    parse_playlist_bytes,
+)
+
+_HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_EXPORT_FORMATS = {"CSV": ("csv", "text/csv")}
+if _HAVE_PYARROW:
+    _EXPORT_FORMATS["Parquet"] = ("parquet", "application/vnd.apache.parquet")
+    _EXPORT_FORMATS["Feather"] = ("feather", "application/vnd.apache.arrow.file")
+
+# Probed once; image/checkbox columns need a Streamlit with st.column_config
+_HAS_COLUMN_CONFIG = hasattr(st, "column_config") and hasattr(
+    st.column_config, "ImageColumn"
+)
+if _HAS_COLUMN_CONFIG:
+    _MATCHES_COLUMN_CONFIG = {
+        "Source Thumb": st.column_config.ImageColumn("Src", width="small"),
+        "Target Thumb": st.column_config.ImageColumn("Dst", width="small"),
+        "Source Explicit": st.column_config.CheckboxColumn("Src Explicit"),
+        "Target Explicit": st.column_config.CheckboxColumn("Dst Explicit"),
+    }
+    _MISSING_COLUMN_CONFIG = {
+        "Thumb": st.column_config.ImageColumn("Thumb", width="small"),
+        "Explicit": st.column_config.CheckboxColumn("Explicit"),
+    }
+
+
+def _download_accepts_callable() -> bool:
+    """Whether this Streamlit's download_button takes a callable for `data`."""
+    func = inspect.unwrap(st.download_button)
+    try:
+        annotation = inspect.signature(func).parameters["data"].annotation
+    except (KeyError, TypeError, ValueError):
+        return False
+    if isinstance(annotation, str):
+        # Postponed annotations name a type alias defined next to the widget
+        module = sys.modules.get(getattr(func, "__module__", ""), None)
+        annotation = getattr(module, annotation, annotation)
+    return "Callable" in str(annotation)
+
+
+# Streamlit builds that accept a callable for download_button data only run it
+# when the button is clicked, sparing the serialization on ordinary reruns.
+# The docstring cannot be probed: it mentioned "callable" (for on_click) long
+# before callable data was supported.
+_DEFERRED_DOWNLOADS = _download_accepts_callable()
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
+HAVE_VISUALIZATION = importlib.util.find_spec("plotly") is not None
 
-HAVE_VISUALIZATION = True  # Assume we have it, import on demand
+# Imported lazily on first chart render; reruns reuse the cached modules
+_VIZ_MODULES: Dict[str, Any] = {}
 
 
 def get_visualization_modules():
     """Lazy load visualization modules when needed."""
-    try:
-        import matplotlib.pyplot as plt
-        import plotly.express as px
-        import plotly.graph_objects as go
-        from matplotlib_venn import venn2, venn3
+    if not _VIZ_MODULES:
+        try:
+            import plotly.express as px
+            import plotly.graph_objects as go
+        except ImportError:
+            global HAVE_VISUALIZATION
+            HAVE_VISUALIZATION = False
+            st.error("Visualization libraries not available")
+            return None, None, None, None, None
+
+        # matplotlib/venn are only needed for Venn diagrams; keep them optional
+        try:
+            import matplotlib.pyplot as plt
+            from matplotlib_venn import venn2, venn3
+        except ImportError:
+            plt = venn2 = venn3 = None
+
+        _VIZ_MODULES.update(plt=plt, px=px, go=go, venn2=venn2, venn3=venn3)
 
-        return plt, px, go, venn2, venn3
-    except ImportError:
-        global HAVE_VISUALIZATION
-        HAVE_VISUALIZATION = False
-        st.error("Visualization libraries not available")
-        return None, None, None, None, None
+    m = _VIZ_MODULES
+    return m["plt"], m["px"], m["go"], m["venn2"], m["venn3"]
 
 
 import base64
 
 
-def get_logo_base64(dark_mode=False):
-    """Get the logo as base64 encoded string with dark mode support."""
+@functools.lru_cache(maxsize=1)
+def _logo_base64() -> str:
+    """The logo PNG, base64 encoded; read and encoded once per process."""
     try:
         # Use importlib.resources for proper package resource access
         try:
@@ -110,32 +198,31 @@ def get_logo_base64(dark_mode=False):
         # Access logo from package resources
         package_files = files("musicweb.web.assets")
         logo_data = (package_files / "mwlogo.png").read_bytes()
-        logo_base64 = base64.b64encode(logo_data).decode()
-
-        # Apply CSS filter for dark mode
-        if dark_mode:
-            return logo_base64, "filter: invert(1) hue-rotate(180deg) brightness(1.2);"
-        else:
-            return logo_base64, "filter: none;"
+        return base64.b64encode(logo_data).decode()
 
     except Exception:
         # Fallback to direct file access if importlib.resources fails
         try:
             logo_path = Path(__file__).parent / "assets" / "mwlogo.png"
             with open(logo_path, "rb") as f:
-                logo_base64 = base64.b64encode(f.read()).decode()
-
-            if dark_mode:
-                return (
-                    logo_base64,
-                    "filter: invert(1) hue-rotate(180deg) brightness(1.2);",
-                )
-            else:
-                return logo_base64, "filter: none;"
+                return base64.b64encode(f.read()).decode()
 
         except Exception:
             # Final fallback if logo file not found
-            return "", ""
+            return ""
+
+
+def get_logo_base64(dark_mode=False):
+    """Get the logo as base64 encoded string with dark mode support."""
+    logo_base64 = _logo_base64()
+    if not logo_base64:
+        return "", ""
+
+    # Apply CSS filter for dark mode
+    if dark_mode:
+        return logo_base64, "filter: invert(1) hue-rotate(180deg) brightness(1.2);"
+    else:
+        return logo_base64, "filter: none;"
 
 
 def detect_dark_mode():
@@ -786,15 +873,22 @@ h2 {
 
 # Helpers for thumbnails and explicit flags
 def _yt_thumb_from_track(track: Track) -> Optional[str]:
+    return _thumb_cached(
+        getattr(track, "platform", ""),
+        getattr(track, "track_id", None),
+        getattr(track, "url", "") or "",
+    )
+
+
+@functools.lru_cache(maxsize=100_000)
+def _thumb_cached(platform: str, track_id: Optional[str], url: str) -> Optional[str]:
     try:
         # Only attempt for YouTube Music
-        if getattr(track, "platform", "") != "youtube_music":
+        if platform != "youtube_music":
             return None
-        vid = getattr(track, "track_id", None)
-        if not vid:
-            url = getattr(track, "url", "") or ""
-            if "watch?v=" in url:
-                vid = url.split("watch?v=")[1].split("&")[0]
+        vid = track_id
+        if not vid and "watch?v=" in url:
+            vid = url.split("watch?v=")[1].split("&")[0]
         if vid:
             return f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg"
     except Exception:
@@ -802,19 +896,133 @@ def _yt_thumb_from_track(track: Track) -> Optional[str]:
     return None
 
 
+def _yt_thumbs_bulk(tracks_df: pd.DataFrame) -> pd.Series:
+    """Vectorized `_yt_thumb_from_track` over a frame of track rows.
+
+    Expects `platform`, `track_id` and `url` columns; returns "" for rows
+    without a resolvable YouTube video id.
+    """
+    vid = tracks_df["track_id"].fillna("").astype(str)
+    from_url = (
+        tracks_df["url"]
+        .fillna("")
+        .astype(str)
+        .str.extract(r"watch\?v=([^&]+)", expand=False)
+        .fillna("")
+    )
+    vid = vid.where(vid != "", from_url)
+    thumbs = "https://i.ytimg.com/vi/" + vid + "/hqdefault.jpg"
+    mask = tracks_df["platform"].eq("youtube_music") & (vid != "")
+    return thumbs.where(mask, "")
+
+
+def _track_link_frame(tracks: List[Track]) -> pd.DataFrame:
+    """Columns consumed by `_yt_thumbs_bulk` for a list of tracks."""
+    return pd.DataFrame(
+        {
+            "platform": [t.platform for t in tracks],
+            "track_id": [t.track_id for t in tracks],
+            "url": [t.url for t in tracks],
+        }
+    )
+
+
 def _explicit_hint_from_title(title: str) -> bool:
     try:
-        return "explicit" in (title or "").lower()
+        return _explicit_cached(title or "")
     except Exception:
         return False
 
 
+_EXPLICIT_RE = re.compile(r"explicit", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _explicit_cached(title: str) -> bool:
+    return _EXPLICIT_RE.search(title) is not None
+
+
+# Pre-parsed HTML for the gradient cards and notices used across tabs
+_CARD_TEMPLATES = {
+    "metric": Template(
+        '<div style="flex: 1; min-width: 150px; background: linear-gradient(135deg, $start 0%, $end 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">'
+        '<div style="font-size: $icon_size; margin-bottom: 0.5rem;">$icon</div>'
+        '<div style="font-size: $value_size; font-weight: bold;">$value</div>'
+        '<div style="font-size: 0.9rem; opacity: 0.9;">$label</div>'
+        "</div>"
+    ),
+    "warning": Template(
+        '<div style="background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); padding: 2rem; border-radius: 12px; text-align: center; border-left: 4px solid #ffc107;">'
+        '<h4 style="color: #856404; margin-bottom: 1rem;">$title</h4>'
+        '<p style="color: #856404; margin-bottom: 1rem;">$message</p>'
+        '<p style="color: #856404; margin: 0; font-size: 0.9rem;">$hint</p>'
+        "</div>"
+    ),
+    "success": Template(
+        '<div style="background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%); padding: 1.5rem; border-radius: 12px; border-left: 4px solid #28a745; margin: 1rem 0;">'
+        '<h4 style="color: #155724; margin: 0;">$title</h4>'
+        '<p style="color: #155724; margin: 0.5rem 0 0 0;">$message</p>'
+        "</div>"
+    ),
+}
+
+
+def _render_html(html: str) -> None:
+    """Emit raw HTML, skipping the markdown parser where Streamlit allows."""
+    if hasattr(st, "html"):
+        st.html(html)
+    else:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+def render_card(kind: str, **fields: str) -> None:
+    """Render one of the `_CARD_TEMPLATES` notices."""
+    _render_html(_CARD_TEMPLATES[kind].substitute(fields))
+
+
+def render_metric_band(
+    cards: List[Tuple[str, str, str, str, str]], compact: bool = False
+) -> None:
+    """Render `(start, end, icon, value, label)` metric cards in one flex row."""
+    icon_size, value_size = ("1.5rem", "1.8rem") if compact else ("2rem", "2rem")
+    template = _CARD_TEMPLATES["metric"]
+    _render_html(
+        '<div style="display: flex; gap: 1rem; flex-wrap: wrap; margin-bottom: 1rem;">'
+        + "".join(
+            template.substitute(
+                start=start,
+                end=end,
+                icon=icon,
+                value=value,
+                label=label,
+                icon_size=icon_size,
+                value_size=value_size,
+            )
+            for start, end, icon, value, label in cards
+        )
+        + "</div>"
+    )
+
+
+# Persistent MusicBrainz lookup cache shared by every session of this process
+_MB_CACHE_PATH = Path.home() / ".musicweb" / "mb_cache"
+
+
+@st.cache_resource
+def _get_enrichment_manager():
+    """Process-wide EnrichmentManager backed by the on-disk lookup cache."""
+    return EnrichmentManager(cache_path=_MB_CACHE_PATH)
+
+
 class SessionManager:
     """Manage session state for the web interface."""
 
     @staticmethod
     def initialize_session():
         """Initialize session state variables."""
+        # Numbers script runs so helpers can do per-run work once
+        st.session_state.run_id = st.session_state.get("run_id", 0) + 1
+
         if "libraries" not in st.session_state:
             st.session_state.libraries = {}
 
@@ -827,6 +1035,9 @@ class SessionManager:
         if "enrichment_data" not in st.session_state:
             st.session_state.enrichment_data = {}
 
+        if "playlist_audit_results" not in st.session_state:
+            st.session_state.playlist_audit_results = None
+
         if "ytm_dedup" not in st.session_state:
             st.session_state.ytm_dedup = None
         if "ytm_dedup_results" not in st.session_state:
@@ -836,10 +1047,24 @@ class SessionManager:
         if "ytm_dedup_selected_group_ids" not in st.session_state:
             st.session_state.ytm_dedup_selected_group_ids = []
 
+        # Enrichment shares one manager so its on-disk lookup cache is reused
+        if "enrichment_manager" not in st.session_state:
+            st.session_state.enrichment_manager = (
+                _get_enrichment_manager() if EnrichmentManager is not None else None
+            )
+
+        # Background comparison: single worker so runs never overlap
+        if "compare_executor" not in st.session_state:
+            st.session_state.compare_executor = ThreadPoolExecutor(max_workers=1)
+        if "compare_job" not in st.session_state:
+            st.session_state.compare_job = None
+
     @staticmethod
     def add_library(name: str, library: Library):
         """Add library to session state."""
         st.session_state.libraries[name] = library
+        # Results cached against a previous library of this name go stale
+        _refresh_cache_token(f"library_{name}")
 
     @staticmethod
     def get_library(name: str) -> Optional[Library]:
@@ -874,22 +1099,33 @@ def render_header():
                         background: linear-gradient(45deg, #667eea, #764ba2); 
                         margin: 1rem auto; border-radius: 2px;"></div>
         </div>
-        """.format(
-            logo_base64=get_logo_base64()[0] if get_logo_base64()[0] else ""
-        ),
+        """.format(logo_base64=get_logo_base64()[0] or ""),
         unsafe_allow_html=True,
     )
 
 
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _get_playlist_manager(headers_hash: str, _headers_path: str):
+    """Shared PlaylistManager per headers file content.
+
+    Keyed on the content hash only, so sessions uploading the same headers
+    reuse one authenticated YouTube Music client. A manager that failed to
+    connect raises instead, so it is not cached and the next setup retries.
+    """
+    manager = PlaylistManager(_headers_path)
+    if not manager.is_available():
+        raise ConnectionError("Failed to connect to YouTube Music")
+    return manager
+
+
 def render_sidebar():
     """Render the sidebar with file uploads and library management."""
     # Small adaptive logo in sidebar
-    logo_data = get_logo_base64()
-    if logo_data[0]:
+    if logo_b64 := get_logo_base64()[0]:
         st.sidebar.markdown(
             f"""
         <div style="text-align: center; padding: 0.5rem 0;">
-            <img src="data:image/png;base64,{logo_data[0]}" 
+            <img src="data:image/png;base64,{logo_b64}" 
                  class="logo-adaptive" 
                  style="width: 50px; height: 50px; opacity: 0.9; transition: filter 0.3s ease;" 
                  alt="a mega music comparator"/>
@@ -950,11 +1186,10 @@ def render_sidebar():
                             progress_bar.empty()
 
     # Existing libraries
-    libraries = SessionManager.list_libraries()
-    if libraries:
+    libs = st.session_state.libraries
+    if libs:
         st.sidebar.header("♪ Loaded Libraries")
-        for lib_name in libraries:
-            library = SessionManager.get_library(lib_name)
+        for lib_name, library in list(libs.items()):
             with st.sidebar.expander(f"♫ {lib_name}", expanded=False):
                 st.write(f"**Platform:** {library.platform}")
                 st.write(f"**Total tracks:** {library.total_tracks:,}")
@@ -963,7 +1198,7 @@ def render_sidebar():
                 st.write(f"**Artists:** {len(library.artist_counts):,}")
 
                 if st.button(f"Remove {lib_name}", key=f"remove_{lib_name}"):
-                    del st.session_state.libraries[lib_name]
+                    del libs[lib_name]
                     st.rerun()
 
     # YouTube Music setup
@@ -981,40 +1216,58 @@ def render_sidebar():
 
             if tmp_path:
                 try:
-                    playlist_manager = PlaylistManager(tmp_path)
-                    if playlist_manager.is_available():
-                        st.session_state.playlist_manager = playlist_manager
-                        st.session_state.ytm_headers_path = tmp_path
-                        st.sidebar.success("● YouTube Music connected")
-
-                        # Show format info if conversion occurred
-                        if not headers_file.name.endswith(".json"):
-                            st.sidebar.info("▣ Raw headers converted to JSON format")
-                    else:
-                        st.sidebar.error("✖ Failed to connect to YouTube Music")
+                    headers_hash = hashlib.blake2b(
+                        Path(tmp_path).read_bytes()
+                    ).hexdigest()
+                    playlist_manager = _get_playlist_manager(headers_hash, tmp_path)
+                    st.session_state.playlist_manager = playlist_manager
+                    st.session_state.ytm_headers_path = tmp_path
+                    st.sidebar.success("● YouTube Music connected")
+
+                    # Show format info if conversion occurred
+                    if not headers_file.name.endswith(".json"):
+                        st.sidebar.info("▣ Raw headers converted to JSON format")
+                except ConnectionError:
+                    st.sidebar.error("✖ Failed to connect to YouTube Music")
                 except Exception as e:
                     st.sidebar.error(f"✖ Setup failed: {e}")
             # Keep the headers file path for reuse in Dedup tab
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def detect_platform_cached(prefix_hash: str, suffix: str, _file_path: str) -> str:
+    """`detect_platform` memoized on the file's leading-bytes hash and suffix.
+
+    Detection only sniffs the extension and the first few KB, so re-uploads
+    of the same export skip the re-read even though the temp path changes.
+    """
+    return detect_platform(_file_path)
+
+
 def load_uploaded_file(uploaded_file) -> bool:
     """Load an uploaded file into session state with enhanced error handling."""
     try:
         # Validate file size (max 100MB)
-        file_size = len(uploaded_file.getvalue())
+        file_size = uploaded_file.size
         if file_size > 100 * 1024 * 1024:  # 100MB limit
             st.error("❌ File too large. Maximum size is 100MB.")
             return False
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="wb", delete=False, suffix=Path(uploaded_file.name).suffix
-        ) as tmp:
-            tmp.write(uploaded_file.getvalue())
+        # Fingerprint the head of the file; detection only looks at the start
+        uploaded_file.seek(0)
+        prefix_hash = hashlib.blake2b(
+            uploaded_file.read(64 * 1024), digest_size=8
+        ).hexdigest()
+        suffix = Path(uploaded_file.name).suffix
+
+        # Stream to temporary file without materializing the upload in memory
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=suffix) as tmp:
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, tmp, length=1 << 20)
             tmp_path = tmp.name
 
         # Detect platform
-        platform = detect_platform(tmp_path)
+        platform = detect_platform_cached(prefix_hash, suffix.lower(), tmp_path)
 
         if not platform:
             st.error(f"❌ Unsupported file format: {uploaded_file.name}")
@@ -1052,55 +1305,58 @@ def load_uploaded_file(uploaded_file) -> bool:
         return False
 
 
+_RAW_HEADER_RE = re.compile(r"(?m)^[ \t]*([^:\r\n]*?)[ \t]*:[ \t]*([^\r\n]*?)[ \t\r]*$")
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"})
+_HEADER_DEFAULTS = {
+    "X-Goog-AuthUser": "0",
+    "x-origin": "https://music.youtube.com",
+}
+
+
 def convert_raw_headers_to_json(raw_headers_text: str) -> Dict[str, str]:
     """Convert raw HTTP headers text to JSON format."""
     headers = {}
 
-    for line in raw_headers_text.splitlines():
-        line = line.strip()
-        if not line or ":" not in line:
-            continue
-
+    for key, val in _RAW_HEADER_RE.findall(raw_headers_text):
         # Skip the first line if it's an HTTP request line (starts with GET/POST/etc)
-        if any(
-            line.startswith(method)
-            for method in ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]
-        ):
+        if key.partition(" ")[0] in _HTTP_METHODS:
             continue
 
-        key, val = line.split(":", 1)
-        headers[key.strip()] = val.strip()
+        headers[key] = val
 
     # Ensure required defaults if missing
-    headers.setdefault("X-Goog-AuthUser", "0")
-    headers.setdefault("x-origin", "https://music.youtube.com")
-
-    return headers
+    return {**_HEADER_DEFAULTS, **headers}
 
 
 def process_headers_upload(uploaded_file) -> Optional[str]:
     """Process uploaded headers file, converting raw headers to JSON if needed."""
     try:
-        content = uploaded_file.getvalue().decode("utf-8")
+        raw = uploaded_file.getvalue()
 
         # Try to parse as JSON first
         try:
-            json.loads(content)
+            if HAVE_ORJSON:
+                orjson.loads(raw)
+            else:
+                json.loads(raw.decode("utf-8"))
             # It's already valid JSON, save as-is
             with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
+                mode="wb", suffix=".json", delete=False
             ) as tmp:
-                tmp.write(content)
+                tmp.write(raw)
                 return tmp.name
-        except json.JSONDecodeError:
+        except ValueError:
             # Not JSON, treat as raw headers
-            headers_dict = convert_raw_headers_to_json(content)
+            headers_dict = convert_raw_headers_to_json(raw.decode("utf-8"))
 
             # Save converted JSON
             with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
+                mode="wb", suffix=".json", delete=False
             ) as tmp:
-                json.dump(headers_dict, tmp, indent=2)
+                if HAVE_ORJSON:
+                    tmp.write(orjson.dumps(headers_dict, option=orjson.OPT_INDENT_2))
+                else:
+                    tmp.write(json.dumps(headers_dict, indent=2).encode("utf-8"))
                 return tmp.name
 
     except Exception as e:
@@ -1112,7 +1368,8 @@ def render_overview_tab():
     """Render the overview tab."""
     st.header("📊 Library Overview")
 
-    libraries = SessionManager.list_libraries()
+    libs = st.session_state.libraries
+    libraries = list(libs)
 
     if not libraries:
         st.markdown(
@@ -1147,86 +1404,39 @@ def render_overview_tab():
 
     # Enhanced summary metrics with visual improvements
     total_libraries = len(libraries)
-    total_tracks = sum(
-        SessionManager.get_library(name).total_tracks for name in libraries
-    )
-    total_music = sum(
-        SessionManager.get_library(name).music_count for name in libraries
+    totals = np.fromiter(
+        ((lib.total_tracks, lib.music_count) for lib in libs.values()),
+        dtype=[("tracks", "i8"), ("music", "i8")],
+        count=len(libs),
     )
+    total_tracks = int(totals["tracks"].sum())
+    total_music = int(totals["music"].sum())
     total_artists = len(
-        set().union(
-            *(
-                SessionManager.get_library(name).artist_counts.keys()
-                for name in libraries
-            )
-        )
+        set().union(*map(operator.attrgetter("artist_counts"), libs.values()))
     )
 
     st.markdown("### 📊 Library Summary")
 
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">📚</div>
-            <div style="font-size: 2rem; font-weight: bold;">{}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Libraries</div>
-        </div>
-        """.format(
-                total_libraries
-            ),
-            unsafe_allow_html=True,
-        )
-
-    with col2:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🎵</div>
-            <div style="font-size: 2rem; font-weight: bold;">{:,}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Total Tracks</div>
-        </div>
-        """.format(
-                total_tracks
-            ),
-            unsafe_allow_html=True,
-        )
-
-    with col3:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🎶</div>
-            <div style="font-size: 2rem; font-weight: bold;">{:,}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Music Tracks</div>
-        </div>
-        """.format(
-                total_music
-            ),
-            unsafe_allow_html=True,
-        )
-
-    with col4:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 2rem; margin-bottom: 0.5rem;">👨‍🎤</div>
-            <div style="font-size: 2rem; font-weight: bold;">{:,}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Unique Artists</div>
-        </div>
-        """.format(
-                total_artists
+    render_metric_band(
+        [
+            ("#667eea", "#764ba2", "📚", f"{total_libraries}", "Libraries"),
+            ("#f093fb", "#f5576c", "🎵", f"{total_tracks:,}", "Total Tracks"),
+            ("#4facfe", "#00f2fe", "🎶", f"{total_music:,}", "Music Tracks"),
+            (
+                "#fa709a",
+                "#fee140",
+                "👨‍🎤",
+                f"{total_artists:,}",
+                "Unique Artists",
             ),
-            unsafe_allow_html=True,
-        )
+        ]
+    )
 
     # Library details
     st.subheader("📚 Library Details")
 
     lib_data = []
-    for lib_name in libraries:
-        library = SessionManager.get_library(lib_name)
+    for lib_name, library in libs.items():
         lib_data.append(
             {
                 "Library": lib_name,
@@ -1284,15 +1494,11 @@ def render_compare_tab():
     libraries = SessionManager.list_libraries()
 
     if len(libraries) < 2:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); padding: 2rem; border-radius: 12px; text-align: center; border-left: 4px solid #ffc107;">
-            <h4 style="color: #856404; margin-bottom: 1rem;">📊 Library Comparison</h4>
-            <p style="color: #856404; margin-bottom: 1rem;">You need at least 2 libraries to perform comparison analysis.</p>
-            <p style="color: #856404; margin: 0; font-size: 0.9rem;">Upload more libraries using the sidebar to unlock this feature.</p>
-        </div>
-        """,
-            unsafe_allow_html=True,
+        render_card(
+            "warning",
+            title="📊 Library Comparison",
+            message="You need at least 2 libraries to perform comparison analysis.",
+            hint="Upload more libraries using the sidebar to unlock this feature.",
         )
         return
 
@@ -1328,129 +1534,330 @@ def render_compare_tab():
     # Enhanced comparison button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("🔍 Compare Libraries", type="primary", use_container_width=True):
+        job = st.session_state.compare_job
+        if st.button(
+            "🔍 Compare Libraries",
+            type="primary",
+            use_container_width=True,
+            disabled=job is not None,
+        ):
             if source_lib and target_lib:
-                with st.spinner("Comparing libraries..."):
-                    source_library = SessionManager.get_library(source_lib)
-                    target_library = SessionManager.get_library(target_lib)
-
-                    comparator = LibraryComparator(
-                        strict_mode=strict_mode,
-                        enable_duration=use_duration,
-                        enable_album=use_album,
-                    )
-
-                    # Enhanced progress display
-                    progress_container = st.container()
-                    with progress_container:
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-
-                    def progress_callback(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.markdown(f"**{message}** ({current}/{total})")
-
-                    comparator.progress_callback = progress_callback
+                comparator = LibraryComparator(
+                    strict_mode=strict_mode,
+                    enable_duration=use_duration,
+                    enable_album=use_album,
+                )
 
-                    result = comparator.compare_libraries(
-                        source_library, target_library
-                    )
+                # The worker thread must not touch Streamlit; it only reports
+                # progress through a queue that each poll drains, and stops at
+                # its next progress report once the job is cancelled.
+                progress_queue = queue.Queue()
+                cancel_event = threading.Event()
 
-                    # Store result
-                    comparison_key = f"{source_lib}_vs_{target_lib}"
-                    st.session_state.comparison_results[comparison_key] = result
+                def progress_callback(current, total, message):
+                    if cancel_event.is_set():
+                        raise ComparisonCancelled()
+                    progress_queue.put((current, total, message))
 
-                    progress_bar.empty()
-                    status_text.empty()
+                comparator.progress_callback = progress_callback
 
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%); padding: 1.5rem; border-radius: 12px; border-left: 4px solid #28a745; margin: 1rem 0;">
-                    <h4 style="color: #155724; margin: 0;">✅ Comparison Complete!</h4>
-                    <p style="color: #155724; margin: 0.5rem 0 0 0;">Your libraries have been analyzed successfully.</p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
+                future = st.session_state.compare_executor.submit(
+                    comparator.compare_libraries,
+                    SessionManager.get_library(source_lib),
+                    SessionManager.get_library(target_lib),
                 )
+                job = {
+                    "future": future,
+                    "key": f"{source_lib}_vs_{target_lib}",
+                    "queue": progress_queue,
+                    "cancel": cancel_event,
+                    "last": (0, 0, "Starting comparison"),
+                }
+                st.session_state.compare_job = job
+
+        if job is not None:
+            render_compare_progress(job)
+        render_compare_outcome()
 
     # Display results
     comparison_key = f"{source_lib}_vs_{target_lib}"
     if comparison_key in st.session_state.comparison_results:
         result = st.session_state.comparison_results[comparison_key]
-        display_comparison_results(result)
+        display_comparison_results(result, cache_key=comparison_key)
 
 
-def display_comparison_results(result):
-    """Display comparison results."""
-    stats = result.get_stats()
+class ComparisonCancelled(Exception):
+    """Raised from a comparison's progress callback to stop its worker."""
 
-    # Enhanced summary metrics
-    st.markdown("### 📊 Comparison Results")
 
-    col1, col2, col3, col4 = st.columns(4)
+# Seconds between progress polls of a background comparison
+_COMPARE_POLL_INTERVAL = 0.5
 
-    with col1:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #28a745 0%, #20c997 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">✅</div>
-            <div style="font-size: 1.8rem; font-weight: bold;">{:,}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Total Matches</div>
-        </div>
-        """.format(
-                stats["total_matches"]
-            ),
-            unsafe_allow_html=True,
-        )
+# Fragments rerun only the progress block while polling; older Streamlit
+# releases fall back to rerunning the whole app at the same interval.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
 
-    with col2:
-        match_rate = stats["match_rate"]
-        color = (
-            "#28a745"
-            if match_rate >= 80
-            else "#ffc107" if match_rate >= 60 else "#dc3545"
+
+def _poll_compare_progress(job: Dict[str, Any]):
+    """Show progress for a background comparison until it finishes."""
+    while True:
+        try:
+            job["last"] = job["queue"].get_nowait()
+        except queue.Empty:
+            break
+    current, total, message = job["last"]
+    future = job["future"]
+
+    if future.done():
+        st.session_state.compare_job = None
+        try:
+            result = future.result()
+        except Exception as e:
+            st.session_state.compare_outcome = ("error", str(e))
+        else:
+            st.session_state.comparison_results[job["key"]] = result
+            _refresh_cache_token(job["key"])
+            st.session_state.compare_outcome = ("success", "")
+        st.rerun()
+
+    with st.status("Comparing libraries...", expanded=True):
+        st.progress(current / total if total > 0 else 0)
+        st.markdown(f"**{message}** ({current}/{total})")
+
+        if st.button("Cancel comparison"):
+            # The worker stops at its next progress report; until then a new
+            # comparison waits behind it.
+            job["cancel"].set()
+            st.session_state.compare_job = None
+            st.session_state.compare_outcome = ("cancelled", "")
+            st.rerun()
+
+    if _fragment is None:
+        time.sleep(_COMPARE_POLL_INTERVAL)
+        st.rerun()
+
+
+if _fragment is not None:
+    render_compare_progress = _fragment(run_every=_COMPARE_POLL_INTERVAL)(
+        _poll_compare_progress
+    )
+else:
+    render_compare_progress = _poll_compare_progress
+
+
+def render_compare_outcome():
+    """Report how the last background comparison ended, once."""
+    outcome = st.session_state.pop("compare_outcome", None)
+    if outcome is None:
+        return
+    kind, detail = outcome
+    if kind == "error":
+        st.error(f"❌ Comparison failed: {detail}")
+    elif kind == "cancelled":
+        st.info(
+            "Comparison cancelled. It is still winding down in the background; "
+            "a new comparison starts once it has stopped."
         )
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, {} 0%, {} 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🎯</div>
-            <div style="font-size: 1.8rem; font-weight: bold;">{:.1f}%</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Match Rate</div>
-        </div>
-        """.format(
-                color, color, match_rate
-            ),
-            unsafe_allow_html=True,
+    else:
+        render_card(
+            "success",
+            title="✅ Comparison Complete!",
+            message="Your libraries have been analyzed successfully.",
         )
 
-    with col3:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #007bff 0%, #6610f2 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🏆</div>
-            <div style="font-size: 1.8rem; font-weight: bold;">{:.1f}%</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Avg Confidence</div>
-        </div>
-        """.format(
-                stats["avg_confidence"]
-            ),
-            unsafe_allow_html=True,
-        )
 
-    with col4:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #6c757d 0%, #495057 100%); color: white; padding: 1.5rem; border-radius: 12px; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">❌</div>
-            <div style="font-size: 1.8rem; font-weight: bold;">{:,}</div>
-            <div style="font-size: 0.9rem; opacity: 0.9;">Missing Tracks</div>
-        </div>
-        """.format(
-                stats["missing_tracks"]
+# Result tables are rebuilt on every rerun otherwise; cache them per stored
+# result using a session token that changes whenever the result is replaced.
+def _cache_token(key: str) -> str:
+    """Token identifying the current session result stored under `key`."""
+    tokens = st.session_state.setdefault("cache_tokens", {})
+    return tokens.setdefault(key, uuid.uuid4().hex)
+
+
+def _refresh_cache_token(key: str) -> None:
+    """Invalidate cached tables for `key` after its result was replaced."""
+    st.session_state.setdefault("cache_tokens", {})[key] = uuid.uuid4().hex
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _matches_table(token: str, _result) -> pd.DataFrame:
+    """Matched-tracks table for a comparison result."""
+    src_tracks = [m.source_track for m in _result.matches]
+    tgt_tracks = [m.target_track for m in _result.matches]
+    src_titles = _result.src_titles
+    tgt_titles = _result.tgt_titles
+    return pd.DataFrame(
+        {
+            "Source Thumb": _yt_thumbs_bulk(_track_link_frame(src_tracks)),
+            "Source Title": src_titles,
+            "Source Artist": [t.artist for t in src_tracks],
+            "Source Explicit": list(map(_explicit_hint_from_title, src_titles)),
+            "Target Thumb": _yt_thumbs_bulk(_track_link_frame(tgt_tracks)),
+            "Target Title": tgt_titles,
+            "Target Artist": [t.artist for t in tgt_tracks],
+            "Target Explicit": list(map(_explicit_hint_from_title, tgt_titles)),
+            "Confidence": [f"{c:.1%}" for c in _result.confidences.tolist()],
+            "Match Type": np.char.title(_result.match_types),
+        }
+    ).astype(
+        {
+            # High-repeat columns ship far smaller to the browser as categories
+            "Source Artist": "category",
+            "Target Artist": "category",
+            "Match Type": "category",
+            "Source Explicit": "bool",
+            "Target Explicit": "bool",
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _missing_table(token: str, _missing) -> pd.DataFrame:
+    """Missing-tracks table for a comparison result."""
+    missing_titles = [t.title for t in _missing]
+    return pd.DataFrame(
+        {
+            "Thumb": _yt_thumbs_bulk(_track_link_frame(_missing)),
+            "Title": missing_titles,
+            "Artist": [t.artist for t in _missing],
+            "Album": [t.album or "" for t in _missing],
+            "Duration": [f"{t.duration}s" if t.duration else "" for t in _missing],
+            "Explicit": list(map(_explicit_hint_from_title, missing_titles)),
+            "Platform": [t.platform or "" for t in _missing],
+        }
+    ).astype(
+        {
+            "Artist": "category",
+            "Album": "category",
+            "Platform": "category",
+            "Explicit": "bool",
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _table_export(token: str, name: str, fmt: str, _df: pd.DataFrame) -> bytes:
+    """Export of a cached result table in the given download format."""
+    return _table_bytes(_df, fmt)
+
+
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize `df` to UTF-8 CSV bytes without an intermediate str."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+def _table_bytes(df: pd.DataFrame, fmt: str) -> bytes:
+    """Serialize `df` as CSV, Parquet (zstd) or Feather."""
+    if fmt == "CSV":
+        return _csv_bytes(df)
+    buf = io.BytesIO()
+    if fmt == "Parquet":
+        df.to_parquet(buf, compression="zstd", index=False)
+    else:
+        df.reset_index(drop=True).to_feather(buf)
+    return buf.getvalue()
+
+
+def _paginate(df: pd.DataFrame, key: str, page_size: int = 500) -> pd.DataFrame:
+    """Slice of `df` for the page picked in a pager shown above large tables.
+
+    Only the visible page goes through Arrow to the browser; downloads still
+    use the full frame.
+    """
+    pages = math.ceil(len(df) / page_size)
+    if pages <= 1:
+        return df
+    page = st.number_input(
+        f"Page (of {pages:,}, {page_size} rows each)",
+        min_value=1,
+        max_value=pages,
+        value=1,
+        key=f"{key}_page",
+    )
+    return df.iloc[(page - 1) * page_size : page * page_size]
+
+
+def render_table_download(
+    label: str,
+    df: pd.DataFrame,
+    basename: str,
+    key: str,
+    token: Optional[str] = None,
+):
+    """Format picker plus download button for a result table.
+
+    Parquet/Feather are offered only when pyarrow is installed; CSV stays
+    the default for compatibility.
+    """
+    fmt = st.radio(
+        "Format", list(_EXPORT_FORMATS), horizontal=True, key=f"{key}_format"
+    )
+    ext, mime = _EXPORT_FORMATS[fmt]
+
+    def build() -> bytes:
+        return _table_export(token, key, fmt, df) if token else _table_bytes(df, fmt)
+
+    st.download_button(
+        f"{label} {fmt}",
+        build if _DEFERRED_DOWNLOADS else build(),
+        f"{basename}_{int(time.time())}.{ext}",
+        mime,
+        use_container_width=True,
+    )
+
+
+def display_comparison_results(result, cache_key: str):
+    """Display comparison results.
+
+    `cache_key` names the stored result; its tables are cached under it.
+    """
+    token = _cache_token(cache_key)
+
+    # Stats only change when a new result is stored, i.e. when the token does
+    last_stats = st.session_state.get("last_stats")
+    if last_stats and last_stats[0] == token:
+        stats = last_stats[1]
+    else:
+        stats = result.get_stats()
+        st.session_state.last_stats = (token, stats)
+
+    # Enhanced summary metrics
+    st.markdown("### 📊 Comparison Results")
+
+    match_rate = stats["match_rate"]
+    color = (
+        "#28a745" if match_rate >= 80 else "#ffc107" if match_rate >= 60 else "#dc3545"
+    )
+    # One element for the whole band instead of four columns of markdown
+    render_metric_band(
+        [
+            (
+                "#28a745",
+                "#20c997",
+                "✅",
+                f"{stats['total_matches']:,}",
+                "Total Matches",
             ),
-            unsafe_allow_html=True,
-        )
+            (color, color, "🎯", f"{match_rate:.1f}%", "Match Rate"),
+            (
+                "#007bff",
+                "#6610f2",
+                "🏆",
+                f"{stats['avg_confidence']:.1f}%",
+                "Avg Confidence",
+            ),
+            (
+                "#6c757d",
+                "#495057",
+                "❌",
+                f"{stats['missing_tracks']:,}",
+                "Missing Tracks",
+            ),
+        ],
+        compact=True,
+    )
 
     # Match breakdown
     col1, col2, col3 = st.columns(3)
@@ -1466,108 +1873,55 @@ def display_comparison_results(result):
 
     with tabs[0]:
         if result.matches:
-            matches_data = []
-            for match in result.matches:
-                s_thumb = _yt_thumb_from_track(match.source_track)
-                t_thumb = _yt_thumb_from_track(match.target_track)
-                s_explicit = _explicit_hint_from_title(match.source_track.title)
-                t_explicit = _explicit_hint_from_title(match.target_track.title)
-                matches_data.append(
-                    {
-                        "Source Thumb": s_thumb or "",
-                        "Source Title": match.source_track.title,
-                        "Source Artist": match.source_track.artist,
-                        "Source Explicit": s_explicit,
-                        "Target Thumb": t_thumb or "",
-                        "Target Title": match.target_track.title,
-                        "Target Artist": match.target_track.artist,
-                        "Target Explicit": t_explicit,
-                        "Confidence": f"{match.confidence:.1%}",
-                        "Match Type": match.match_type.title(),
-                    }
-                )
-
-            matches_df = pd.DataFrame(matches_data)
-            try:
+            matches_df = _matches_table(token, result)
+            matches_page = _paginate(matches_df, "matches")
+            if _HAS_COLUMN_CONFIG:
                 st.dataframe(
-                    matches_df,
+                    matches_page,
                     use_container_width=True,
-                    column_config={
-                        "Source Thumb": st.column_config.ImageColumn(
-                            "Src", width="small"
-                        ),
-                        "Target Thumb": st.column_config.ImageColumn(
-                            "Dst", width="small"
-                        ),
-                        "Source Explicit": st.column_config.CheckboxColumn(
-                            "Src Explicit"
-                        ),
-                        "Target Explicit": st.column_config.CheckboxColumn(
-                            "Dst Explicit"
-                        ),
-                    },
+                    column_config=_MATCHES_COLUMN_CONFIG,
                 )
-            except Exception:
+            else:
                 # Fallback without column_config on older Streamlit
-                st.dataframe(matches_df, use_container_width=True)
+                st.dataframe(matches_page, use_container_width=True)
 
             # Enhanced download section
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                csv = matches_df.to_csv(index=False)
-                st.download_button(
-                    "📥 Download Matched Tracks CSV",
-                    csv,
-                    f"matched_tracks_{int(time.time())}.csv",
-                    "text/csv",
-                    use_container_width=True,
+                render_table_download(
+                    "📥 Download Matched Tracks",
+                    matches_df,
+                    "matched_tracks",
+                    "matches",
+                    token=token,
                 )
         else:
             st.info("No matched tracks found")
 
     with tabs[1]:
         if result.missing_tracks:
-            missing_data = []
-            for track in result.missing_tracks:
-                thumb = _yt_thumb_from_track(track)
-                explicit = _explicit_hint_from_title(track.title)
-                missing_data.append(
-                    {
-                        "Thumb": thumb or "",
-                        "Title": track.title,
-                        "Artist": track.artist,
-                        "Album": track.album or "",
-                        "Duration": f"{track.duration}s" if track.duration else "",
-                        "Explicit": explicit,
-                        "Platform": track.platform or "",
-                    }
-                )
-
-            missing_df = pd.DataFrame(missing_data)
-            try:
+            missing_df = _missing_table(token, result.missing_tracks)
+            missing_page = _paginate(missing_df, "missing")
+            if _HAS_COLUMN_CONFIG:
                 st.dataframe(
-                    missing_df,
+                    missing_page,
                     use_container_width=True,
-                    column_config={
-                        "Thumb": st.column_config.ImageColumn("Thumb", width="small"),
-                        "Explicit": st.column_config.CheckboxColumn("Explicit"),
-                    },
+                    column_config=_MISSING_COLUMN_CONFIG,
                 )
-            except Exception:
-                st.dataframe(missing_df, use_container_width=True)
+            else:
+                st.dataframe(missing_page, use_container_width=True)
 
             # Enhanced download section
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                csv = missing_df.to_csv(index=False)
-                st.download_button(
-                    "📥 Download Missing Tracks CSV",
-                    csv,
-                    f"missing_tracks_{int(time.time())}.csv",
-                    "text/csv",
-                    use_container_width=True,
+                render_table_download(
+                    "📥 Download Missing Tracks",
+                    missing_df,
+                    "missing_tracks",
+                    "missing",
+                    token=token,
                 )
 
             # Enhanced YouTube Music playlist creation
@@ -1620,58 +1974,72 @@ def display_comparison_results(result):
             render_comparison_charts(result, stats)
 
 
-def render_comparison_charts(result, stats):
-    """Render comparison visualization charts."""
-    col1, col2 = st.columns(2)
+# Figures depend only on these small immutable keys, so reruns and tab
+# switches reuse the built Figure objects.
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _match_pie(match_items: Tuple[Tuple[str, int], ...]):
+    _, px, _, _, _ = get_visualization_modules()
+    return px.pie(
+        values=[count for _, count in match_items],
+        names=[name for name, _ in match_items],
+        title="Match Type Distribution",
+    )
 
-    with col1:
-        # Match type distribution
-        plt, px, go, venn2, venn3 = get_visualization_modules()
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _match_bar(match_rate: float):
+    _, _, go, _, _ = get_visualization_modules()
+    fig = go.Figure(
+        data=[
+            go.Bar(name="Matched", x=[""], y=[match_rate * 100]),
+            go.Bar(name="Missing", x=[""], y=[(1 - match_rate) * 100]),
+        ]
+    )
+
+    fig.update_layout(
+        title="Overall Match Rate", yaxis_title="Percentage", barmode="stack"
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _confidence_hist(confidences: np.ndarray):
+    _, px, _, _, _ = get_visualization_modules()
+    return px.histogram(
+        x=confidences,
+        nbins=20,
+        title="Match Confidence Distribution",
+        labels={"x": "Confidence (%)", "y": "Number of Matches"},
+    )
+
+
+def render_comparison_charts(result, stats):
+    """Render comparison visualization charts."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Match type distribution
+        plt, px, go, venn2, venn3 = get_visualization_modules()
         if px is None:
             st.error("Visualization libraries not available")
             return
 
-        match_data = {
-            "Exact": stats["exact_matches"],
-            "Fuzzy": stats["fuzzy_matches"],
-            "ISRC": stats["isrc_matches"],
-        }
-
-        fig = px.pie(
-            values=list(match_data.values()),
-            names=list(match_data.keys()),
-            title="Match Type Distribution",
+        match_items = (
+            ("Exact", stats["exact_matches"]),
+            ("Fuzzy", stats["fuzzy_matches"]),
+            ("ISRC", stats["isrc_matches"]),
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_match_pie(match_items), use_container_width=True)
 
     with col2:
         # Overall match rate
-        match_rate = stats["match_rate"] / 100
-        missing_rate = 1 - match_rate
-
-        fig = go.Figure(
-            data=[
-                go.Bar(name="Matched", x=[""], y=[match_rate * 100]),
-                go.Bar(name="Missing", x=[""], y=[missing_rate * 100]),
-            ]
-        )
-
-        fig.update_layout(
-            title="Overall Match Rate", yaxis_title="Percentage", barmode="stack"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        match_rate = round(stats["match_rate"] / 100, 4)
+        st.plotly_chart(_match_bar(match_rate), use_container_width=True)
 
     # Confidence distribution
     if result.matches:
-        confidences = [match.confidence * 100 for match in result.matches]
-
-        fig = px.histogram(
-            x=confidences,
-            nbins=20,
-            title="Match Confidence Distribution",
-            labels={"x": "Confidence (%)", "y": "Number of Matches"},
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        confidences = result.confidences * 100
+        st.plotly_chart(_confidence_hist(confidences), use_container_width=True)
 
 
 def render_analyze_tab():
@@ -1763,19 +2131,19 @@ def display_analysis_results(analysis):
     with tabs[0]:
         st.subheader("📊 Pairwise Comparison Matrix")
 
-        comparison_data = []
-        for comp in analysis["pairwise_comparisons"]:
-            comparison_data.append(
-                {
-                    "Source": comp["source"],
-                    "Target": comp["target"],
-                    "Match Rate": f"{comp['stats']['match_rate']:.1f}%",
-                    "Total Matches": comp["stats"]["total_matches"],
-                    "Missing": comp["stats"]["missing_tracks"],
-                }
-            )
-
-        comp_df = pd.DataFrame(comparison_data)
+        comp_df = pd.DataFrame.from_records(
+            [
+                (
+                    comp["source"],
+                    comp["target"],
+                    f"{comp['stats']['match_rate']:.1f}%",
+                    comp["stats"]["total_matches"],
+                    comp["stats"]["missing_tracks"],
+                )
+                for comp in analysis["pairwise_comparisons"]
+            ],
+            columns=["Source", "Target", "Match Rate", "Total Matches", "Missing"],
+        )
         st.dataframe(comp_df, use_container_width=True)
 
     with tabs[1]:
@@ -1786,12 +2154,11 @@ def display_analysis_results(analysis):
             st.dataframe(universal_df, use_container_width=True)
 
             # Download
-            csv = universal_df.to_csv(index=False)
-            st.download_button(
+            render_table_download(
                 "📥 Download Universal Tracks",
-                csv,
-                f"universal_tracks_{int(time.time())}.csv",
-                "text/csv",
+                universal_df,
+                "universal_tracks",
+                "universal",
             )
         else:
             st.info("No tracks found in all libraries")
@@ -1835,6 +2202,11 @@ def display_analysis_results(analysis):
                 st.dataframe(top_artists_df)
 
 
+# MusicBrainz lookups are network-bound; a few workers overlap round-trips and
+# fallback queries while the enricher's token bucket keeps the request rate.
+_MB_LOOKUP_WORKERS = 4
+
+
 def render_enrich_tab():
     """Render the enrichment tab."""
     st.header("🔍 Metadata Enrichment")
@@ -1842,15 +2214,11 @@ def render_enrich_tab():
     libraries = SessionManager.list_libraries()
 
     if not libraries:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); padding: 2rem; border-radius: 12px; text-align: center; border-left: 4px solid #ffc107;">
-            <h4 style="color: #856404; margin-bottom: 1rem;">📚 Enrichment Ready</h4>
-            <p style="color: #856404; margin-bottom: 1rem;">Upload some music libraries first to unlock metadata enrichment.</p>
-            <p style="color: #856404; margin: 0; font-size: 0.9rem;">Use the sidebar to get started with your library files.</p>
-        </div>
-        """,
-            unsafe_allow_html=True,
+        render_card(
+            "warning",
+            title="📚 Enrichment Ready",
+            message="Upload some music libraries first to unlock metadata enrichment.",
+            hint="Use the sidebar to get started with your library files.",
         )
         return
 
@@ -1867,7 +2235,7 @@ def render_enrich_tab():
     library = SessionManager.get_library(selected_lib)
 
     # Key stats for CTA context
-    missing_isrc = sum(1 for t in library.music_tracks if not getattr(t, "isrc", None))
+    missing_isrc = int((~library.isrcs.astype(bool)).sum())
     st.info(
         f"📊 {library.name}: {library.music_count:,} music tracks | Missing ISRC: {missing_isrc:,}"
     )
@@ -1930,7 +2298,7 @@ def render_enrich_tab():
     if enrich_isrc_clicked or enrich_full_clicked:
         scope = "isrc_only" if enrich_isrc_clicked else "full"
         with st.spinner("Enriching metadata..."):
-            enricher = EnrichmentManager()
+            enricher = st.session_state.enrichment_manager
 
             tracks_to_enrich = library.music_tracks
             if max_tracks:
@@ -1947,33 +2315,34 @@ def render_enrich_tab():
 
             if scope == "full":
                 enriched_results = enricher.bulk_enrich(
-                    tracks_to_enrich, progress_callback
+                    tracks_to_enrich,
+                    progress_callback,
+                    max_workers=_MB_LOOKUP_WORKERS,
                 )
             else:
                 # ISRC-only: fetch enrichment but apply only ISRC back to track
-                enriched_results = []
+                # Lookups overlap network waits across workers while the
+                # enricher's shared rate limiter keeps request spacing.
                 total = len(tracks_to_enrich)
-                for idx, t in enumerate(tracks_to_enrich):
-                    progress_callback(idx, total, f"Looking up ISRC: {t.title}")
-                    data = enricher.enrich_track(t)
-                    # Keep original fields, only set ISRC if newly found
-                    new_isrc = None
-                    if data and "enriched_fields" in data:
-                        new_isrc = data["enriched_fields"].get("isrc")
-                    enhanced = Track(
-                        title=t.title,
-                        artist=t.artist,
-                        album=t.album,
-                        duration=t.duration,  # unchanged
-                        isrc=new_isrc or t.isrc,
-                        platform=t.platform,
-                        track_id=t.track_id,
-                        url=t.url,
-                        year=t.year,
-                        genre=t.genre,
-                        track_number=t.track_number,
-                    )
-                    enriched_results.append((enhanced, data or {}))
+                enriched_results = [None] * total
+                with ThreadPoolExecutor(max_workers=_MB_LOOKUP_WORKERS) as pool:
+                    futures = {
+                        pool.submit(enricher.enrich_track, t): idx
+                        for idx, t in enumerate(tracks_to_enrich)
+                    }
+                    for done, future in enumerate(as_completed(futures)):
+                        idx = futures[future]
+                        t = tracks_to_enrich[idx]
+                        progress_callback(done, total, f"Looking up ISRC: {t.title}")
+                        data = future.result()
+                        # Keep original fields, only set ISRC if newly found
+                        new_isrc = None
+                        if data and "enriched_fields" in data:
+                            new_isrc = data["enriched_fields"].get("isrc")
+                        if new_isrc and new_isrc != t.isrc:
+                            t = dataclasses.replace(t, isrc=new_isrc)
+                        enriched_results[idx] = (t, data or {})
+                enricher.flush()
                 progress_callback(total, total, "ISRC enrichment complete")
 
             progress_bar.empty()
@@ -1981,7 +2350,7 @@ def render_enrich_tab():
 
             # Store results
             enrich_key = f"{selected_lib}_enriched"
-            st.session_state.enrichment_data[enrich_key] = enriched_results
+            store_enrichment_results(enrich_key, enriched_results)
 
             # Summary
             successful = sum(
@@ -1994,64 +2363,185 @@ def render_enrich_tab():
 
     # Display enrichment results
     enrich_key = f"{selected_lib}_enriched"
-    if enrich_key in st.session_state.enrichment_data:
-        display_enrichment_results(st.session_state.enrichment_data[enrich_key])
+    enriched_df = load_enrichment_results(enrich_key)
+    if enriched_df is not None:
+        display_enrichment_results(enriched_df, cache_key=enrich_key)
+        if st.button("🗑️ Clear Enrichment Results"):
+            clear_enrichment_results(enrich_key)
+            st.rerun()
+
+
+def _enrichment_frame(enriched_results) -> pd.DataFrame:
+    """Flatten `(track, enrichment_info)` pairs into one row per track."""
+    records = []
+    for track, info in enriched_results:
+        row = track.to_dict()
+        row["artist_tokens"] = sorted(row.get("artist_tokens") or ())
+        mb_data = info.get("musicbrainz") or {}
+        fields = info.get("enriched_fields", {})
+        row["has_musicbrainz"] = bool(mb_data)
+        row["musicbrainz_id"] = mb_data.get("musicbrainz_id") or ""
+        row["musicbrainz_json"] = json.dumps(mb_data, default=str)
+        row["added_isrc"] = bool(fields.get("isrc"))
+        row["added_genre"] = bool(fields.get("genre"))
+        records.append(row)
+    df = pd.DataFrame.from_records(records)
+    # Keep integer fields integral when some tracks lack them
+    for col in ("duration", "year", "track_number"):
+        try:
+            df[col] = df[col].astype("Int64")
+        except (KeyError, TypeError, ValueError):
+            pass
+    return df
+
+
+# Feather files older than this belong to sessions that have ended
+_ENRICHMENT_FILE_MAX_AGE = 24 * 3600
+
+
+def _enrichment_dir() -> Path:
+    return Path(tempfile.gettempdir())
 
 
-def display_enrichment_results(enriched_results):
-    """Display enrichment results."""
+def _sweep_enrichment_files() -> None:
+    """Remove enrichment files left behind by sessions that have ended."""
+    cutoff = time.time() - _ENRICHMENT_FILE_MAX_AGE
+    for path in _enrichment_dir().glob("musicweb_*_*.feather"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def clear_enrichment_results(key: str) -> None:
+    """Drop the enrichment results for `key` and delete their file."""
+    entry = st.session_state.enrichment_data.pop(key, None)
+    if isinstance(entry, str):
+        try:
+            Path(entry).unlink()
+        except OSError:
+            pass
+    _refresh_cache_token(key)
+
+
+def store_enrichment_results(key: str, enriched_results) -> None:
+    """Keep enrichment results for `key` out of the session heap.
+
+    Results are written to a per-session Feather file and only its path is
+    kept in session state; without pyarrow (or for columns Arrow cannot
+    type) the flat frame itself is stored instead. The file of any result
+    this one replaces is deleted first.
+    """
+    df = _enrichment_frame(enriched_results)
+    clear_enrichment_results(key)
+    _sweep_enrichment_files()
+    session_uid = st.session_state.setdefault("session_uid", uuid.uuid4().hex)
+    safe_key = re.sub(r"[^\w.-]+", "_", key)
+    path = _enrichment_dir() / f"musicweb_{session_uid}_{safe_key}.feather"
+    try:
+        df.to_feather(path)
+        st.session_state.enrichment_data[key] = str(path)
+    except Exception:
+        st.session_state.enrichment_data[key] = df
+
+
+@st.cache_data(max_entries=2, ttl=600, show_spinner=False)
+def _read_enrichment_file(path: str, token: str) -> pd.DataFrame:
+    """Feather file read once per stored result instead of on every rerun.
+
+    Only the last couple of results are held, briefly; each caller gets
+    its own copy, and older ones are read from disk again.
+    """
+    return pd.read_feather(path)
+
+
+def load_enrichment_results(key: str) -> Optional[pd.DataFrame]:
+    """Frame stored by `store_enrichment_results`, or None if there is none.
+
+    A file removed behind our back (temp cleanup, restart) counts as no
+    results, and its stale entry is dropped.
+    """
+    entry = st.session_state.enrichment_data.get(key)
+    if not isinstance(entry, str):
+        return entry
+    try:
+        return _read_enrichment_file(entry, _cache_token(key))
+    except FileNotFoundError:
+        clear_enrichment_results(key)
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _enriched_table(token: str, _successful: pd.DataFrame) -> pd.DataFrame:
+    """Table of successfully enriched tracks."""
+    mb_ids = _successful["musicbrainz_id"]
+    return pd.DataFrame(
+        {
+            "Title": _successful["title"],
+            "Artist": _successful["artist"],
+            "Album": _successful["album"].fillna(""),
+            "Original Duration": [
+                int(d) if pd.notna(d) and d else "" for d in _successful["duration"]
+            ],
+            "MusicBrainz ID": (mb_ids.str[:8] + "...").where(mb_ids != "", ""),
+            "Added ISRC": _successful["added_isrc"],
+            "Added Genre": _successful["added_genre"],
+        }
+    ).reset_index(drop=True)
+
+
+def display_enrichment_results(enriched_df, cache_key: str):
+    """Display enrichment results.
+
+    `cache_key` names the stored result; its tables are cached under it.
+    """
+    token = _cache_token(cache_key)
+
     st.subheader("📊 Enrichment Results")
 
-    successful = [result for result in enriched_results if result[1].get("musicbrainz")]
-    failed = [result for result in enriched_results if not result[1].get("musicbrainz")]
+    # Only the successful rows are shown; failures are just the remainder
+    successful = enriched_df[enriched_df["has_musicbrainz"].to_numpy()]
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Processed", len(enriched_results))
+        st.metric("Total Processed", len(enriched_df))
     with col2:
         st.metric("Successfully Enriched", len(successful))
     with col3:
-        st.metric("Success Rate", f"{len(successful)/len(enriched_results):.1%}")
+        st.metric("Success Rate", f"{len(successful)/len(enriched_df):.1%}")
 
     # Show enriched tracks
-    if successful:
+    if len(successful):
         st.subheader("✅ Successfully Enriched Tracks")
 
-        enriched_data = []
-        for enhanced_track, enrichment_info in successful:
-            mb_data = enrichment_info.get("musicbrainz", {})
-
-            enriched_data.append(
-                {
-                    "Title": enhanced_track.title,
-                    "Artist": enhanced_track.artist,
-                    "Album": enhanced_track.album or "",
-                    "Original Duration": enhanced_track.duration or "",
-                    "MusicBrainz ID": (
-                        mb_data.get("musicbrainz_id", "")[:8] + "..."
-                        if mb_data.get("musicbrainz_id")
-                        else ""
-                    ),
-                    "Added ISRC": bool(
-                        enrichment_info.get("enriched_fields", {}).get("isrc")
-                    ),
-                    "Added Genre": bool(
-                        enrichment_info.get("enriched_fields", {}).get("genre")
-                    ),
-                }
-            )
-
-        enriched_df = pd.DataFrame(enriched_data)
-        st.dataframe(enriched_df, use_container_width=True)
+        enriched_table = _enriched_table(token, successful)
+        st.dataframe(enriched_table, use_container_width=True)
 
         # Download enriched data
         if st.button("📥 Download Enriched Data"):
+            track_columns = [
+                c
+                for c in successful.columns
+                if c
+                not in (
+                    "has_musicbrainz",
+                    "musicbrainz_id",
+                    "musicbrainz_json",
+                    "added_isrc",
+                    "added_genre",
+                )
+            ]
+            tracks = successful[track_columns].astype(object)
+            tracks = tracks.where(tracks.notna(), None)
             enrichment_export = []
-            for enhanced_track, enrichment_info in successful:
-                export_data = enhanced_track.to_dict()
-                export_data["enrichment_source"] = "musicbrainz"
-                export_data["enrichment_data"] = enrichment_info.get("musicbrainz", {})
-                enrichment_export.append(export_data)
+            for row, mb_json in zip(
+                tracks.to_dict("records"), successful["musicbrainz_json"]
+            ):
+                row["artist_tokens"] = list(row["artist_tokens"])
+                row["enrichment_source"] = "musicbrainz"
+                row["enrichment_data"] = json.loads(mb_json)
+                enrichment_export.append(row)
 
             json_str = json.dumps(enrichment_export, indent=2, default=str)
             st.download_button(
@@ -2202,6 +2692,125 @@ def main():
         render_help_tab()
 
 
+def _first_present(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """Row-wise first truthy value across `columns`, blank when none is set."""
+    out = pd.Series("", index=df.index, dtype=object)
+    for col in reversed(columns):
+        if col in df:
+            values = df[col]
+            out = values.where(values.notna() & values.astype(bool), out)
+    return out
+
+
+def _playlist_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-row title/artist/album/duration/isrc, preferring the playlist's values."""
+    return pd.DataFrame(
+        {
+            "title": _first_present(df, "playlist_title", "title"),
+            "artist": _first_present(df, "playlist_artist", "artist"),
+            "album": _first_present(df, "playlist_album", "album"),
+            "duration": _first_present(df, "playlist_duration", "duration"),
+            "isrc": _first_present(df, "isrc"),
+        },
+        index=df.index,
+    )
+
+
+def _apple_music_txt(fields: pd.DataFrame) -> bytes:
+    """Build an Apple Music text playlist (UTF-16 TSV: Name, Artist, Album, Time).
+
+    `fields` is the output of `_playlist_fields`.
+    """
+    secs = pd.to_numeric(fields["duration"], errors="coerce")
+    whole = secs.fillna(0).astype(np.int64)
+    h, rem = whole // 3600, whole % 3600
+    m, sec = (rem // 60).astype(str), (rem % 60).astype(str).str.zfill(2)
+    time_str = (
+        pd.Series(
+            np.where(h > 0, h.astype(str) + ":" + m.str.zfill(2), m),
+            index=fields.index,
+        )
+        + ":"
+        + sec
+    ).where(secs.notna(), "")
+    rows = (
+        fields["title"]
+        .astype(str)
+        .str.cat(
+            [fields["artist"].astype(str), fields["album"].astype(str), time_str],
+            sep="\t",
+        )
+    )
+    header = "\t".join(["Name", "Artist", "Album", "Time"])
+    payload = "\n".join([header, *rows])
+    # Explicit little-endian BOM + body, matching what Apple Music writes
+    return codecs.BOM_UTF16_LE + payload.encode("utf-16-le", errors="replace")
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _audit_frames(token: str, _res) -> Dict[str, pd.DataFrame]:
+    """Present/review/missing tables for a playlist audit result."""
+    return {bucket: pd.DataFrame(columns) for bucket, columns in _res.items()}
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _audit_indices(library_token: str, _library: Library):
+    """Playlist-audit lookup indices, built once per library version.
+
+    Shared read-only, so threshold or option changes re-audit without
+    re-indexing the library.
+    """
+    return build_indices(_library.music_tracks)
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=600)
+def _cached_audit(
+    data_bytes: bytes,
+    library_token: str,
+    enable_album: bool,
+    enable_duration: bool,
+    present_threshold: float,
+    review_threshold: float,
+    _library: Library,
+) -> Optional[Dict[str, Dict[str, List[Any]]]]:
+    """Parse and audit a playlist; None when no tracks could be parsed.
+
+    Keyed on the playlist bytes, the library's cache token and the audit
+    settings, so re-running an unchanged audit skips parsing and matching.
+    """
+    items = parse_playlist_bytes(data_bytes)
+    if not items:
+        return None
+    return audit_playlist(
+        items,
+        _library,
+        enable_album=enable_album,
+        enable_duration=enable_duration,
+        present_threshold=present_threshold,
+        review_threshold=review_threshold,
+        indices=_audit_indices(library_token, _library),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _audit_download(token: str, kind: str, _frames) -> bytes:
+    """Bytes for one playlist-audit download.
+
+    `kind` is a bucket name (CSV of that table) or, for the missing tracks,
+    "apple" (Apple Music text playlist) or "soundiiz" (Soundiiz CSV).
+    """
+    if kind in _frames:
+        return _csv_bytes(_frames[kind])
+    fields = _playlist_fields(_frames["missing"])
+    if kind == "apple":
+        return _apple_music_txt(fields)
+    return _csv_bytes(
+        fields[["title", "artist", "album", "isrc", "duration"]].set_axis(
+            ["Title", "Artist", "Album", "ISRC", "Duration"], axis=1
+        )
+    )
+
+
 def render_playlist_audit_tab():
     """Render the Playlist Audit tool."""
     st.header("📝 Playlist Audit against Library")
@@ -2260,160 +2869,331 @@ def render_playlist_audit_tab():
             return
         with st.spinner("Parsing and auditing playlist..."):
             try:
-                items = parse_playlist_bytes(data_bytes)
-                if not items:
+                res = _cached_audit(
+                    data_bytes,
+                    _cache_token(f"library_{lib_choice}"),
+                    enable_album,
+                    enable_duration,
+                    present_threshold,
+                    review_threshold,
+                    SessionManager.get_library(lib_choice),
+                )
+                if res is None:
                     st.error("Could not parse any tracks from the playlist file.")
                     return
-                lib = SessionManager.get_library(lib_choice)
-                res = audit_playlist(
-                    items,
-                    lib,
-                    enable_album=enable_album,
-                    enable_duration=enable_duration,
-                    present_threshold=present_threshold,
-                    review_threshold=review_threshold,
-                )
             except Exception as e:
                 st.error(f"Audit failed: {e}")
                 return
 
-        # Summary
-        st.success("✅ Audit complete")
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.metric("Present", f"{len(res['present']):,}")
-        with c2:
-            st.metric("Review", f"{len(res['review']):,}")
-        with c3:
-            st.metric("Missing", f"{len(res['missing']):,}")
+            st.session_state.playlist_audit_results = res
+            _refresh_cache_token("playlist_audit")
 
-        # Tables and downloads
-        tabs = st.tabs(["✅ Present", "🧐 Review", "❌ Missing"])
-        import pandas as pd
+    # Results persist across reruns so downloads and enrichment keep them
+    res = st.session_state.playlist_audit_results
+    if not res:
+        return
+    frames = _audit_frames(_cache_token("playlist_audit"), res)
 
-        with tabs[0]:
-            df = pd.DataFrame(res["present"])
-            st.dataframe(df, use_container_width=True)
-            st.download_button(
-                "📥 Download Present CSV",
-                df.to_csv(index=False),
-                file_name="playlist_present.csv",
-            )
-        with tabs[1]:
-            df = pd.DataFrame(res["review"])
-            st.dataframe(df, use_container_width=True)
-            st.download_button(
-                "📥 Download Review CSV",
-                df.to_csv(index=False),
-                file_name="playlist_review.csv",
-            )
-        with tabs[2]:
-            df = pd.DataFrame(res["missing"])
-            st.dataframe(df, use_container_width=True)
+    # Summary
+    st.success("✅ Audit complete")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.metric("Present", f"{len(frames['present']):,}")
+    with c2:
+        st.metric("Review", f"{len(frames['review']):,}")
+    with c3:
+        st.metric("Missing", f"{len(frames['missing']):,}")
+
+    # Tables and downloads; export bytes are only built when requested
+    token = _cache_token("playlist_audit")
+
+    def download(label: str, kind: str, file_name: str, mime: str) -> None:
+        build = functools.partial(_audit_download, token, kind, frames)
+        st.download_button(
+            label,
+            build if _DEFERRED_DOWNLOADS else build(),
+            file_name=file_name,
+            mime=mime,
+        )
+
+    tabs = st.tabs(["✅ Present", "🧐 Review", "❌ Missing"])
+    with tabs[0]:
+        df = frames["present"]
+        st.dataframe(_paginate(df, "audit_present"), use_container_width=True)
+        download(
+            "📥 Download Present CSV", "present", "playlist_present.csv", "text/csv"
+        )
+    with tabs[1]:
+        df = frames["review"]
+        st.dataframe(_paginate(df, "audit_review"), use_container_width=True)
+        download("📥 Download Review CSV", "review", "playlist_review.csv", "text/csv")
+    with tabs[2]:
+        df = frames["missing"]
+        st.dataframe(_paginate(df, "audit_missing"), use_container_width=True)
+        download(
+            "📥 Download Missing CSV", "missing", "playlist_missing.csv", "text/csv"
+        )
+        # Apple Music text playlist export (UTF-16 TSV: Name, Artist, Album, Time)
+        download(
+            "📥 Download Apple Music Text (.txt)",
+            "apple",
+            "playlist_missing_apple.txt",
+            "text/plain",
+        )
+        # Soundiiz-friendly CSV (Title, Artist, Album, ISRC, Duration)
+        download(
+            "📥 Download Soundiiz CSV",
+            "soundiiz",
+            "playlist_missing_soundiiz.csv",
+            "text/csv",
+        )
+        # Optional: Enrich with MusicBrainz to include ISRC codes
+        st.markdown("---")
+        if EnrichmentManager is not None and st.button(
+            "🔎 Enrich Missing with MusicBrainz (add ISRC)"
+        ):
+            with st.spinner("Querying MusicBrainz for ISRCs (rate-limited)..."):
+                mgr = st.session_state.enrichment_manager
+                from musicweb.core.models import Track
+
+                fields = _playlist_fields(df)
+                tracks = [
+                    Track(
+                        title=str(row.title),
+                        artist=str(row.artist),
+                        album=str(row.album) if row.album else None,
+                        duration=int(row.dur) if pd.notna(row.dur) else None,
+                    )
+                    for row in fields.assign(
+                        dur=pd.to_numeric(fields["duration"], errors="coerce")
+                    ).itertuples(index=False)
+                ]
+                enriched = mgr.bulk_enrich(tracks, max_workers=_MB_LOOKUP_WORKERS)
+            # Build ISRC-enriched Soundiiz CSV
+            enr_rows = []
+            for enhanced_track, _data in enriched:
+                enr_rows.append(
+                    {
+                        "Title": enhanced_track.title,
+                        "Artist": enhanced_track.artist,
+                        "Album": enhanced_track.album or "",
+                        "ISRC": enhanced_track.isrc or "",
+                        "Duration": enhanced_track.duration or "",
+                    }
+                )
+            enr_df = pd.DataFrame(enr_rows)
+            st.success("✅ Enrichment complete — download enhanced CSV below")
             st.download_button(
-                "📥 Download Missing CSV",
-                df.to_csv(index=False),
-                file_name="playlist_missing.csv",
+                "📥 Download Soundiiz CSV (with ISRC)",
+                _csv_bytes(enr_df),
+                file_name="playlist_missing_soundiiz_enriched.csv",
+                mime="text/csv",
             )
 
-            # Apple Music text playlist export (UTF-16 TSV: Name, Artist, Album, Time)
-            def _sec_to_time(x):
-                try:
-                    s = int(float(x))
-                except Exception:
-                    return ""
-                h, rem = divmod(s, 3600)
-                m, ss = divmod(rem, 60)
-                return f"{h}:{m:02d}:{ss:02d}" if h else f"{m}:{ss:02d}"
-
-            header = ["Name", "Artist", "Album", "Time"]
-            lines = ["\t".join(header)]
-            for _, r in df.iterrows():
-                title = str(r.get("playlist_title") or r.get("title") or "")
-                artist = str(r.get("playlist_artist") or r.get("artist") or "")
-                album = str(r.get("playlist_album") or r.get("album") or "")
-                dur = r.get("playlist_duration") or r.get("duration") or ""
-                time_str = _sec_to_time(dur)
-                lines.append("\t".join([title, artist, album, time_str]))
-            txt_bytes = ("\n".join(lines)).encode("utf-16")
-            st.download_button(
-                "📥 Download Apple Music Text (.txt)",
-                data=txt_bytes,
-                file_name="playlist_missing_apple.txt",
-                mime="text/plain",
+
+_DUPLICATE_DEFAULTS = {
+    "id": "",
+    "title": "",
+    "album": "",
+    "duration": "",
+    "quality": "",
+    "quality_score": "",
+    "thumbnail": "",
+}
+
+
+# Thumbnails render at 48-64px; ~2x that keeps them sharp on HiDPI screens
+_THUMB_MIN_WIDTH = 120
+
+
+def _small_thumbnail(thumbnails: List[Dict[str, Any]], fallback: str) -> str:
+    """Smallest thumbnail variant at least `_THUMB_MIN_WIDTH` wide."""
+    sized = [t for t in thumbnails or [] if t.get("url") and t.get("width")]
+    wide = [t for t in sized if t["width"] >= _THUMB_MIN_WIDTH]
+    if wide:
+        return min(wide, key=lambda t: t["width"])["url"]
+    return fallback
+
+
+# Size suffix on googleusercontent artwork, and the larger i.ytimg.com variants
+# (their signed query string only fits the original variant, so it is dropped)
+_GOOGLE_THUMB_SIZE = re.compile(r"=w\d+-h\d+[^/=]*$")
+_YTIMG_LARGE_THUMB = re.compile(r"/(?:maxres|sd|hq|mq)default(\.\w+)(?:\?.*)?$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _thumb_url(url: str) -> str:
+    """`url` rewritten to a variant about `_THUMB_MIN_WIDTH` px wide."""
+    if not url:
+        return url
+    if _GOOGLE_THUMB_SIZE.search(url):
+        size = _THUMB_MIN_WIDTH
+        return _GOOGLE_THUMB_SIZE.sub(f"=w{size}-h{size}-l90-rj", url)
+    return _YTIMG_LARGE_THUMB.sub(r"/default\1", url)
+
+
+def _normalize_duplicate(d) -> Dict[str, Any]:
+    """Plain-dict view of a `RankedDuplicate` (or report dict), defaults filled."""
+    src = d if isinstance(d, dict) else vars(d)
+    out = dict(src)
+    for key, default in _DUPLICATE_DEFAULTS.items():
+        out[key] = src.get(key) or default
+    # The ranker keeps the largest variant; the browser only needs a small one
+    raw = src.get("original_data") or {}
+    out["thumbnail"] = _small_thumbnail(raw.get("thumbnails"), out["thumbnail"])
+    out["artists"] = list(src.get("artists") or [])
+    out["is_explicit"] = bool(src.get("is_explicit"))
+    return out
+
+
+def _normalize_group(group: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a duplicate group whose entries are normalized dicts.
+
+    Also records the preferred entry when explicit versions are favoured
+    (the first explicit one, else the top-ranked).
+    """
+    dups = [_normalize_duplicate(d) for d in group["duplicates"]]
+    return {
+        **group,
+        "duplicates": dups,
+        "pref_idx_explicit": next(
+            (i for i, d in enumerate(dups) if d["is_explicit"]), 0
+        ),
+    }
+
+
+_DEDUP_EXPORT_COLUMNS = [
+    "Group ID",
+    "Group Title",
+    "Group Artist",
+    "Preferred",
+    "Title",
+    "Artists",
+    "Album",
+    "Duration",
+    "Explicit",
+    "Quality",
+    "Quality Score",
+    "Video ID",
+    "Thumbnail",
+    "URL",
+]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _dedup_frame(token: str, _groups) -> pd.DataFrame:
+    """Every entry of a deduplication scan as one flat table."""
+    frame = pd.DataFrame.from_records(
+        [
+            (
+                g["id"],
+                g["title"],
+                g["artist"],
+                idx,
+                g["pref_idx_explicit"],
+                d["title"],
+                ", ".join(d["artists"]),
+                d["album"],
+                d["duration"],
+                d["is_explicit"],
+                d["quality"],
+                d["quality_score"],
+                d["id"],
+                d["thumbnail"],
             )
-            # Soundiiz-friendly CSV (Title, Artist, Album, ISRC, Duration)
-            szi_cols = {
-                "Title": df.get(
-                    "playlist_title", df.get("title", pd.Series(dtype=str))
-                ).fillna(""),
-                "Artist": df.get(
-                    "playlist_artist", df.get("artist", pd.Series(dtype=str))
-                ).fillna(""),
-                "Album": df.get(
-                    "playlist_album", df.get("album", pd.Series(dtype=str))
-                ).fillna(""),
-                "ISRC": df.get("isrc", pd.Series(dtype=str)).fillna(""),
-                "Duration": df.get(
-                    "playlist_duration", df.get("duration", pd.Series(dtype=str))
-                ).fillna(""),
+            for g in _groups
+            for idx, d in enumerate(g["duplicates"])
+        ],
+        columns=[
+            "Group ID",
+            "Group Title",
+            "Group Artist",
+            "dup_idx",
+            "pref_idx_explicit",
+            "Title",
+            "Artists",
+            "Album",
+            "Duration",
+            "Explicit",
+            "Quality",
+            "Quality Score",
+            "Video ID",
+            "Thumbnail",
+        ],
+    )
+    vids = frame["Video ID"].astype(str)
+    frame["URL"] = ("https://music.youtube.com/watch?v=" + vids).where(vids != "", "")
+    return frame
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _dedup_export(
+    token: str,
+    group_ids: Tuple[int, ...],
+    prefer_explicit: bool,
+    winners: bool,
+    _groups,
+) -> pd.DataFrame:
+    """Winners (preferred entry) or losers (the rest) of the selected groups.
+
+    `_groups` is the whole scan for `token`, never a selection: the flat
+    frame is cached per token and `group_ids` picks the groups out of it.
+    """
+    frame = _dedup_frame(token, _groups)
+    frame = frame[frame["Group ID"].isin(group_ids).to_numpy()]
+    pref = frame["pref_idx_explicit"].to_numpy() if prefer_explicit else 0
+    is_pref = frame["dup_idx"].to_numpy() == pref
+    frame = frame[is_pref if winners else ~is_pref].assign(Preferred=winners)
+    return frame[_DEDUP_EXPORT_COLUMNS].reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _dedup_export_csv(
+    token: str,
+    group_ids: Tuple[int, ...],
+    prefer_explicit: bool,
+    winners: bool,
+    _groups,
+) -> bytes:
+    """CSV bytes of `_dedup_export`, cached so reruns skip serialization."""
+    return _csv_bytes(
+        _dedup_export(token, group_ids, prefer_explicit, winners, _groups)
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _dedup_groups_table(token: str, _groups) -> pd.DataFrame:
+    """One summary row per duplicate group."""
+    table_rows = []
+    for g in _groups:
+        dups = g["duplicates"]
+        table_rows.append(
+            {
+                "Group ID": g["id"],
+                "Title": g["title"],
+                "Artist": g["artist"],
+                "Duplicates": len(dups),
+                "Top Quality": dups[0]["quality"],
             }
-            szi_df = pd.DataFrame(szi_cols)
-            st.download_button(
-                "📥 Download Soundiiz CSV",
-                szi_df.to_csv(index=False),
-                file_name="playlist_missing_soundiiz.csv",
-                mime="text/csv",
-            )
-            # Optional: Enrich with MusicBrainz to include ISRC codes
-            st.markdown("---")
-            if EnrichmentManager is not None and st.button(
-                "🔎 Enrich Missing with MusicBrainz (add ISRC)"
-            ):
-                with st.spinner("Querying MusicBrainz for ISRCs (rate-limited)..."):
-                    mgr = EnrichmentManager()
-                    from musicweb.core.models import Track
-
-                    tracks = []
-                    for _, r in df.iterrows():
-                        title = r.get("playlist_title") or r.get("title") or ""
-                        artist = r.get("playlist_artist") or r.get("artist") or ""
-                        album = r.get("playlist_album") or r.get("album") or ""
-                        dur = r.get("playlist_duration") or r.get("duration") or ""
-                        try:
-                            duration = (
-                                int(float(dur)) if dur not in (None, "") else None
-                            )
-                        except Exception:
-                            duration = None
-                        t = Track(
-                            title=str(title),
-                            artist=str(artist),
-                            album=str(album) if album else None,
-                            duration=duration,
-                        )
-                        tracks.append(t)
-                    enriched = mgr.bulk_enrich(tracks)
-                # Build ISRC-enriched Soundiiz CSV
-                enr_rows = []
-                for enhanced_track, _data in enriched:
-                    enr_rows.append(
-                        {
-                            "Title": enhanced_track.title,
-                            "Artist": enhanced_track.artist,
-                            "Album": enhanced_track.album or "",
-                            "ISRC": enhanced_track.isrc or "",
-                            "Duration": enhanced_track.duration or "",
-                        }
-                    )
-                enr_df = pd.DataFrame(enr_rows)
-                st.success("✅ Enrichment complete — download enhanced CSV below")
-                st.download_button(
-                    "📥 Download Soundiiz CSV (with ISRC)",
-                    enr_df.to_csv(index=False),
-                    file_name="playlist_missing_soundiiz_enriched.csv",
-                    mime="text/csv",
-                )
+        )
+    return pd.DataFrame(table_rows)
+
+
+def _cleanup_plan_index(groups, plan) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+    """Video metadata by id and loser id -> group id for the plan preview."""
+    video_meta = {
+        d["id"]: {
+            "title": d["title"],
+            "artists": d["artists"],
+            "thumb": d["thumbnail"],
+            "explicit": d["is_explicit"],
+        }
+        for g in groups
+        for d in g["duplicates"]
+        if d["id"]
+    }
+    loser_to_gid = {v: gid for gid, vids in plan.losers_by_group.items() for v in vids}
+    return video_meta, loser_to_gid
 
 
 def render_dedup_tab():
@@ -2499,17 +3279,24 @@ def render_dedup_tab():
     if st.button("🔎 Scan for Duplicates", type="primary"):
         with st.spinner("Fetching library and scanning for duplicates..."):
             try:
-                total = len(dedup.get_library_songs(limit=limit))
-                groups = dedup.find_duplicates(similarity_threshold=threshold)
+                # One library fetch feeds both the count and the scan
+                songs = dedup.get_library_songs(limit=limit)
+                total = len(songs)
+                groups = dedup.find_duplicates(
+                    similarity_threshold=threshold, songs=songs
+                )
                 # Compute summary
                 total_dup_tracks = sum(len(g["duplicates"]) for g in groups)
                 can_remove = sum(len(g["duplicates"]) - 1 for g in groups)
                 st.session_state.ytm_dedup_results = {
-                    "groups": groups,
+                    # Normalized once so reruns read plain dict fields
+                    "groups": [_normalize_group(g) for g in groups],
                     "total_songs": total,
                     "total_duplicates": total_dup_tracks,
                     "can_remove": can_remove,
                 }
+                _refresh_cache_token("ytm_dedup")
+                st.session_state.pop("ytm_cleanup_plan", None)
                 st.success("✅ Scan complete")
             except Exception as e:
                 st.error(f"Scan failed: {e}")
@@ -2528,24 +3315,11 @@ def render_dedup_tab():
             st.metric("Potential Removals", f"{results['can_remove']:,}")
 
         # Group details table
-        table_rows = []
-        for g in results["groups"]:
-            dups = g["duplicates"]
-            top = dups[0]
-            # top can be dataclass RankedDuplicate or dict if coming from JSON
-            top_quality = getattr(top, "quality", None) or (
-                top.get("quality") if isinstance(top, dict) else ""
-            )
-            table_rows.append(
-                {
-                    "Group ID": g["id"],
-                    "Title": g["title"],
-                    "Artist": g["artist"],
-                    "Duplicates": len(dups),
-                    "Top Quality": top_quality,
-                }
-            )
-        st.dataframe(pd.DataFrame(table_rows), use_container_width=True)
+        token = _cache_token("ytm_dedup")
+        st.dataframe(
+            _paginate(_dedup_groups_table(token, results["groups"]), "dedup_groups"),
+            use_container_width=True,
+        )
 
         st.markdown("---")
         st.subheader("🧩 Select Groups to Include")
@@ -2564,91 +3338,60 @@ def render_dedup_tab():
                     st.session_state[f"ytm_dedup_group_{gid}"] = False
                 st.session_state.ytm_dedup_selected_group_ids = []
 
-        # Render per-row checkboxes
+        # Per-row checkboxes are batched in a form so ticking boxes does not
+        # rerun the script until the selection is applied
         current_sel_ids = set(st.session_state.get("ytm_dedup_selected_group_ids", []))
-        for g in results["groups"]:
-            gid = g["id"]
-            top = g["duplicates"][0]
-            top_quality = getattr(top, "quality", None) or (
-                top.get("quality") if isinstance(top, dict) else ""
-            )
-            default_checked = st.session_state.get(
-                f"ytm_dedup_group_{gid}",
-                (gid in current_sel_ids) or (len(current_sel_ids) == 0),
-            )
-            checked = st.checkbox(
-                f"Group {gid}: {g['title']} — {g['artist']} ({len(g['duplicates'])} dups, top: {top_quality})",
-                key=f"ytm_dedup_group_{gid}",
-                value=default_checked,
-            )
-            with st.expander(f"Details for Group {gid}"):
-                # Determine preferred index based on preference
-                pref_idx = 0
-                if prefer_explicit:
-                    try:
-                        pref_idx = [
-                            (
-                                getattr(d, "is_explicit", None)
-                                or (
-                                    d.get("is_explicit")
-                                    if isinstance(d, dict)
-                                    else False
-                                )
+        with st.form("ytm_dedup_group_form"):
+            for g in results["groups"]:
+                gid = g["id"]
+                top_quality = g["duplicates"][0]["quality"]
+                default_checked = st.session_state.get(
+                    f"ytm_dedup_group_{gid}",
+                    (gid in current_sel_ids) or (len(current_sel_ids) == 0),
+                )
+                checked = st.checkbox(
+                    f"Group {gid}: {g['title']} — {g['artist']} ({len(g['duplicates'])} dups, top: {top_quality})",
+                    key=f"ytm_dedup_group_{gid}",
+                    value=default_checked,
+                )
+                with st.expander(f"Details for Group {gid}"):
+                    pref_idx = g["pref_idx_explicit"] if prefer_explicit else 0
+                    for idx, d in enumerate(g["duplicates"], start=1):
+                        title = d["title"]
+                        artists = d["artists"]
+                        album = d["album"]
+                        duration = d["duration"]
+                        quality = d["quality"]
+                        qscore = d["quality_score"]
+                        is_explicit = d["is_explicit"]
+                        thumb = d["thumbnail"]
+
+                        cimg, cinfo = st.columns([1, 5])
+                        with cimg:
+                            if thumb:
+                                st.image(thumb, width=64)
+                            else:
+                                st.write("")
+                        with cinfo:
+                            preferred_flag = (
+                                " (Preferred)" if (idx - 1) == pref_idx else ""
                             )
-                            for d in g["duplicates"]
-                        ].index(True)
-                    except ValueError:
-                        pref_idx = 0
-                for idx, d in enumerate(g["duplicates"], start=1):
-                    # Support both dataclass and dict entries
-                    title = getattr(d, "title", None) or (
-                        d.get("title") if isinstance(d, dict) else ""
-                    )
-                    artists = getattr(d, "artists", None) or (
-                        d.get("artists") if isinstance(d, dict) else []
-                    )
-                    album = getattr(d, "album", None) or (
-                        d.get("album") if isinstance(d, dict) else ""
-                    )
-                    duration = getattr(d, "duration", None) or (
-                        d.get("duration") if isinstance(d, dict) else ""
-                    )
-                    quality = getattr(d, "quality", None) or (
-                        d.get("quality") if isinstance(d, dict) else ""
-                    )
-                    qscore = getattr(d, "quality_score", None) or (
-                        d.get("quality_score") if isinstance(d, dict) else ""
-                    )
-                    is_explicit = getattr(d, "is_explicit", None) or (
-                        d.get("is_explicit") if isinstance(d, dict) else False
-                    )
-                    thumb = getattr(d, "thumbnail", None) or (
-                        d.get("thumbnail") if isinstance(d, dict) else ""
-                    )
-
-                    cimg, cinfo = st.columns([1, 5])
-                    with cimg:
-                        if thumb:
-                            st.image(thumb, width=64)
-                        else:
-                            st.write("")
-                    with cinfo:
-                        preferred_flag = " (Preferred)" if (idx - 1) == pref_idx else ""
-                        explicit_flag = " | Explicit" if is_explicit else ""
-                        # Inclusion label based on mode
-                        if winners_only:
-                            included = (idx - 1) == pref_idx
-                        elif losers_only:
-                            included = (idx - 1) != pref_idx
-                        else:
-                            included = True
-                        include_flag = " | Included" if included else " | Excluded"
-                        st.write(
-                            f"{idx}. {title} — {', '.join(artists)}{preferred_flag}{explicit_flag}{include_flag}"
-                        )
-                        st.caption(
-                            f"Album: {album} | Duration: {duration} | Quality: {quality} ({qscore})"
-                        )
+                            explicit_flag = " | Explicit" if is_explicit else ""
+                            # Inclusion label based on mode
+                            if winners_only:
+                                included = (idx - 1) == pref_idx
+                            elif losers_only:
+                                included = (idx - 1) != pref_idx
+                            else:
+                                included = True
+                            include_flag = " | Included" if included else " | Excluded"
+                            st.write(
+                                f"{idx}. {title} — {', '.join(artists)}{preferred_flag}{explicit_flag}{include_flag}"
+                            )
+                            st.caption(
+                                f"Album: {album} | Duration: {duration} | Quality: {quality} ({qscore})"
+                            )
+            st.form_submit_button("Apply selection")
         # Gather selection
         selected_ids = [
             gid
@@ -2659,34 +3402,31 @@ def render_dedup_tab():
 
         # Export JSON
         if st.button("📥 Download JSON Report"):
-            serializable = []
-            for g in results["groups"]:
-                serializable.append(
+            # Groups are already plain dicts (see _normalize_group)
+            report = {
+                "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "total_songs": results["total_songs"],
+                "duplicate_groups": len(results["groups"]),
+                "total_duplicates": results["total_duplicates"],
+                "can_remove": results["can_remove"],
+                "groups": [
                     {
                         "id": g["id"],
                         "title": g["title"],
                         "artist": g["artist"],
                         "similarity_scores": g["similarity_scores"],
-                        "duplicates": [
-                            (d.__dict__ if hasattr(d, "__dict__") else d)
-                            for d in g["duplicates"]
-                        ],
+                        "duplicates": g["duplicates"],
                     }
-                )
-            json_str = json.dumps(
-                {
-                    "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "total_songs": results["total_songs"],
-                    "duplicate_groups": len(results["groups"]),
-                    "total_duplicates": results["total_duplicates"],
-                    "can_remove": results["can_remove"],
-                    "groups": serializable,
-                },
-                indent=2,
-            )
+                    for g in results["groups"]
+                ],
+            }
+            if HAVE_ORJSON:
+                json_bytes = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            else:
+                json_bytes = json.dumps(report, indent=2).encode("utf-8")
             st.download_button(
                 "📥 Save Report",
-                json_str,
+                json_bytes,
                 file_name=f"ytm_duplicates_{int(time.time())}.json",
                 mime="application/json",
             )
@@ -2702,105 +3442,29 @@ def render_dedup_tab():
             results["groups"], st.session_state.get("ytm_dedup_selected_group_ids")
         )
 
-        def extract_rows(groups, prefer_explicit_flag, winners):
-            rows = []
-            for g in groups:
-                # determine preferred index
-                pref_idx = 0
-                if prefer_explicit_flag:
-                    try:
-                        pref_idx = [
-                            (
-                                getattr(d, "is_explicit", None)
-                                or (
-                                    d.get("is_explicit")
-                                    if isinstance(d, dict)
-                                    else False
-                                )
-                            )
-                            for d in g["duplicates"]
-                        ].index(True)
-                    except ValueError:
-                        pref_idx = 0
-                for idx, d in enumerate(g["duplicates"]):
-                    is_pref = idx == pref_idx
-                    include = is_pref if winners else (idx != pref_idx)
-                    if not include:
-                        continue
-                    title = getattr(d, "title", None) or (
-                        d.get("title") if isinstance(d, dict) else ""
-                    )
-                    artists = getattr(d, "artists", None) or (
-                        d.get("artists") if isinstance(d, dict) else []
-                    )
-                    album = getattr(d, "album", None) or (
-                        d.get("album") if isinstance(d, dict) else ""
-                    )
-                    duration = getattr(d, "duration", None) or (
-                        d.get("duration") if isinstance(d, dict) else ""
-                    )
-                    quality = getattr(d, "quality", None) or (
-                        d.get("quality") if isinstance(d, dict) else ""
-                    )
-                    qscore = getattr(d, "quality_score", None) or (
-                        d.get("quality_score") if isinstance(d, dict) else ""
-                    )
-                    is_explicit = getattr(d, "is_explicit", None) or (
-                        d.get("is_explicit") if isinstance(d, dict) else False
-                    )
-                    thumb = getattr(d, "thumbnail", None) or (
-                        d.get("thumbnail") if isinstance(d, dict) else ""
-                    )
-                    vid = getattr(d, "id", None) or (
-                        d.get("id") if isinstance(d, dict) else ""
-                    )
-                    rows.append(
-                        {
-                            "Group ID": g["id"],
-                            "Group Title": g["title"],
-                            "Group Artist": g["artist"],
-                            "Preferred": is_pref,
-                            "Title": title,
-                            "Artists": (
-                                ", ".join(artists)
-                                if isinstance(artists, list)
-                                else str(artists)
-                            ),
-                            "Album": album,
-                            "Duration": duration,
-                            "Explicit": bool(is_explicit),
-                            "Quality": quality,
-                            "Quality Score": qscore,
-                            "Video ID": vid,
-                            "Thumbnail": thumb,
-                            "URL": (
-                                f"https://music.youtube.com/watch?v={vid}"
-                                if vid
-                                else ""
-                            ),
-                        }
-                    )
-            return rows
-
+        # Every group has a winner and at least one loser, so a non-empty
+        # subset always yields both files; they are only built when clicked
+        subset_ids = tuple(g["id"] for g in subset)
         col_csv1, col_csv2 = st.columns(2)
-        with col_csv1:
-            winners_rows = extract_rows(subset, prefer_explicit, winners=True)
-            if winners_rows:
-                winners_df = pd.DataFrame(winners_rows)
-                st.download_button(
-                    "📥 Download Winners CSV",
-                    winners_df.to_csv(index=False),
-                    file_name=f"ytm_winners_{int(time.time())}.csv",
-                    mime="text/csv",
-                )
-        with col_csv2:
-            losers_rows = extract_rows(subset, prefer_explicit, winners=False)
-            if losers_rows:
-                losers_df = pd.DataFrame(losers_rows)
+        for col, winners, label, stem in (
+            (col_csv1, True, "📥 Download Winners CSV", "ytm_winners"),
+            (col_csv2, False, "📥 Download Losers CSV", "ytm_losers"),
+        ):
+            if not subset:
+                continue
+            build = functools.partial(
+                _dedup_export_csv,
+                token,
+                subset_ids,
+                prefer_explicit,
+                winners,
+                results["groups"],
+            )
+            with col:
                 st.download_button(
-                    "📥 Download Losers CSV",
-                    losers_df.to_csv(index=False),
-                    file_name=f"ytm_losers_{int(time.time())}.csv",
+                    label,
+                    build if _DEFERRED_DOWNLOADS else build(),
+                    file_name=f"{stem}_{int(time.time())}.csv",
                     mime="text/csv",
                 )
 
@@ -2828,121 +3492,74 @@ def render_dedup_tab():
                         unlike_losers=unlike_losers,
                     )
                     st.session_state["ytm_cleanup_plan"] = plan
-                    # Summary
-                    affected_playlists = len(
-                        [
-                            e
-                            for e in plan.playlist_edits
-                            if e.remove_items or e.add_video_ids
-                        ]
-                    )
-                    total_removes = sum(
-                        len(e.remove_items) for e in plan.playlist_edits
+                    # Preview lookups are built once per plan, not per rerun
+                    st.session_state["ytm_cleanup_plan_index"] = _cleanup_plan_index(
+                        results["groups"], plan
                     )
-                    total_adds = sum(len(e.add_video_ids) for e in plan.playlist_edits)
-                    st.success("✅ Cleanup plan ready")
-                    colp1, colp2, colp3 = st.columns(3)
-                    with colp1:
-                        st.metric("Will Unlike", len(plan.unlike_video_ids))
-                    with colp2:
-                        st.metric("Playlists Affected", affected_playlists)
-                    with colp3:
-                        st.metric("Adds/Removes", f"{total_adds} / {total_removes}")
-
-                    # Verify Plan (preview replacements)
-                    with st.expander("🔎 Verify Plan (preview replacements)"):
-                        # Build quick lookup maps
-                        video_meta = {}
-                        for g in results["groups"]:
-                            for d in g["duplicates"]:
-                                vid = getattr(d, "id", None) or (
-                                    d.get("id") if isinstance(d, dict) else ""
-                                )
-                                if not vid:
-                                    continue
-                                video_meta[vid] = {
-                                    "title": getattr(d, "title", None)
-                                    or (d.get("title") if isinstance(d, dict) else ""),
-                                    "artists": getattr(d, "artists", None)
-                                    or (
-                                        d.get("artists") if isinstance(d, dict) else []
-                                    ),
-                                    "thumb": getattr(d, "thumbnail", None)
-                                    or (
-                                        d.get("thumbnail")
-                                        if isinstance(d, dict)
-                                        else ""
-                                    ),
-                                    "explicit": bool(
-                                        getattr(d, "is_explicit", None)
-                                        or (
-                                            d.get("is_explicit")
-                                            if isinstance(d, dict)
-                                            else False
-                                        )
-                                    ),
-                                }
-
-                        # Reverse map losers -> group id for quick winner lookup
-                        loser_to_gid = {}
-                        for gid, vids in plan.losers_by_group.items():
-                            for v in vids:
-                                loser_to_gid[v] = gid
-
-                        # Show playlists with expandable full replacement list
-                        expand_all = st.checkbox("Expand all playlists", value=False)
-                        for edit in plan.playlist_edits:
-                            if not (edit.remove_items or edit.add_video_ids):
-                                continue
-                            count = len(edit.remove_items)
-                            with st.expander(
-                                f"🎶 {edit.playlist_name} — {count} replacement(s)",
-                                expanded=expand_all,
-                            ):
-                                for item in edit.remove_items:
-                                    loser_vid = item.get("videoId")
-                                    gid = loser_to_gid.get(loser_vid)
-                                    winner_vid = (
-                                        plan.winners_by_group.get(gid)
-                                        if gid is not None
-                                        else None
-                                    )
-                                    lmeta = video_meta.get(loser_vid, {})
-                                    wmeta = (
-                                        video_meta.get(winner_vid, {})
-                                        if winner_vid
-                                        else {}
-                                    )
-                                    col_l, col_arrow, col_w = st.columns([4, 1, 4])
-                                    with col_l:
-                                        if lmeta.get("thumb"):
-                                            st.image(lmeta["thumb"], width=48)
-                                        title = lmeta.get("title", "")
-                                        artists = ", ".join(lmeta.get("artists") or [])
-                                        eflag = (
-                                            " (Explicit)"
-                                            if lmeta.get("explicit")
-                                            else ""
-                                        )
-                                        st.write(f"❌ {title}{eflag}")
-                                        st.caption(artists)
-                                    with col_arrow:
-                                        st.write("➡️")
-                                    with col_w:
-                                        if wmeta.get("thumb"):
-                                            st.image(wmeta["thumb"], width=48)
-                                        title = wmeta.get("title", "")
-                                        artists = ", ".join(wmeta.get("artists") or [])
-                                        eflag = (
-                                            " (Explicit)"
-                                            if wmeta.get("explicit")
-                                            else ""
-                                        )
-                                        st.write(f"✅ {title}{eflag}")
-                                        st.caption(artists)
                 except Exception as e:
                     st.error(f"Failed to generate cleanup plan: {e}")
 
+        # The plan persists so the preview survives reruns (e.g. "Expand all")
+        plan = st.session_state.get("ytm_cleanup_plan")
+        if plan is not None:
+            video_meta, loser_to_gid = st.session_state["ytm_cleanup_plan_index"]
+            # Summary
+            affected_playlists = len(
+                [e for e in plan.playlist_edits if e.remove_items or e.add_video_ids]
+            )
+            total_removes = sum(len(e.remove_items) for e in plan.playlist_edits)
+            total_adds = sum(len(e.add_video_ids) for e in plan.playlist_edits)
+            st.success("✅ Cleanup plan ready")
+            colp1, colp2, colp3 = st.columns(3)
+            with colp1:
+                st.metric("Will Unlike", len(plan.unlike_video_ids))
+            with colp2:
+                st.metric("Playlists Affected", affected_playlists)
+            with colp3:
+                st.metric("Adds/Removes", f"{total_adds} / {total_removes}")
+
+            # Verify Plan (preview replacements)
+            with st.expander("🔎 Verify Plan (preview replacements)"):
+                # Show playlists with expandable full replacement list
+                expand_all = st.checkbox("Expand all playlists", value=False)
+                for edit in plan.playlist_edits:
+                    if not (edit.remove_items or edit.add_video_ids):
+                        continue
+                    count = len(edit.remove_items)
+                    with st.expander(
+                        f"🎶 {edit.playlist_name} — {count} replacement(s)",
+                        expanded=expand_all,
+                    ):
+                        for item in edit.remove_items:
+                            loser_vid = item.get("videoId")
+                            gid = loser_to_gid.get(loser_vid)
+                            winner_vid = (
+                                plan.winners_by_group.get(gid)
+                                if gid is not None
+                                else None
+                            )
+                            lmeta = video_meta.get(loser_vid, {})
+                            wmeta = video_meta.get(winner_vid, {}) if winner_vid else {}
+                            col_l, col_arrow, col_w = st.columns([4, 1, 4])
+                            with col_l:
+                                if lmeta.get("thumb"):
+                                    st.image(lmeta["thumb"], width=48)
+                                title = lmeta.get("title", "")
+                                artists = ", ".join(lmeta.get("artists") or [])
+                                eflag = " (Explicit)" if lmeta.get("explicit") else ""
+                                st.write(f"❌ {title}{eflag}")
+                                st.caption(artists)
+                            with col_arrow:
+                                st.write("➡️")
+                            with col_w:
+                                if wmeta.get("thumb"):
+                                    st.image(wmeta["thumb"], width=48)
+                                title = wmeta.get("title", "")
+                                artists = ", ".join(wmeta.get("artists") or [])
+                                eflag = " (Explicit)" if wmeta.get("explicit") else ""
+                                st.write(f"✅ {title}{eflag}")
+                                st.caption(artists)
+
         if "ytm_cleanup_plan" in st.session_state and not dry_run:
             save_undo = st.checkbox("Save undo log for rollback", value=True)
             if st.button("🧹 Apply Cleanup Now", type="primary"):
@@ -2999,6 +3616,266 @@ def render_dedup_tab():
                     st.error(f"Playlist creation failed: {e}")
 
 
+# On-disk copies of the cleanup library/liked-songs ID sets, per account
+_CLEANUP_CACHE_DIR = Path.home() / ".musicweb" / "cache"
+_CLEANUP_CACHE_TTL = 1800
+_PLAYLIST_TRACKS_TTL = 300
+
+
+def _playlist_cleaner(ytmusic):
+    """PlaylistCleaner for `ytmusic`, kept in the session across reruns."""
+    cached = st.session_state.get("playlist_cleaner")
+    if cached is None or cached[0] is not ytmusic:
+        cached = (ytmusic, PlaylistCleaner(ytmusic=ytmusic))
+        st.session_state["playlist_cleaner"] = cached
+    return cached[1]
+
+
+def _cleanup_user_key(ytmusic) -> Optional[str]:
+    """Stable per-account key derived from the YouTube Music auth headers.
+
+    None when the headers carry no identity, in which case nothing may be
+    shared through the process or disk caches.
+    """
+    headers = getattr(ytmusic, "headers", None) or {}
+    ident = headers.get("cookie") or headers.get("authorization")
+    if not ident:
+        return None
+    return hashlib.sha1(str(ident).encode("utf-8")).hexdigest()[:16]
+
+
+def _fetch_video_ids(fetch) -> frozenset:
+    """videoIds from `fetch`, which returns raw songs (dicts) or video ids."""
+    return frozenset(
+        filter(
+            None,
+            (s.get("videoId") if isinstance(s, dict) else s for s in fetch() or ()),
+        )
+    )
+
+
+def _load_video_ids(kind: str, user_key: Optional[str], fetch) -> frozenset:
+    """`_cleanup_video_ids`, or a direct fetch for an unidentified account."""
+    if user_key is None:
+        return _fetch_video_ids(fetch)
+    return _cleanup_video_ids(kind, user_key, fetch)
+
+
+@st.cache_data(ttl=_CLEANUP_CACHE_TTL, show_spinner=False)
+def _cleanup_video_ids(kind: str, user_key: str, _fetch) -> frozenset:
+    """videoIds of the account's `kind` ("library" or "liked") songs.
+
+    Served from `_CLEANUP_CACHE_DIR` while the pickle is younger than the
+    TTL, so new sessions and restarts skip the YouTube Music download.
+    `_fetch` returns the raw songs (dicts) or video ids when a refresh is due.
+    """
+    path = _CLEANUP_CACHE_DIR / f"{kind}_{user_key}.pkl"
+    try:
+        if time.time() - path.stat().st_mtime < _CLEANUP_CACHE_TTL:
+            with path.open("rb") as fh:
+                return pickle.load(fh)
+    except Exception:
+        pass
+
+    ids = _fetch_video_ids(_fetch)
+    try:
+        _CLEANUP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as fh:
+            pickle.dump(ids, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+    except OSError:
+        pass
+    return ids
+
+
+def _session_video_ids(kind: str, user_key: Optional[str], fetch) -> frozenset:
+    """`_load_video_ids` pinned in session state as `<kind>_vid_set`.
+
+    cache_data hands back a fresh copy on every call; keeping the frozenset
+    in the session lets repeated previews reuse the same object.
+    """
+    key = f"{kind}_vid_set"
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != user_key:
+        cached = (user_key, _load_video_ids(kind, user_key, fetch))
+        st.session_state[key] = cached
+    return cached[1]
+
+
+def _prefetch_video_ids(
+    user_key: Optional[str], fetchers: Dict[str, Any]
+) -> Dict[str, frozenset]:
+    """`_session_video_ids` for several kinds, overlapping their downloads.
+
+    The library and liked-songs endpoints are independent, so any sets not
+    yet held by the session are loaded on worker threads at the same time.
+    """
+    missing = []
+    for kind in fetchers:
+        cached = st.session_state.get(f"{kind}_vid_set")
+        if cached is None or cached[0] != user_key:
+            missing.append(kind)
+    if len(missing) > 1:
+        ctx = get_script_run_ctx()
+
+        def load(kind: str) -> frozenset:
+            add_script_run_ctx(threading.current_thread(), ctx)
+            return _load_video_ids(kind, user_key, fetchers[kind])
+
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            for kind, ids in zip(missing, pool.map(load, missing)):
+                st.session_state[f"{kind}_vid_set"] = (user_key, ids)
+    return {
+        kind: _session_video_ids(kind, user_key, fetch)
+        for kind, fetch in fetchers.items()
+    }
+
+
+def _partition_tracks(
+    tracks: List[Any], liked_ids: frozenset, library_ids: frozenset
+) -> Tuple[List[Any], List[Any]]:
+    """Split playlist tracks into (liked, library-only) removal candidates.
+
+    A track already in `liked_ids` is never reported as a library duplicate.
+    """
+    vids = {t.video_id for t in tracks}
+    liked_hit = liked_ids & vids
+    lib_hit = (library_ids & vids) - liked_hit
+    return (
+        [t for t in tracks if t.video_id in liked_hit],
+        [t for t in tracks if t.video_id in lib_hit],
+    )
+
+
+def _playlist_tracks(cleaner, playlist_id: str) -> List[Any]:
+    """Tracks of `playlist_id`, fetched at most once per session and TTL.
+
+    "🔄 Refresh playlist" and any real cleanup drop the session copy.
+    """
+    cache = st.session_state.setdefault("cleanup_playlist_tracks", {})
+    hit = cache.get(playlist_id)
+    if hit and time.time() - hit[0] < _PLAYLIST_TRACKS_TTL:
+        return hit[1]
+    tracks = cleaner.get_playlist_tracks_robust(playlist_id)
+    if tracks:
+        cache[playlist_id] = (time.time(), tracks)
+    return tracks
+
+
+def _similarity_preview(cleaner, tracks: List[Any], threshold: float) -> Dict[str, Any]:
+    """Library similarity matches for `tracks`, reused while nothing changed.
+
+    Repeated dry runs of the same playlist contents at the same threshold
+    return the previous result instead of rescanning the library.
+    """
+    # The session keeps one cleaner per account, so its id scopes the library
+    key = (id(cleaner), tuple(t.video_id for t in tracks), threshold)
+    cached = st.session_state.get("cleanup_similarity")
+    if cached is None or cached[0] != key:
+        matches = cleaner.find_library_duplicates_with_similarity(tracks, threshold)
+        cached = (key, matches)
+        st.session_state["cleanup_similarity"] = cached
+    return cached[1]
+
+
+def _clear_cleanup_cache(user_key: Optional[str]) -> None:
+    """Drop the cached library/liked-songs ID sets for one account."""
+    _cleanup_video_ids.clear()
+    st.session_state.pop("library_vid_set", None)
+    st.session_state.pop("liked_vid_set", None)
+    st.session_state.pop("cleanup_similarity", None)
+    if user_key is None:
+        return
+    for kind in ("library", "liked"):
+        (_CLEANUP_CACHE_DIR / f"{kind}_{user_key}.pkl").unlink(missing_ok=True)
+
+
+def _review_data(similarity_matches: Dict[str, Any]) -> Dict[str, Any]:
+    """Plain-dict snapshot of the matches needing review, for session state."""
+
+    def library_match(lib_match: Dict[str, Any]) -> Dict[str, Any]:
+        lib_track = lib_match["library_track"]
+        return {
+            "title": lib_track.get("title"),
+            "artists": [a.get("name") for a in lib_track.get("artists", [])],
+            "similarity": lib_match["similarity"],
+            "reason": lib_match["reason"],
+        }
+
+    def review_entry(match: Dict[str, Any]) -> Dict[str, Any]:
+        track = match["playlist_track"]
+        return {
+            "playlist_track": {
+                "videoId": track.video_id,
+                "setVideoId": track.set_video_id,
+                "title": track.title,
+                "artists": track.artists,
+                "duration": track.duration,
+            },
+            "confidence": match["confidence"],
+            "library_matches": list(map(library_match, match["library_matches"])),
+        }
+
+    needs_review = similarity_matches["needs_review"]
+    return {
+        "summary": {
+            "total_matches": similarity_matches["total_matches"],
+            "needs_review": len(needs_review),
+            "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "needs_review": list(map(review_entry, needs_review)),
+    }
+
+
+def _render_cleanup_tracks(
+    tracks: List[Any], confidences: Optional[List[float]] = None
+) -> None:
+    """Show cleanup preview tracks as one table rather than widgets per row."""
+    df = pd.DataFrame.from_records(
+        [
+            (
+                _thumb_url(getattr(t, "thumbnail", None) or "") or None,
+                t.title,
+                ", ".join(t.artists or ()),
+                bool(getattr(t, "is_explicit", False)),
+            )
+            for t in tracks
+        ],
+        columns=["Thumb", "Title", "Artists", "Explicit"],
+    )
+    if confidences is not None:
+        df["Confidence"] = [f"{c:.1%}" for c in confidences]
+    if _HAS_COLUMN_CONFIG:
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config=_MISSING_COLUMN_CONFIG,
+        )
+    else:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+def _render_duplicate_groups(duplicates: List[Any]) -> None:
+    """Table of internal duplicate groups for the cleanup preview."""
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Signature": [d.signature for d in duplicates],
+                "Copies": [d.duplicate_count for d in duplicates],
+                "Confidence": [f"{d.confidence:.1%}" for d in duplicates],
+            }
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# Duplicate groups shown per page in the cleanup review
+_DUP_PAGE_SIZE = 5
+
+
 def render_playlist_cleanup_tab():
     """Render the playlist cleanup tab."""
     st.header("🧽 Playlist Cleanup")
@@ -3048,25 +3925,27 @@ def render_playlist_cleanup_tab():
     ):
         ytmusic_instance = st.session_state.playlist_manager.ytmusic
     elif st.session_state.get("cleanup_headers_path"):
-        # Create temporary instance for cleanup
-        try:
-            from ytmusicapi import YTMusic
+        # Instance for cleanup, reused until other headers are uploaded
+        headers_path = st.session_state.cleanup_headers_path
+        cached = st.session_state.get("cleanup_ytmusic")
+        if cached and cached[0] == headers_path:
+            ytmusic_instance = cached[1]
+        else:
+            try:
+                from ytmusicapi import YTMusic
 
-            ytmusic_instance = YTMusic(st.session_state.cleanup_headers_path)
-        except Exception as e:
-            st.error(f"Failed to authenticate: {e}")
-            return
+                ytmusic_instance = YTMusic(headers_path)
+            except Exception as e:
+                st.error(f"Failed to authenticate: {e}")
+                return
+            st.session_state["cleanup_ytmusic"] = (headers_path, ytmusic_instance)
 
     if not ytmusic_instance:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); padding: 2rem; border-radius: 12px; text-align: center; border-left: 4px solid #ffc107;">
-            <h4 style="color: #856404; margin-bottom: 1rem;">🔒 Authentication Required</h4>
-            <p style="color: #856404; margin-bottom: 1rem;">Please connect to YouTube Music first to use playlist cleanup features.</p>
-            <p style="color: #856404; margin: 0; font-size: 0.9rem;">Use the sidebar or upload headers above to authenticate.</p>
-        </div>
-        """,
-            unsafe_allow_html=True,
+        render_card(
+            "warning",
+            title="🔒 Authentication Required",
+            message="Please connect to YouTube Music first to use playlist cleanup features.",
+            hint="Use the sidebar or upload headers above to authenticate.",
         )
         return
 
@@ -3077,6 +3956,8 @@ def render_playlist_cleanup_tab():
         value="https://music.youtube.com/playlist?list=PL1LO5jourf4MqCSX94juP7bWk2eYTMCQ2&si=-idwc0lg2KK0LYnq",
         help="Paste the full YouTube Music playlist URL or just the playlist ID",
     )
+    if st.button("🔄 Refresh playlist", help="Re-fetch the playlist's tracks"):
+        st.session_state.pop("cleanup_playlist_tracks", None)
 
     # Cleanup options
     st.subheader("⚙️ Cleanup Options")
@@ -3199,8 +4080,9 @@ def render_playlist_cleanup_tab():
             if st.button("Clear Cache"):
                 # Clear any cached data
                 if ytmusic_instance:
-                    cleaner = PlaylistCleaner(ytmusic=ytmusic_instance)
+                    cleaner = _playlist_cleaner(ytmusic_instance)
                     cleaner.clear_cache()
+                    _clear_cleanup_cache(_cleanup_user_key(ytmusic_instance))
                 st.success("Cache cleared - next cleanup will refresh all data")
 
         with col2:
@@ -3228,46 +4110,39 @@ def render_playlist_cleanup_tab():
             return
 
         with st.spinner("Cleaning playlist..."):
+            # One status element carries the progress messages
+            status = st.status("Initializing cleanup...")
             try:
                 # Create cleaner instance
-                cleaner = PlaylistCleaner(ytmusic=ytmusic_instance)
-
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                status_text.text("Initializing cleanup...")
-                progress_bar.progress(0.1)
+                cleaner = _playlist_cleaner(ytmusic_instance)
+                playlist_id = cleaner.extract_playlist_id(playlist_url)
 
                 if dry_run:
-                    status_text.text("Running in preview mode - analyzing playlist...")
-                    progress_bar.progress(0.3)
+                    status.update(
+                        label="Running in preview mode - analyzing playlist..."
+                    )
 
                     # Get playlist tracks for preview
-                    playlist_id = cleaner.extract_playlist_id(playlist_url)
-                    tracks = cleaner.get_playlist_tracks_robust(playlist_id)
+                    tracks = _playlist_tracks(cleaner, playlist_id)
 
                     if not tracks:
+                        status.update(label="No tracks retrieved", state="error")
                         st.error(
                             "Could not retrieve playlist tracks. Check the URL and try again."
                         )
                         return
 
-                    status_text.text("Analyzing what would be removed...")
-                    progress_bar.progress(0.6)
+                    status.update(label="Analyzing what would be removed...")
 
                     if use_similarity or dedupe_internal:
                         # Advanced preview with similarity matching or internal dedup
                         if use_similarity:
-                            status_text.text(
-                                "Analyzing library duplicates with similarity matching..."
+                            status.update(
+                                label="Analyzing library duplicates with similarity matching..."
                             )
-                            progress_bar.progress(0.6)
 
-                            similarity_matches = (
-                                cleaner.find_library_duplicates_with_similarity(
-                                    tracks, similarity_threshold
-                                )
+                            similarity_matches = _similarity_preview(
+                                cleaner, tracks, similarity_threshold
                             )
 
                             col1, col2, col3, col4 = st.columns(4)
@@ -3293,61 +4168,26 @@ def render_playlist_cleanup_tab():
                                 with st.expander(
                                     f"✅ High Confidence Library Duplicates ({len(similarity_matches['high_confidence'])})"
                                 ):
-                                    for match in similarity_matches["high_confidence"][
-                                        :10
-                                    ]:
-                                        track = match["playlist_track"]
-                                        cimg, cinfo = st.columns([1, 6])
-                                        with cimg:
-                                            if getattr(track, "thumbnail", None):
-                                                st.image(track.thumbnail, width=48)
-                                        with cinfo:
-                                            explicit_flag = (
-                                                " (Explicit)"
-                                                if getattr(track, "is_explicit", False)
-                                                else ""
-                                            )
-                                            st.write(
-                                                f"• **{track.title}**{explicit_flag} (confidence: {match['confidence']:.1%})"
-                                            )
-                                            st.caption(", ".join(track.artists))
-                                    if len(similarity_matches["high_confidence"]) > 10:
-                                        st.write(
-                                            f"... and {len(similarity_matches['high_confidence']) - 10} more"
-                                        )
+                                    matches = similarity_matches["high_confidence"]
+                                    _render_cleanup_tracks(
+                                        [m["playlist_track"] for m in matches],
+                                        [m["confidence"] for m in matches],
+                                    )
 
                             if similarity_matches["needs_review"]:
                                 with st.expander(
                                     f"⚠️ Needs Manual Review ({len(similarity_matches['needs_review'])})"
                                 ):
-                                    for match in similarity_matches["needs_review"][
-                                        :10
-                                    ]:
-                                        track = match["playlist_track"]
-                                        cimg, cinfo = st.columns([1, 6])
-                                        with cimg:
-                                            if getattr(track, "thumbnail", None):
-                                                st.image(track.thumbnail, width=48)
-                                        with cinfo:
-                                            explicit_flag = (
-                                                " (Explicit)"
-                                                if getattr(track, "is_explicit", False)
-                                                else ""
-                                            )
-                                            st.write(
-                                                f"• **{track.title}**{explicit_flag} (confidence: {match['confidence']:.1%})"
-                                            )
-                                            st.caption(", ".join(track.artists))
-                                    if len(similarity_matches["needs_review"]) > 10:
-                                        st.write(
-                                            f"... and {len(similarity_matches['needs_review']) - 10} more"
-                                        )
+                                    matches = similarity_matches["needs_review"]
+                                    _render_cleanup_tracks(
+                                        [m["playlist_track"] for m in matches],
+                                        [m["confidence"] for m in matches],
+                                    )
 
                         if dedupe_internal:
-                            status_text.text(
-                                "Analyzing internal playlist duplicates..."
+                            status.update(
+                                label="Analyzing internal playlist duplicates..."
                             )
-                            progress_bar.progress(0.7)
 
                             internal_duplicates = (
                                 cleaner.find_playlist_internal_duplicates(tracks)
@@ -3378,59 +4218,34 @@ def render_playlist_cleanup_tab():
                                 with st.expander(
                                     f"✅ Auto-Remove Internal Duplicates ({len(auto_remove_candidates)} groups)"
                                 ):
-                                    for dup in auto_remove_candidates[:10]:
-                                        st.write(
-                                            f"• **{dup.signature}** ({dup.duplicate_count} copies, confidence: {dup.confidence:.1%})"
-                                        )
-                                    if len(auto_remove_candidates) > 10:
-                                        st.write(
-                                            f"... and {len(auto_remove_candidates) - 10} more groups"
-                                        )
+                                    _render_duplicate_groups(auto_remove_candidates)
 
                             if needs_review_internal:
                                 with st.expander(
                                     f"⚠️ Internal Duplicates Need Review ({len(needs_review_internal)} groups)"
                                 ):
-                                    for dup in needs_review_internal[:10]:
-                                        st.write(
-                                            f"• **{dup.signature}** ({dup.duplicate_count} copies, confidence: {dup.confidence:.1%})"
-                                        )
-                                    if len(needs_review_internal) > 10:
-                                        st.write(
-                                            f"... and {len(needs_review_internal) - 10} more groups"
-                                        )
+                                    _render_duplicate_groups(needs_review_internal)
 
                     else:
                         # Basic preview
-                        status_text.text("Analyzing playlist for basic cleanup...")
-                        progress_bar.progress(0.6)
-
-                        # Get comparison data
-                        liked_songs = set()
-                        library_video_ids = set()
+                        status.update(label="Analyzing playlist for basic cleanup...")
 
+                        # Get comparison data; both sets download concurrently
+                        fetchers = {}
                         if remove_liked:
-                            liked_songs = cleaner.get_liked_songs_cached()
-
+                            fetchers["liked"] = cleaner.get_liked_songs_cached
                         if dedupe_library:
-                            library_songs = cleaner.get_library_songs_cached()
-                            library_video_ids = {
-                                song.get("videoId")
-                                for song in library_songs
-                                if song.get("videoId")
-                            }
-
-                        progress_bar.progress(0.9)
+                            fetchers["library"] = cleaner.get_library_songs_cached
+                        id_sets = _prefetch_video_ids(
+                            _cleanup_user_key(ytmusic_instance), fetchers
+                        )
+                        liked_songs = id_sets.get("liked", frozenset())
+                        library_video_ids = id_sets.get("library", frozenset())
 
                         # Analyze what would be removed
-                        tracks_to_remove_liked = []
-                        tracks_to_remove_library = []
-
-                        for track in tracks:
-                            if remove_liked and track.video_id in liked_songs:
-                                tracks_to_remove_liked.append(track)
-                            elif dedupe_library and track.video_id in library_video_ids:
-                                tracks_to_remove_library.append(track)
+                        tracks_to_remove_liked, tracks_to_remove_library = (
+                            _partition_tracks(tracks, liked_songs, library_video_ids)
+                        )
 
                         # Show basic preview results
                         col1, col2, col3, col4 = st.columns(4)
@@ -3455,48 +4270,15 @@ def render_playlist_cleanup_tab():
                             with st.expander(
                                 f"🎵 Liked Songs to Remove ({len(tracks_to_remove_liked)})"
                             ):
-                                for track in tracks_to_remove_liked[:20]:
-                                    cimg, cinfo = st.columns([1, 6])
-                                    with cimg:
-                                        if getattr(track, "thumbnail", None):
-                                            st.image(track.thumbnail, width=48)
-                                    with cinfo:
-                                        explicit_flag = (
-                                            " (Explicit)"
-                                            if getattr(track, "is_explicit", False)
-                                            else ""
-                                        )
-                                        st.write(f"• {track.title}{explicit_flag}")
-                                        st.caption(", ".join(track.artists))
-                                if len(tracks_to_remove_liked) > 20:
-                                    st.write(
-                                        f"... and {len(tracks_to_remove_liked) - 20} more"
-                                    )
+                                _render_cleanup_tracks(tracks_to_remove_liked)
 
                         if tracks_to_remove_library:
                             with st.expander(
                                 f"📚 Library Duplicates to Remove ({len(tracks_to_remove_library)})"
                             ):
-                                for track in tracks_to_remove_library[:20]:
-                                    cimg, cinfo = st.columns([1, 6])
-                                    with cimg:
-                                        if getattr(track, "thumbnail", None):
-                                            st.image(track.thumbnail, width=48)
-                                    with cinfo:
-                                        explicit_flag = (
-                                            " (Explicit)"
-                                            if getattr(track, "is_explicit", False)
-                                            else ""
-                                        )
-                                        st.write(f"• {track.title}{explicit_flag}")
-                                        st.caption(", ".join(track.artists))
-                                if len(tracks_to_remove_library) > 20:
-                                    st.write(
-                                        f"... and {len(tracks_to_remove_library) - 20} more"
-                                    )
+                                _render_cleanup_tracks(tracks_to_remove_library)
 
-                    progress_bar.progress(1.0)
-                    status_text.text("Preview complete!")
+                    status.update(label="Preview complete!", state="complete")
 
                     st.success("🔍 Preview Complete!")
 
@@ -3505,9 +4287,9 @@ def render_playlist_cleanup_tab():
                     )
 
                 else:
-                    # Actual cleanup
-                    status_text.text("Performing cleanup...")
-                    progress_bar.progress(0.3)
+                    # Actual cleanup; the playlist changes, so drop fetched tracks
+                    st.session_state.pop("cleanup_playlist_tracks", None)
+                    status.update(label="Performing cleanup...")
 
                     if use_similarity:
                         # Enhanced cleanup with similarity matching
@@ -3519,19 +4301,21 @@ def render_playlist_cleanup_tab():
                             auto_remove_high_confidence=auto_remove_high_confidence,
                         )
 
-                        progress_bar.progress(1.0)
-                        status_text.text("Enhanced cleanup complete!")
+                        status.update(
+                            label="Enhanced cleanup complete!", state="complete"
+                        )
 
                         # Show results
                         st.success("✅ Enhanced Playlist Cleanup Complete!")
+                        similarity_matches = result["similarity_matches"]
+                        review_count = len(similarity_matches["needs_review"])
 
                         col1, col2, col3, col4 = st.columns(4)
                         with col1:
                             st.metric("Original Count", result["original_count"])
                         with col2:
                             st.metric(
-                                "Total Matches",
-                                result["similarity_matches"]["total_matches"],
+                                "Total Matches", similarity_matches["total_matches"]
                             )
                         with col3:
                             st.metric("Auto-Removed", result["removed_duplicates"])
@@ -3539,63 +4323,14 @@ def render_playlist_cleanup_tab():
                             st.metric("Final Count", result["final_count"])
 
                         # Show similarity match summary
-                        if result["similarity_matches"]["needs_review"]:
+                        if review_count:
                             st.info(
-                                f"💡 {len(result['similarity_matches']['needs_review'])} matches need manual review - use the review interface below"
+                                f"💡 {review_count} matches need manual review - use the review interface below"
                             )
 
-                        if (
-                            save_review_data
-                            and result["similarity_matches"]["needs_review"]
-                        ):
+                        if save_review_data and review_count:
                             # Save review data
-                            review_data = {
-                                "summary": {
-                                    "total_matches": result["similarity_matches"][
-                                        "total_matches"
-                                    ],
-                                    "needs_review": len(
-                                        result["similarity_matches"]["needs_review"]
-                                    ),
-                                    "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                                },
-                                "needs_review": [
-                                    {
-                                        "playlist_track": {
-                                            "videoId": match["playlist_track"].video_id,
-                                            "setVideoId": match[
-                                                "playlist_track"
-                                            ].set_video_id,
-                                            "title": match["playlist_track"].title,
-                                            "artists": match["playlist_track"].artists,
-                                            "duration": match[
-                                                "playlist_track"
-                                            ].duration,
-                                        },
-                                        "confidence": match["confidence"],
-                                        "library_matches": [
-                                            {
-                                                "title": lib_match["library_track"].get(
-                                                    "title"
-                                                ),
-                                                "artists": [
-                                                    a.get("name")
-                                                    for a in lib_match[
-                                                        "library_track"
-                                                    ].get("artists", [])
-                                                ],
-                                                "similarity": lib_match["similarity"],
-                                                "reason": lib_match["reason"],
-                                            }
-                                            for lib_match in match["library_matches"]
-                                        ],
-                                    }
-                                    for match in result["similarity_matches"][
-                                        "needs_review"
-                                    ]
-                                ],
-                            }
-
+                            review_data = _review_data(similarity_matches)
                             st.session_state["playlist_review_data"] = review_data
                             st.success("📋 Review data saved for manual processing")
 
@@ -3605,8 +4340,9 @@ def render_playlist_cleanup_tab():
                             playlist_url, auto_remove=auto_remove_internal
                         )
 
-                        progress_bar.progress(1.0)
-                        status_text.text("Internal deduplication complete!")
+                        status.update(
+                            label="Internal deduplication complete!", state="complete"
+                        )
 
                         # Show results
                         st.success("✅ Internal Deduplication Complete!")
@@ -3640,8 +4376,7 @@ def render_playlist_cleanup_tab():
                             deduplicate_against_library=dedupe_library,
                         )
 
-                        progress_bar.progress(1.0)
-                        status_text.text("Basic cleanup complete!")
+                        status.update(label="Basic cleanup complete!", state="complete")
 
                         # Show results
                         st.success("✅ Playlist Cleaned!")
@@ -3666,15 +4401,12 @@ def render_playlist_cleanup_tab():
                                     st.error(error)
 
                     # Show link to cleaned playlist
-                    playlist_id = cleaner.extract_playlist_id(playlist_url)
                     st.markdown(
                         f"🎵 **[View Cleaned Playlist](https://music.youtube.com/playlist?list={playlist_id})**"
                     )
 
-                progress_bar.empty()
-                status_text.empty()
-
             except Exception as e:
+                status.update(label="Cleanup failed", state="error")
                 st.error(f"❌ Cleanup failed: {e}")
                 st.exception(e)
 
@@ -3700,19 +4432,20 @@ def render_playlist_cleanup_tab():
                     st.rerun()
 
                 for i, item in enumerate(
-                    review_data["needs_review"][:10]
+                    itertools.islice(review_data["needs_review"], 10)
                 ):  # Show first 10
                     track = item["playlist_track"]
 
-                    st.markdown(
-                        f"**{i+1}. {track['title']}** by {', '.join(track['artists'])}"
-                    )
-                    st.write(f"Confidence: {item['confidence']:.1%}")
-
-                    for match in item["library_matches"]:
-                        st.write(
-                            f"  → Similar to: **{match['title']}** by {', '.join(match['artists'])} ({match['reason']})"
-                        )
+                    # Heading, confidence and matches as a single element
+                    lines = [
+                        f"**{i+1}. {track['title']}** by {', '.join(track['artists'])}",
+                        f"Confidence: {item['confidence']:.1%}",
+                        "\n".join(
+                            f"- → Similar to: **{match['title']}** by {', '.join(match['artists'])} ({match['reason']})"
+                            for match in item["library_matches"]
+                        ),
+                    ]
+                    st.markdown("\n\n".join(filter(None, lines)))
 
                     if st.button(f"Remove Track {i+1}", key=f"remove_lib_{i}"):
                         st.info(f"Would remove: {track['title']} (feature coming soon)")
@@ -3740,23 +4473,41 @@ def render_playlist_cleanup_tab():
                 ):
                     if st.button("🗑️ Clear Internal Dedup Data"):
                         del st.session_state["internal_dedup_data"]
+                        st.session_state.pop("dup_review_page", None)
                         st.rerun()
 
+                    # One page of groups per run, same pager as _paginate
+                    pages = math.ceil(len(needs_review_duplicates) / _DUP_PAGE_SIZE)
+                    page = 1
+                    if pages > 1:
+                        page = st.number_input(
+                            f"Page (of {pages:,}, {_DUP_PAGE_SIZE} groups each)",
+                            min_value=1,
+                            max_value=pages,
+                            value=1,
+                            key="dup_review_page",
+                        )
+                    start = (page - 1) * _DUP_PAGE_SIZE
+
                     for i, dup in enumerate(
-                        needs_review_duplicates[:5]
-                    ):  # Show first 5 groups
+                        needs_review_duplicates[start : start + _DUP_PAGE_SIZE],
+                        start=start,
+                    ):
                         st.markdown(
                             f"**Group {i+1}: {dup['signature']}** ({dup['duplicate_count']} copies, confidence: {dup['confidence']:.1%})"
                         )
 
-                        st.write("Tracks in this group:")
-                        for j, track in enumerate(
-                            dup["tracks_to_keep"] + dup["tracks_to_remove"]
-                        ):
-                            marker = "✅ Keep" if j == 0 else "❌ Remove"
-                            st.write(
-                                f"  {marker} **{track['title']}** by {', '.join(track['artists'])}"
+                        # Whole track list as a single element
+                        st.markdown(
+                            "Tracks in this group:\n\n"
+                            + "\n".join(
+                                f"- {'✅ Keep' if j == 0 else '❌ Remove'} "
+                                f"**{track['title']}** by {', '.join(track['artists'])}"
+                                for j, track in enumerate(
+                                    dup["tracks_to_keep"] + dup["tracks_to_remove"]
+                                )
                             )
+                        )
 
                         if st.button(
                             f"Apply Group {i+1} Removals", key=f"remove_group_{i}"
@@ -3767,11 +4518,6 @@ def render_playlist_cleanup_tab():
 
                         st.markdown("---")
 
-                    if len(needs_review_duplicates) > 5:
-                        st.info(
-                            f"Showing first 5 of {len(needs_review_duplicates)} groups needing review"
-                        )
-
 
 def render_help_tab():
     """Render the help tab."""
@@ -2,32 +2,139 @@
 Responsive design utilities for mobile-friendly interface.
 """
 
+import inspect
 from typing import Dict, Optional, Tuple
 
 import streamlit as st
 
+# Session counter the app bumps at the start of every script run
+# (SessionManager.initialize_session); absent outside the app
+RUN_ID_KEY = "run_id"
+
+# Session key remembering the run that last received _MOBILE_CSS
+_MOBILE_CSS_RUN_KEY = "_mobile_css_run"
+
+# Session key holding (run, count) of create_mobile_layout calls in a run
+_LAYOUT_RUN_KEY = "_mobile_layout_run"
+
+# Probed once; keyed containers (st.container(key=...)) need a newer Streamlit
+_HAS_KEYED_CONTAINER = "key" in inspect.signature(st.container).parameters
+
+# Styles for every mobile_* widget helper, injected once per run
+_MOBILE_CSS = """
+<style>
+div[data-testid="stButton"] > button[kind="primary"] {
+    width: 100%;
+    height: 44px;
+    font-size: 16px;
+    border-radius: 8px;
+    margin: 8px 0;
+    touch-action: manipulation;
+}
+.stFileUploader {
+    margin: 16px 0;
+}
+.stFileUploader > div {
+    padding: 16px;
+    border: 2px dashed #ccc;
+    border-radius: 8px;
+    text-align: center;
+    min-height: 80px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+.stSelectbox > div > div > select {
+    font-size: 16px !important;
+    height: 44px;
+    padding: 8px 12px;
+    border-radius: 8px;
+}
+.stTextInput > div > div > input {
+    font-size: 16px !important;
+    height: 44px;
+    padding: 8px 12px;
+    border-radius: 8px;
+    border: 2px solid #ddd;
+}
+.stTextInput > div > div > input:focus {
+    border-color: #007bff;
+    outline: none;
+    box-shadow: 0 0 0 2px rgba(0, 123, 255, 0.25);
+}
+.mobile-metric {
+    background: #f8f9fa;
+    padding: 16px;
+    border-radius: 8px;
+    margin: 8px 0;
+    text-align: center;
+    border: 1px solid #e9ecef;
+}
+.metric-label {
+    font-size: 14px;
+    color: #6c757d;
+    margin-bottom: 8px;
+    font-weight: 500;
+}
+.metric-value {
+    font-size: 24px;
+    font-weight: bold;
+    color: #212529;
+    margin-bottom: 4px;
+}
+.metric-delta {
+    font-size: 12px;
+    color: #28a745;
+    font-weight: 500;
+}
+.mobile-nav {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+    padding: 16px 0;
+    justify-content: center;
+}
+.mobile-nav-item {
+    padding: 8px 16px;
+    background: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 20px;
+    text-decoration: none;
+    color: #495057;
+    font-size: 14px;
+    font-weight: 500;
+    transition: all 0.2s;
+    cursor: pointer;
+    min-height: 40px;
+    display: flex;
+    align-items: center;
+}
+.mobile-nav-item:hover,
+.mobile-nav-item.active {
+    background: #007bff;
+    color: white;
+    border-color: #007bff;
+}
+@media (max-width: 767px) {
+    .mobile-metric {
+        padding: 12px;
+        margin: 6px 0;
+    }
+    .metric-value {
+        font-size: 20px;
+    }
+    .mobile-nav-item {
+        flex: 1 1 calc(50% - 4px);
+        text-align: center;
+        justify-content: center;
+        min-width: 120px;
+    }
+}
+</style>
+"""
 
-class ResponsiveDesign:
-    """Utilities for responsive design and mobile detection."""
-
-    @staticmethod
-    def get_device_type() -> str:
-        """
-        Detect device type based on user agent or viewport.
-        Returns: 'mobile', 'tablet', or 'desktop'
-        """
-        # Check if we can get viewport info from browser
-        try:
-            # This is a simplified detection - in a real app you might use JavaScript
-            # For now, we'll rely on CSS media queries and assume mobile-first
-            return "mobile"  # Default to mobile-first approach
-        except:
-            return "mobile"
-
-    @staticmethod
-    def get_mobile_css() -> str:
-        """Get mobile-optimized CSS styles."""
-        return """
+# Returned by get_mobile_css
+_VIEWPORT_CSS = """
         <style>
         /* Mobile-first responsive CSS injection */
         @import url('styles/mobile.css');
@@ -62,6 +169,70 @@ class ResponsiveDesign:
         </style>
         """
 
+# Plotly config shared by every chart; see get_responsive_chart_config
+_CHART_CONFIG = {
+    "displayModeBar": False,  # Hide toolbar on mobile
+    "responsive": True,
+    "displaylogo": False,
+    "modeBarButtonsToRemove": [
+        "pan2d",
+        "lasso2d",
+        "select2d",
+        "autoScale2d",
+        "hoverClosestCartesian",
+        "hoverCompareCartesian",
+    ],
+    "layout": {
+        "margin": {"l": 20, "r": 20, "t": 40, "b": 40},
+        "font": {"size": 12},
+        "showlegend": True,
+        "legend": {
+            "orientation": "h",
+            "y": -0.2,
+            "x": 0.5,
+            "xanchor": "center",
+        },
+    },
+}
+
+
+class ResponsiveDesign:
+    """Utilities for responsive design and mobile detection."""
+
+    @staticmethod
+    def ensure_mobile_css() -> None:
+        """Inject the shared mobile widget styles once per script run.
+
+        Every mobile_* helper calls this instead of emitting its own <style>
+        block. It has to run on each rerun (not once per session) because
+        Streamlit drops elements a run does not re-emit.
+        """
+        run = st.session_state.get(RUN_ID_KEY)
+        if run is not None and st.session_state.get(_MOBILE_CSS_RUN_KEY) == run:
+            return
+        st.markdown(_MOBILE_CSS, unsafe_allow_html=True)
+        if run is not None:
+            st.session_state[_MOBILE_CSS_RUN_KEY] = run
+
+    @staticmethod
+    def get_device_type() -> str:
+        """
+        Detect device type based on user agent or viewport.
+        Returns: 'mobile', 'tablet', or 'desktop'
+        """
+        # Check if we can get viewport info from browser
+        try:
+            # This is a simplified detection - in a real app you might use JavaScript
+            # For now, we'll rely on CSS media queries and assume mobile-first
+            return "mobile"  # Default to mobile-first approach
+        except:
+            return "mobile"
+
+    @staticmethod
+    def get_mobile_css() -> str:
+        """Get mobile-optimized CSS styles."""
+        return _VIEWPORT_CSS
+
     @staticmethod
     def create_mobile_layout(content_func, sidebar_func=None):
         """
@@ -71,19 +242,34 @@ class ResponsiveDesign:
             content_func: Function that renders main content
             sidebar_func: Optional function that renders sidebar content
         """
-        # Mobile-first approach
+        # Mobile-first approach. A keyed container carries the CSS class
+        # "st-key-<key>" itself, so no markdown wrapper elements are needed
+        # (a markdown "<div>" could never enclose the widgets anyway).
+        suffix = ResponsiveDesign._layout_suffix()
         if sidebar_func:
             # On mobile, sidebar content goes to top
-            with st.container():
-                st.markdown('<div class="mobile-sidebar">', unsafe_allow_html=True)
+            with ResponsiveDesign._layout_container("mobile-sidebar" + suffix):
                 sidebar_func()
-                st.markdown("</div>", unsafe_allow_html=True)
 
         # Main content
-        with st.container():
-            st.markdown('<div class="mobile-content">', unsafe_allow_html=True)
+        with ResponsiveDesign._layout_container("mobile-content" + suffix):
             content_func()
-            st.markdown("</div>", unsafe_allow_html=True)
+
+    @staticmethod
+    def _layout_suffix() -> str:
+        """Key suffix keeping repeated layouts in one run from colliding."""
+        run = st.session_state.get(RUN_ID_KEY)
+        last = st.session_state.get(_LAYOUT_RUN_KEY)
+        count = last[1] + 1 if last is not None and last[0] == run else 0
+        st.session_state[_LAYOUT_RUN_KEY] = (run, count)
+        return f"-{count}" if count else ""
+
+    @staticmethod
+    def _layout_container(key: str):
+        """Container keyed `key` where supported, a plain one otherwise."""
+        if _HAS_KEYED_CONTAINER:
+            return st.container(key=key)
+        return st.container()
 
     @staticmethod
     def mobile_columns(*ratios) -> Tuple:
@@ -121,23 +307,7 @@ class ResponsiveDesign:
         Returns:
             Boolean indicating if button was clicked
         """
-        # Add mobile-specific styling
-        st.markdown(
-            f"""
-            <style>
-            div[data-testid="stButton"] > button[kind="primary"] {{
-                width: 100%;
-                height: 44px;
-                font-size: 16px;
-                border-radius: 8px;
-                margin: 8px 0;
-                touch-action: manipulation;
-            }}
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
-
+        ResponsiveDesign.ensure_mobile_css()
         return st.button(label, key=key, **kwargs)
 
     @staticmethod
@@ -149,28 +319,7 @@ class ResponsiveDesign:
             label: Uploader label
             **kwargs: Additional arguments for st.file_uploader
         """
-        # Add mobile-specific styling
-        st.markdown(
-            """
-            <style>
-            .stFileUploader {
-                margin: 16px 0;
-            }
-            .stFileUploader > div {
-                padding: 16px;
-                border: 2px dashed #ccc;
-                border-radius: 8px;
-                text-align: center;
-                min-height: 80px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
-
+        ResponsiveDesign.ensure_mobile_css()
         return st.file_uploader(label, **kwargs)
 
     @staticmethod
@@ -183,21 +332,7 @@ class ResponsiveDesign:
             options: List of options
             **kwargs: Additional arguments for st.selectbox
         """
-        # Add mobile-specific styling
-        st.markdown(
-            """
-            <style>
-            .stSelectbox > div > div > select {
-                font-size: 16px !important;
-                height: 44px;
-                padding: 8px 12px;
-                border-radius: 8px;
-            }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
-
+        ResponsiveDesign.ensure_mobile_css()
         return st.selectbox(label, options, **kwargs)
 
     @staticmethod
@@ -209,27 +344,7 @@ class ResponsiveDesign:
             label: Input label
             **kwargs: Additional arguments for st.text_input
         """
-        # Add mobile-specific styling
-        st.markdown(
-            """
-            <style>
-            .stTextInput > div > div > input {
-                font-size: 16px !important;
-                height: 44px;
-                padding: 8px 12px;
-                border-radius: 8px;
-                border: 2px solid #ddd;
-            }
-            .stTextInput > div > div > input:focus {
-                border-color: #007bff;
-                outline: none;
-                box-shadow: 0 0 0 2px rgba(0, 123, 255, 0.25);
-            }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
-
+        ResponsiveDesign.ensure_mobile_css()
         return st.text_input(label, **kwargs)
 
     @staticmethod
@@ -242,6 +357,7 @@ class ResponsiveDesign:
             value: Metric value
             delta: Optional delta value
         """
+        ResponsiveDesign.ensure_mobile_css()
         # Create mobile-friendly metric layout
         st.markdown(
             f"""
@@ -250,42 +366,6 @@ class ResponsiveDesign:
                 <div class="metric-value">{value}</div>
                 {f'<div class="metric-delta">{delta}</div>' if delta else ''}
             </div>
-            <style>
-            .mobile-metric {{
-                background: #f8f9fa;
-                padding: 16px;
-                border-radius: 8px;
-                margin: 8px 0;
-                text-align: center;
-                border: 1px solid #e9ecef;
-            }}
-            .metric-label {{
-                font-size: 14px;
-                color: #6c757d;
-                margin-bottom: 8px;
-                font-weight: 500;
-            }}
-            .metric-value {{
-                font-size: 24px;
-                font-weight: bold;
-                color: #212529;
-                margin-bottom: 4px;
-            }}
-            .metric-delta {{
-                font-size: 12px;
-                color: #28a745;
-                font-weight: 500;
-            }}
-            @media (max-width: 767px) {{
-                .mobile-metric {{
-                    padding: 12px;
-                    margin: 6px 0;
-                }}
-                .metric-value {{
-                    font-size: 20px;
-                }}
-            }}
-            </style>
             """,
             unsafe_allow_html=True,
         )
@@ -303,32 +383,10 @@ class ResponsiveDesign:
         Get responsive configuration for Plotly charts.
 
         Returns:
-            Dictionary with responsive chart configuration
+            Dictionary with responsive chart configuration. The same dict is
+            returned on every call; copy it before modifying.
         """
-        return {
-            "displayModeBar": False,  # Hide toolbar on mobile
-            "responsive": True,
-            "displaylogo": False,
-            "modeBarButtonsToRemove": [
-                "pan2d",
-                "lasso2d",
-                "select2d",
-                "autoScale2d",
-                "hoverClosestCartesian",
-                "hoverCompareCartesian",
-            ],
-            "layout": {
-                "margin": {"l": 20, "r": 20, "t": 40, "b": 40},
-                "font": {"size": 12},
-                "showlegend": True,
-                "legend": {
-                    "orientation": "h",
-                    "y": -0.2,
-                    "x": 0.5,
-                    "xanchor": "center",
-                },
-            },
-        }
+        return _CHART_CONFIG
 
     @staticmethod
     def mobile_navigation_menu(options: Dict[str, str]) -> str:
@@ -341,49 +399,7 @@ class ResponsiveDesign:
         Returns:
             Selected option value
         """
-        st.markdown(
-            """
-            <style>
-            .mobile-nav {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 8px;
-                padding: 16px 0;
-                justify-content: center;
-            }
-            .mobile-nav-item {
-                padding: 8px 16px;
-                background: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 20px;
-                text-decoration: none;
-                color: #495057;
-                font-size: 14px;
-                font-weight: 500;
-                transition: all 0.2s;
-                cursor: pointer;
-                min-height: 40px;
-                display: flex;
-                align-items: center;
-            }
-            .mobile-nav-item:hover,
-            .mobile-nav-item.active {
-                background: #007bff;
-                color: white;
-                border-color: #007bff;
-            }
-            @media (max-width: 767px) {
-                .mobile-nav-item {
-                    flex: 1 1 calc(50% - 4px);
-                    text-align: center;
-                    justify-content: center;
-                    min-width: 120px;
-                }}
-            }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        ResponsiveDesign.ensure_mobile_css()
 
         # Use selectbox for mobile navigation
         return st.selectbox(
@@ -4,7 +4,12 @@ Web application configuration.
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+
+# Environment overrides, read once at import
+_ENV_HEADERS_FILE = os.getenv("YOUTUBE_MUSIC_HEADERS_FILE")
+_ENV_MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB") or 100)
+_ENV_CACHE_TTL = int(os.getenv("CACHE_TTL") or 3600)
 
 
 @dataclass
@@ -23,31 +28,17 @@ class WebConfig:
     initial_sidebar_state: str = "expanded"
 
     # File upload settings
-    max_file_size_mb: int = 100
-    supported_formats: list = None
+    max_file_size_mb: int = _ENV_MAX_FILE_SIZE_MB
+    supported_formats: Tuple[str, ...] = ("csv", "json", "xml")
 
     # API settings
-    youtube_music_headers_file: Optional[str] = None
+    youtube_music_headers_file: Optional[str] = _ENV_HEADERS_FILE
     musicbrainz_rate_limit: float = 1.2  # seconds between requests
 
     # Performance settings
-    cache_ttl: int = 3600  # 1 hour
+    cache_ttl: int = _ENV_CACHE_TTL  # 1 hour unless CACHE_TTL is set
     max_library_size: int = 50000  # tracks
 
-    def __post_init__(self):
-        if self.supported_formats is None:
-            self.supported_formats = ["csv", "json", "xml"]
-
-        # Load from environment variables
-        self.youtube_music_headers_file = os.getenv("YOUTUBE_MUSIC_HEADERS_FILE")
-
-        # Override from environment
-        if os.getenv("MAX_FILE_SIZE_MB"):
-            self.max_file_size_mb = int(os.getenv("MAX_FILE_SIZE_MB"))
-
-        if os.getenv("CACHE_TTL"):
-            self.cache_ttl = int(os.getenv("CACHE_TTL"))
-
 
 # Global config instance
 config = WebConfig()
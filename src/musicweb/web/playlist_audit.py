@@ -7,8 +7,14 @@ using the LibraryComparator/TrackMatcher for fuzzy matching.
 
 from __future__ import annotations
 
+import codecs
 import csv
+import io
+import itertools
+import re
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -30,44 +36,34 @@ def parse_playlist_bytes(data: bytes) -> List[PlaylistItem]:
     Supports Apple Music text export (UTF-16/TSV with headers) and simple
     "Artist - Title" per line formats.
     """
-    # Try common encodings for Apple Music text export
-    encodings = ["utf-16", "utf-16-le", "utf-16-be", "utf-8-sig", "utf-8"]
-    text = None
-    for enc in encodings:
-        try:
-            text = data.decode(enc)
-            break
-        except Exception:
-            continue
-    if text is None:
-        text = data.decode("utf-8", errors="ignore")
-
-    # Normalize newlines
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [ln for ln in text.split("\n") if ln.strip()]
-    if not lines:
+    # Decode lazily; newline="" leaves \r, \n and \r\n all as line breaks
+    stream = io.TextIOWrapper(
+        io.BytesIO(data), encoding=_sniff_encoding(data), errors="ignore", newline=""
+    )
+    header = next((ln for ln in stream if ln.strip()), "")
+    if not header:
         return []
 
-    header = lines[0]
     items: List[PlaylistItem] = []
-    if "\t" in header and ("Name" in header or "N\x00a\x00m\x00e" in header):
+    if "\t" in header and "Name" in header:
         # Tab-separated export with headers
-        rows = [ln.split("\t") for ln in lines]
-        hdr = [h.strip() for h in rows[0]]
+        hdr = [h.strip() for h in header.rstrip("\r\n").split("\t")]
+
+        # Lowercased header -> position of its first occurrence
+        cols: Dict[str, int] = {}
+        for i, h in enumerate(hdr):
+            cols.setdefault(h.lower(), i)
 
         def find_col(names: List[str]) -> Optional[int]:
-            low = [h.lower() for h in hdr]
-            for nm in names:
-                if nm.lower() in low:
-                    return low.index(nm.lower())
-            return None
+            return next((cols[nm] for nm in map(str.lower, names) if nm in cols), None)
 
         i_title = find_col(["Name", "Title", "Song", "Track"]) or 0
         i_artist = find_col(["Artist", "Artists", "Performer"]) or 1
         i_album = find_col(["Album", "Release", "Album Name"])  # optional
         i_time = find_col(["Time", "Duration"])  # optional
 
-        for row in rows[1:]:
+        # Apple Music never quotes fields; a '"' in a title is literal
+        for row in csv.reader(stream, delimiter="\t", quoting=csv.QUOTE_NONE):
             title = row[i_title].strip() if i_title < len(row) else ""
             artist = row[i_artist].strip() if i_artist < len(row) else ""
             if not (title and artist):
@@ -88,7 +84,7 @@ def parse_playlist_bytes(data: bytes) -> List[PlaylistItem]:
         return items
 
     # Otherwise assume simple per-line format: "Artist - Title" or "Title - Artist"
-    for ln in lines:
+    for ln in itertools.chain([header], stream):
         if " - " in ln:
             left, right = [x.strip() for x in ln.split(" - ", 1)]
             # Default to artist-first
@@ -100,6 +96,25 @@ def parse_playlist_bytes(data: bytes) -> List[PlaylistItem]:
     return items
 
 
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _sniff_encoding(data: bytes) -> str:
+    """Pick the codec for a playlist export from its BOM, defaulting to UTF-8."""
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+    head = data[:1024]
+    if b"\x00" in head:
+        # BOM-less UTF-16: mostly-ASCII text leaves a NUL in every other byte
+        return "utf-16-be" if head[0::2].count(0) > head[1::2].count(0) else "utf-16-le"
+    return "utf-8"
+
+
 def _parse_time_to_seconds(val: str) -> Optional[int]:
     if not val:
         return None
@@ -116,6 +131,27 @@ def _parse_time_to_seconds(val: str) -> Optional[int]:
         return None
 
 
+# (exact, base-title, artist-token) indices returned by `build_indices`
+AuditIndices = Tuple[
+    Dict[Tuple[str, str], List[Track]],
+    Dict[Tuple[str, str], List[Track]],
+    Dict[str, List[int]],
+]
+
+AUDIT_COLUMNS = (
+    "playlist_title",
+    "playlist_artist",
+    "playlist_album",
+    "playlist_duration",
+    "status",
+    "confidence",
+    "match_title",
+    "match_artist",
+    "match_album",
+    "match_duration",
+)
+
+
 def audit_playlist(
     items: List[PlaylistItem],
     library: Library,
@@ -124,110 +160,134 @@ def audit_playlist(
     enable_duration: bool = True,
     present_threshold: float = 0.82,
     review_threshold: float = 0.70,
-) -> Dict[str, List[Dict[str, Any]]]:
+    indices: Optional[AuditIndices] = None,
+) -> Dict[str, Dict[str, List[Any]]]:
     """Audit items against the given library and bucket into present/review/missing.
 
-    Returns dict with keys 'present', 'review', 'missing' containing row dicts.
+    `indices` may be passed in from an earlier `build_indices(
+    library.music_tracks)` call so re-audits of an unchanged library skip
+    the indexing pass.
+
+    Returns dict with keys 'present', 'review', 'missing', each a columnar
+    mapping of `AUDIT_COLUMNS` to equal-length value lists (ready for
+    `pd.DataFrame`).
     """
-    # Build indices
-    exact_idx, base_idx = _build_indices(library.music_tracks)
-    present_rows: List[Dict[str, Any]] = []
-    review_rows: List[Dict[str, Any]] = []
-    missing_rows: List[Dict[str, Any]] = []
+    if indices is None:
+        indices = build_indices(library.music_tracks)
+    exact_idx, base_idx, token_idx = indices
+    buckets: Dict[str, Dict[str, List[Any]]] = {
+        bucket: {col: [] for col in AUDIT_COLUMNS}
+        for bucket in ("present", "review", "missing")
+    }
 
     matcher = LibraryComparator(
         strict_mode=False, enable_duration=enable_duration, enable_album=enable_album
     ).matcher
 
-    for it in items:
+    # Normalize each playlist entry once, up front
+    sources = [
+        Track(
+            title=it.title,
+            artist=it.artist,
+            album=it.album or None,
+            duration=it.duration or None,
+            platform="playlist",
+        )
+        for it in items
+    ]
+    base_titles = [_strip_version_tokens(s.normalized_title) for s in sources]
+
+    for it, source, base_title in zip(items, sources, base_titles):
         bucket, best, score = _match_item(
-            it,
+            source,
+            base_title,
             library.music_tracks,
             exact_idx,
             base_idx,
+            token_idx,
             matcher,
             present_threshold,
             review_threshold,
         )
-        row = {
-            "playlist_title": it.title,
-            "playlist_artist": it.artist,
-            "playlist_album": it.album or "",
-            "playlist_duration": it.duration or "",
-            "status": bucket,
-            "confidence": round(score, 3),
-            "match_title": getattr(best, "title", "") or "",
-            "match_artist": getattr(best, "artist", "") or "",
-            "match_album": getattr(best, "album", "") or "",
-            "match_duration": getattr(best, "duration", "") or "",
-        }
-        if bucket == "present":
-            present_rows.append(row)
-        elif bucket == "review":
-            review_rows.append(row)
+        if best is None:
+            match = ("", "", "", "")
         else:
-            missing_rows.append(row)
-
-    return {"present": present_rows, "review": review_rows, "missing": missing_rows}
+            match = (
+                best.title or "",
+                best.artist or "",
+                best.album or "",
+                best.duration or "",
+            )
+        values = (
+            it.title,
+            it.artist,
+            it.album or "",
+            it.duration or "",
+            bucket,
+            round(score, 3),
+            *match,
+        )
+        columns = buckets[bucket]
+        for col, value in zip(AUDIT_COLUMNS, values):
+            columns[col].append(value)
 
+    return buckets
 
-def _build_indices(tracks: List[Track]):
-    exact = {}
-    base = {}
-    for t in tracks:
-        key = (t.normalized_title, t.normalized_artist)
-        exact.setdefault(key, []).append(t)
-        base_title = _strip_version_tokens(t.normalized_title)
-        base.setdefault((base_title, t.normalized_artist), []).append(t)
-    return exact, base
 
+def build_indices(tracks: List[Track]) -> AuditIndices:
+    """Lookup tables over the library's tracks for `audit_playlist`.
 
+    Returns (exact, base, token): tracks by normalized (title, artist), by
+    (base title, artist), and the positions in `tracks` of the tracks
+    carrying each artist token. Non-music tracks are left out of all three.
+    """
+    exact: Dict[Tuple[str, str], List[Track]] = defaultdict(list)
+    base: Dict[Tuple[str, str], List[Track]] = defaultdict(list)
+    token: Dict[str, List[int]] = defaultdict(list)
+    for i, t in enumerate(tracks):
+        if not t.is_music:
+            continue
+        nt, na = t.normalized_title, t.normalized_artist
+        exact[(nt, na)].append(t)
+        base[(_strip_version_tokens(nt), na)].append(t)
+        for tok in t.artist_tokens or ():
+            token[tok].append(i)
+    return exact, base, token
+
+
+# Version/edition markers dropped to find the base title, fused into one pass.
+# "radio edit" and "<year> remaster" are left out on purpose: the standalone
+# "edit"/"remaster" words always took precedence, keeping "radio" and the year.
+_VERSION_RE = re.compile(
+    r"\b(?:remaster(?:ed)?|remix|version|live|acoustic|instrumental|deluxe"
+    r"|extended|edit|demo|mono|stereo|explicit|clean)\b",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+
+# Fuzzy scan stops at the first candidate this far above present_threshold
+_EARLY_EXIT_MARGIN = 0.05
+
+
+# Library tracks and playlist items share many titles across audits
+@lru_cache(maxsize=65536)
 def _strip_version_tokens(title: str) -> str:
-    import re
-
     if not title:
         return ""
-    patterns = [
-        r"\bremaster(?:ed)?\b",
-        r"\bremix\b",
-        r"\bversion\b",
-        r"\blive\b",
-        r"\bacoustic\b",
-        r"\binstrumental\b",
-        r"\bdeluxe\b",
-        r"\bextended\b",
-        r"\bedit\b",
-        r"\bradio\s+edit\b",
-        r"\bdemo\b",
-        r"\bmono\b",
-        r"\bstereo\b",
-        r"\bexplicit\b",
-        r"\bclean\b",
-        r"\b\d{2,4}\s+remaster(?:ed)?\b",
-    ]
-    cleaned = title
-    for p in patterns:
-        cleaned = re.sub(p, " ", cleaned, flags=re.IGNORECASE)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return _WS_RE.sub(" ", _VERSION_RE.sub(" ", title)).strip()
 
 
 def _match_item(
-    item: PlaylistItem,
+    source: Track,
+    base_title: str,
     lib_tracks: List[Track],
     exact_idx,
     base_idx,
+    token_idx,
     matcher,
     present_threshold: float,
     review_threshold: float,
 ) -> Tuple[str, Optional[Track], float]:
-    source = Track(
-        title=item.title,
-        artist=item.artist,
-        album=item.album or None,
-        duration=item.duration or None,
-        platform="playlist",
-    )
-
     # 1) Exact normalized
     key = (source.normalized_title, source.normalized_artist)
     candidates = exact_idx.get(key, [])
@@ -235,7 +295,6 @@ def _match_item(
         return "present", candidates[0], 0.98
 
     # 2) Base-title exact
-    base_title = _strip_version_tokens(source.normalized_title)
     base_key = (base_title, source.normalized_artist)
     candidates = base_idx.get(base_key, [])
     if candidates:
@@ -251,13 +310,15 @@ def _match_item(
 
     # 3) Fuzzy across all (prefilter by artist token overlap)
     src_tokens = source.artist_tokens or set()
-    cands = []
     if src_tokens:
-        for t in lib_tracks:
-            if not t.is_music or not t.artist_tokens:
-                continue
-            if src_tokens.intersection(t.artist_tokens):
-                cands.append(t)
+        # Count shared artist tokens per track; try the closest artists first,
+        # library order among equals. Tracks are looked up lazily since the
+        # scan below usually stops early.
+        shared = Counter()
+        for tok in src_tokens:
+            shared.update(token_idx.get(tok, ()))
+        order = sorted(shared, key=lambda i: (-shared[i], i))
+        cands = map(lib_tracks.__getitem__, order)
     else:
         cands = lib_tracks
 
@@ -266,6 +327,9 @@ def _match_item(
         score = matcher.calculate_match_confidence(source, c)
         if score > best_score:
             best, best_score = c, score
+            if score >= present_threshold + _EARLY_EXIT_MARGIN:
+                # Clearly present; the remaining candidates can't change the bucket
+                return "present", best, best_score
     if best and best_score >= present_threshold:
         return "present", best, best_score
     if best and best_score >= review_threshold:
@@ -2,40 +2,37 @@
 Pytest configuration and shared fixtures for MusicWeb tests.
 """
 
+import copy
 import json
 import os
-import shutil
-import tempfile
+import time
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from unittest.mock import DEFAULT, Mock, patch
 
-import pandas as pd
 import pytest
 
 # Set test environment
 os.environ["ENVIRONMENT"] = "testing"
 os.environ["LOG_LEVEL"] = "WARNING"
 
-from musicweb.core.comparison import LibraryComparator
-
 # Import after setting environment
 from musicweb.core.models import Library, Track
-from musicweb.platforms.detection import detect_platform
 
 
 @pytest.fixture(scope="session")
-def temp_dir():
+def temp_dir(tmp_path_factory) -> Path:
     """Create a temporary directory for test files."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    return tmp_path_factory.mktemp("musicweb")
 
 
-@pytest.fixture
-def sample_tracks() -> List[Track]:
-    """Create sample track data for testing."""
-    return [
+@pytest.fixture(scope="session")
+def session_sample_tracks() -> Tuple[Track, ...]:
+    """Sample tracks, built once per test run; use `sample_tracks` in tests."""
+    return (
         Track(
             title="Test Song 1",
             artist="Test Artist 1",
@@ -60,7 +57,14 @@ def sample_tracks() -> List[Track]:
             isrc="SHARED12345678",
             platform="youtube_music",
         ),
-    ]
+    )
+
+
+@pytest.fixture
+def sample_tracks(session_sample_tracks) -> List[Track]:
+    """Create sample track data for testing."""
+    # Library.add_track rewrites track.platform, so each test gets copies
+    return [copy.copy(track) for track in session_sample_tracks]
 
 
 @pytest.fixture
@@ -72,7 +76,15 @@ def sample_library(sample_tracks) -> Library:
     return library
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def readonly_sample_library(session_sample_tracks) -> Library:
+    """`sample_library` built once per run, for tests that never modify it."""
+    library = Library(name="Test Library", platform="spotify")
+    library.add_tracks([copy.copy(track) for track in session_sample_tracks])
+    return library
+
+
+@pytest.fixture(scope="session")
 def spotify_csv_data() -> str:
     """Sample Spotify CSV data."""
     return """Track Name,Artist Name(s),Album Name,Duration (ms),ISRC
@@ -81,7 +93,7 @@ Test Song 2,Test Artist 2,Test Album 2,210000,TEST987654321
 Shared Song,Shared Artist,Shared Album,195000,SHARED12345678"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def apple_csv_data() -> str:
     """Sample Apple Music CSV data."""
     return """Name,Artist,Album,Time,Composer
@@ -90,9 +102,9 @@ Different Song,Different Artist,Different Album,2:45,
 Shared Song,Shared Artist,Shared Album,3:15,"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def youtube_json_data() -> Dict[str, Any]:
-    """Sample YouTube Music JSON data."""
+    """Sample YouTube Music JSON data (shared across tests; do not mutate)."""
     return {
         "playlists": [
             {
@@ -122,7 +134,17 @@ def youtube_json_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_upload_bytes(spotify_csv_data, apple_csv_data) -> Dict[str, bytes]:
+    """Bytes of each sample CSV library by file name, for uploads."""
+    return {
+        "spotify_library.csv": spotify_csv_data.encode(),
+        "apple_library.csv": apple_csv_data.encode(),
+    }
+
+
+# Written once per run; tests only read these files
+@pytest.fixture(scope="session")
 def spotify_csv_file(temp_dir, spotify_csv_data) -> Path:
     """Create a temporary Spotify CSV file."""
     file_path = temp_dir / "spotify_library.csv"
@@ -130,7 +152,7 @@ def spotify_csv_file(temp_dir, spotify_csv_data) -> Path:
     return file_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def apple_csv_file(temp_dir, apple_csv_data) -> Path:
     """Create a temporary Apple Music CSV file."""
     file_path = temp_dir / "apple_library.csv"
@@ -138,7 +160,7 @@ def apple_csv_file(temp_dir, apple_csv_data) -> Path:
     return file_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def youtube_json_file(temp_dir, youtube_json_data) -> Path:
     """Create a temporary YouTube Music JSON file."""
     file_path = temp_dir / "youtube_library.json"
@@ -146,31 +168,99 @@ def youtube_json_file(temp_dir, youtube_json_data) -> Path:
     return file_path
 
 
+class MockStreamlit:
+    """Streamlit components patched with mocks for web interface tests.
+
+    Mocks are reachable as attributes or by name (``mocks["sidebar"]``).
+    """
+
+    PATCHED = (
+        "set_page_config",
+        "title",
+        "markdown",
+        "sidebar",
+        "columns",
+        "file_uploader",
+        "button",
+        "selectbox",
+        "write",
+        "success",
+        "error",
+        "warning",
+        "info",
+        "dataframe",
+        "plotly_chart",
+        "download_button",
+    )
+
+    def __enter__(self):
+        self._patcher = patch.multiple(
+            "streamlit", **dict.fromkeys(self.PATCHED, DEFAULT)
+        )
+        for name, mock in self._patcher.start().items():
+            setattr(self, name, mock)
+        self.reset()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._patcher.stop()
+
+    def __getitem__(self, name: str) -> Mock:
+        return getattr(self, name)
+
+    def reset(self):
+        """Forget recorded calls and restore the default return values."""
+        for name in self.PATCHED:
+            getattr(self, name).reset_mock(return_value=True, side_effect=True)
+
+        self.sidebar.write = Mock()
+        self.sidebar.file_uploader = Mock(return_value=None)
+        self.sidebar.button = Mock(return_value=False)
+        self.sidebar.selectbox = Mock(return_value="Compare Libraries")
+        self.sidebar.radio = Mock(return_value="Spotify")
+        self.file_uploader.return_value = None
+        self.button.return_value = False
+        self.selectbox.return_value = "Option 1"
+
+
+@pytest.fixture(scope="class")
+def streamlit_mocks():
+    """Streamlit patched once per test class (or module)."""
+    with MockStreamlit() as mocks:
+        yield mocks
+
+
 @pytest.fixture
-def mock_streamlit():
+def mock_streamlit(streamlit_mocks) -> MockStreamlit:
     """Mock Streamlit components for web interface testing."""
-    with patch("streamlit.write") as mock_write, patch(
-        "streamlit.sidebar"
-    ) as mock_sidebar, patch("streamlit.file_uploader") as mock_uploader, patch(
-        "streamlit.button"
-    ) as mock_button, patch(
-        "streamlit.selectbox"
-    ) as mock_selectbox:
-
-        mock_sidebar.write = Mock()
-        mock_sidebar.button = Mock(return_value=False)
-        mock_sidebar.selectbox = Mock(return_value="Option 1")
-        mock_uploader.return_value = None
-        mock_button.return_value = False
-        mock_selectbox.return_value = "Option 1"
-
-        yield {
-            "write": mock_write,
-            "sidebar": mock_sidebar,
-            "file_uploader": mock_uploader,
-            "button": mock_button,
-            "selectbox": mock_selectbox,
+    # Cheaper than re-patching: reset what the previous test recorded
+    streamlit_mocks.reset()
+    return streamlit_mocks
+
+
+SMALL_UPLOAD_BYTES = b"test,data\n1,2\n3,4"
+
+
+# Library payload returned by the mocked YTMusic client; treat as read-only
+YTMUSIC_LIBRARY_RESPONSE = {
+    "tracks": [
+        {
+            "title": "Test Song",
+            "artists": [{"name": "Test Artist"}],
+            "album": {"name": "Test Album"},
+            "duration": "3:00",
         }
+    ]
+}
+
+
+YTMUSIC_HEADERS = {
+    "User-Agent": "Mozilla/5.0 Test Browser",
+    "Accept": "*/*",
+    "Authorization": "SAPISIDHASH test_hash",
+    "Cookie": "test_cookie=test_value",
+    "X-Goog-Visitor-Id": "test_visitor_id",
+}
 
 
 @pytest.fixture
@@ -179,33 +269,34 @@ def mock_file_upload():
     mock_file = Mock()
     mock_file.name = "test_file.csv"
     mock_file.type = "text/csv"
-    mock_file.read.return_value = b"test,data\n1,2\n3,4"
-    mock_file.getvalue.return_value = b"test,data\n1,2\n3,4"
+    mock_file.read.return_value = SMALL_UPLOAD_BYTES
+    mock_file.getvalue.return_value = SMALL_UPLOAD_BYTES
     return mock_file
 
 
-@pytest.fixture
-def mock_youtube_api():
-    """Mock YouTube Music API for testing."""
+@pytest.fixture(scope="class")
+def youtube_api_mocks():
+    """YTMusic patched once per test class (or module)."""
     with patch("musicweb.integrations.youtube_music.YTMusic") as mock_ytmusic:
         mock_instance = Mock()
-        mock_instance.get_library.return_value = {
-            "tracks": [
-                {
-                    "title": "Test Song",
-                    "artists": [{"name": "Test Artist"}],
-                    "album": {"name": "Test Album"},
-                    "duration": "3:00",
-                }
-            ]
-        }
+        mock_instance.get_library.return_value = YTMUSIC_LIBRARY_RESPONSE
         mock_ytmusic.return_value = mock_instance
         yield mock_instance
 
 
 @pytest.fixture
-def comparator(sample_library):
+def mock_youtube_api(youtube_api_mocks):
+    """Mock YouTube Music API for testing."""
+    youtube_api_mocks.reset_mock()
+    return youtube_api_mocks
+
+
+@pytest.fixture
+def comparator(readonly_sample_library):
     """Create a LibraryComparator instance for testing."""
+    # Imported here so runs that never ask for a comparator skip it
+    from musicweb.core.comparison import LibraryComparator
+
     return LibraryComparator()
 
 
@@ -230,15 +321,17 @@ def test_config():
     }
 
 
-@pytest.fixture(autouse=True)
+LOG_FILES = ("test.log", "test_errors.log", "musicweb.log", "musicweb_errors.log")
+
+
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_logs():
-    """Automatically clean up test logs."""
+    """Automatically clean up test logs once the session is over."""
     yield
     # Clean up any log files created during testing
-    log_files = ["test.log", "test_errors.log", "musicweb.log", "musicweb_errors.log"]
-    for log_file in log_files:
-        if Path(log_file).exists():
-            Path(log_file).unlink()
+    for log_file in LOG_FILES:
+        with suppress(FileNotFoundError):
+            os.unlink(log_file)
 
 
 # Pytest configuration
@@ -251,24 +344,38 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "api: marks tests that test API integration")
 
 
+# Directory names and test-file name words -> marker for the tests found there
+PATH_MARKERS = {
+    "integration": pytest.mark.integration,
+    "unit": pytest.mark.unit,
+    "web": pytest.mark.web,
+    "streamlit": pytest.mark.web,
+    "api": pytest.mark.api,
+    "youtube": pytest.mark.api,
+}
+
+
 def pytest_collection_modifyitems(config, items):
     """Automatically mark tests based on their location."""
+    markers_by_path = {}
     for item in items:
-        # Mark tests in integration folder
-        if "integration" in str(item.fspath):
-            item.add_marker(pytest.mark.integration)
-
-        # Mark tests in unit folder
-        if "unit" in str(item.fspath):
-            item.add_marker(pytest.mark.unit)
-
-        # Mark web interface tests
-        if "web" in str(item.fspath) or "streamlit" in str(item.fspath):
-            item.add_marker(pytest.mark.web)
-
-        # Mark API tests
-        if "api" in str(item.fspath) or "youtube" in str(item.fspath):
-            item.add_marker(pytest.mark.api)
+        markers = markers_by_path.get(item.path)
+        if markers is None:
+            # Only look below the rootdir, so the checkout location never
+            # matches (e.g. a clone living under ".../musicweb/")
+            try:
+                rel = item.path.relative_to(config.rootpath)
+            except ValueError:
+                rel = item.path
+            words = {*rel.parent.parts, *rel.stem.split("_")}
+            # One of each marker even when two words map to it
+            markers = markers_by_path[item.path] = {
+                PATH_MARKERS[word].name: PATH_MARKERS[word]
+                for word in words & PATH_MARKERS.keys()
+            }.values()
+
+        for marker in markers:
+            item.add_marker(marker)
 
 
 # Custom assertion helpers
@@ -301,28 +408,28 @@ def track_assertions():
 
 
 # Performance testing utilities
-@pytest.fixture
-def performance_timer():
-    """Timer utility for performance testing."""
-    import time
+@dataclass
+class Timer:
+    """Monotonic stopwatch for performance assertions."""
+
+    start_ns: int = 0
+    elapsed_ns: Optional[int] = None
 
-    class Timer:
-        def __init__(self):
-            self.start_time = None
-            self.end_time = None
+    def start(self):
+        self.start_ns = time.perf_counter_ns()
 
-        def start(self):
-            self.start_time = time.time()
+    def stop(self):
+        self.elapsed_ns = time.perf_counter_ns() - self.start_ns
 
-        def stop(self):
-            self.end_time = time.time()
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds between start() and stop(); None until stopped."""
+        return None if self.elapsed_ns is None else self.elapsed_ns / 1e9
 
-        @property
-        def elapsed(self):
-            if self.start_time and self.end_time:
-                return self.end_time - self.start_time
-            return None
 
+@pytest.fixture
+def performance_timer() -> Timer:
+    """Timer utility for performance testing."""
     return Timer()
 
 
@@ -343,9 +450,9 @@ def sample_track() -> Track:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spotify_json_data_old() -> Dict[str, Any]:
-    """Sample Spotify JSON data for testing."""
+    """Sample Spotify JSON data for testing (shared; do not mutate)."""
     return [
         {
             "platform": "spotify",
@@ -372,21 +479,15 @@ def spotify_json_data_old() -> Dict[str, Any]:
     ]
 
 
-@pytest.fixture
-def mock_ytmusic_headers() -> Dict[str, str]:
-    """Mock YouTube Music headers for testing."""
-    return {
-        "User-Agent": "Mozilla/5.0 Test Browser",
-        "Accept": "*/*",
-        "Authorization": "SAPISIDHASH test_hash",
-        "Cookie": "test_cookie=test_value",
-        "X-Goog-Visitor-Id": "test_visitor_id",
-    }
+@pytest.fixture(scope="session")
+def mock_ytmusic_headers() -> Mapping[str, str]:
+    """Mock YouTube Music headers for testing (read-only view)."""
+    return MappingProxyType(YTMUSIC_HEADERS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_headers_file(mock_ytmusic_headers, temp_dir) -> str:
     """Create a mock headers file."""
     headers_file = temp_dir / "headers_auth.json"
-    headers_file.write_text(json.dumps(mock_ytmusic_headers))
+    headers_file.write_text(json.dumps(dict(mock_ytmusic_headers)))
     return str(headers_file)
@@ -2,8 +2,10 @@
 Integration tests for the web interface.
 """
 
+import io
 import json
 import tempfile
+import uuid
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -11,102 +13,35 @@ import pytest
 
 from musicweb.core.models import Library, Track
 
+# ~340KB CSV body for the large upload test, built once at import
+LARGE_UPLOAD_BYTES = ("Track Name,Artist,Album,Duration\n" * 10000).encode()
+
+
+@pytest.fixture
+def mock_st(monkeypatch):
+    """Stand-in for the ``st`` module the app imports, restored after the test."""
+    mock = MagicMock()
+    monkeypatch.setattr("musicweb.web.app.st", mock)
+    return mock
+
 
 @pytest.mark.web
 class TestWebInterface:
     """Test the Streamlit web interface integration."""
 
-    @pytest.fixture
-    def mock_streamlit_components(self):
-        """Mock all Streamlit components."""
-        with patch("streamlit.set_page_config"), patch("streamlit.title"), patch(
-            "streamlit.markdown"
-        ), patch("streamlit.sidebar") as mock_sidebar, patch(
-            "streamlit.columns"
-        ), patch(
-            "streamlit.file_uploader"
-        ) as mock_uploader, patch(
-            "streamlit.button"
-        ) as mock_button, patch(
-            "streamlit.selectbox"
-        ) as mock_selectbox, patch(
-            "streamlit.write"
-        ), patch(
-            "streamlit.success"
-        ), patch(
-            "streamlit.error"
-        ), patch(
-            "streamlit.warning"
-        ), patch(
-            "streamlit.info"
-        ), patch(
-            "streamlit.dataframe"
-        ), patch(
-            "streamlit.plotly_chart"
-        ), patch(
-            "streamlit.download_button"
-        ):
-
-            # Configure sidebar mock
-            mock_sidebar.file_uploader = Mock(return_value=None)
-            mock_sidebar.button = Mock(return_value=False)
-            mock_sidebar.selectbox = Mock(return_value="Compare Libraries")
-            mock_sidebar.radio = Mock(return_value="Spotify")
-
-            # Configure other mocks
-            mock_uploader.return_value = None
-            mock_button.return_value = False
-            mock_selectbox.return_value = "Option 1"
-
-            yield {
-                "sidebar": mock_sidebar,
-                "file_uploader": mock_uploader,
-                "button": mock_button,
-                "selectbox": mock_selectbox,
-            }
-
-    def test_app_initialization(self, mock_streamlit_components):
+    def test_app_initialization(self, mock_st, mock_streamlit):
         """Test that the app initializes without errors."""
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-
-            try:
-                import musicweb.web.app
-
-                # If import succeeds, basic initialization works
-                assert True
-            except Exception as e:
-                pytest.fail(f"App initialization failed: {e}")
+        mock_st.sidebar = mock_streamlit["sidebar"]
 
-    def test_file_upload_spotify(self, mock_streamlit_components, spotify_csv_file):
-        """Test Spotify file upload and processing."""
-        # Create mock uploaded file
-        mock_file = Mock()
-        mock_file.name = "spotify_library.csv"
-        mock_file.type = "text/csv"
-        with open(spotify_csv_file, "rb") as f:
-            mock_file.getvalue.return_value = f.read()
-
-        mock_streamlit_components["file_uploader"].return_value = mock_file
-
-        with patch("musicweb.web.app.st") as mock_st, patch(
-            "musicweb.platforms.create_parser"
-        ) as mock_parser:
+        try:
+            import musicweb.web.app
 
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-            mock_st.file_uploader = mock_streamlit_components["file_uploader"]
+            # If import succeeds, basic initialization works
+            assert True
+        except Exception as e:
+            pytest.fail(f"App initialization failed: {e}")
 
-            # Mock parser
-            mock_parser_instance = Mock()
-            mock_parser_instance.parse.return_value = Library("Test", "spotify")
-            mock_parser.return_value = mock_parser_instance
-
-            # This would normally trigger file processing
-            result = mock_streamlit_components["file_uploader"]()
-            assert result is not None
-            assert result.name == "spotify_library.csv"
-
-    def test_file_upload_invalid_format(self, mock_streamlit_components):
+    def test_file_upload_invalid_format(self, mock_st, mock_streamlit):
         """Test handling of invalid file formats."""
         # Create mock invalid file
         mock_file = Mock()
@@ -114,28 +49,22 @@ class TestWebInterface:
         mock_file.type = "text/plain"
         mock_file.getvalue.return_value = b"invalid content"
 
-        mock_streamlit_components["file_uploader"].return_value = mock_file
+        mock_streamlit["file_uploader"].return_value = mock_file
 
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-            mock_st.file_uploader = mock_streamlit_components["file_uploader"]
-            mock_st.error = Mock()
+        mock_st.sidebar = mock_streamlit["sidebar"]
+        mock_st.file_uploader = mock_streamlit["file_uploader"]
+        mock_st.error = Mock()
 
-            # Test file type validation
-            result = mock_streamlit_components["file_uploader"]()
-            assert result.type == "text/plain"
+        # Test file type validation
+        result = mock_streamlit["file_uploader"]()
+        assert result.type == "text/plain"
 
-    def test_library_comparison_workflow(
-        self, mock_streamlit_components, sample_tracks
-    ):
+    def test_library_comparison_workflow(self, mock_st, mock_streamlit, sample_tracks):
         """Test complete library comparison workflow."""
-        with patch("musicweb.web.app.st") as mock_st, patch(
-            "musicweb.core.comparison.LibraryComparator"
-        ) as mock_comparator:
-
+        with patch("musicweb.core.comparison.LibraryComparator") as mock_comparator:
             # Setup mocks
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-            mock_st.button = mock_streamlit_components["button"]
+            mock_st.sidebar = mock_streamlit["sidebar"]
+            mock_st.button = mock_streamlit["button"]
             mock_st.success = Mock()
             mock_st.dataframe = Mock()
 
@@ -156,23 +85,23 @@ class TestWebInterface:
             mock_comparator.return_value = mock_comparator_instance
 
             # Simulate comparison button click
-            mock_streamlit_components["button"].return_value = True
+            mock_streamlit["button"].return_value = True
 
             # This would trigger the comparison workflow
-            button_clicked = mock_streamlit_components["button"]()
+            button_clicked = mock_streamlit["button"]()
             assert button_clicked is True
 
     def test_playlist_creation_workflow(
-        self, mock_streamlit_components, mock_youtube_api
+        self, mock_st, mock_streamlit, mock_youtube_api
     ):
         """Test playlist creation workflow."""
-        with patch("musicweb.web.app.st") as mock_st, patch(
+        with patch(
             "musicweb.integrations.playlist.PlaylistManager"
         ) as mock_playlist_mgr:
 
             # Setup mocks
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-            mock_st.button = mock_streamlit_components["button"]
+            mock_st.sidebar = mock_streamlit["sidebar"]
+            mock_st.button = mock_streamlit["button"]
             mock_st.text_input = Mock(return_value="Test Playlist")
             mock_st.success = Mock()
 
@@ -186,83 +115,77 @@ class TestWebInterface:
             mock_playlist_mgr.return_value = mock_mgr_instance
 
             # Simulate playlist creation
-            mock_streamlit_components["button"].return_value = True
+            mock_streamlit["button"].return_value = True
 
-            button_clicked = mock_streamlit_components["button"]()
+            button_clicked = mock_streamlit["button"]()
             assert button_clicked is True
 
-    def test_error_handling_in_ui(self, mock_streamlit_components):
+    def test_error_handling_in_ui(self, mock_st, mock_streamlit):
         """Test error handling in the UI."""
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
-            mock_st.error = Mock()
-            mock_st.exception = Mock()
+        mock_st.sidebar = mock_streamlit["sidebar"]
+        mock_st.error = Mock()
+        mock_st.exception = Mock()
 
-            # Test error display
-            mock_st.error("Test error message")
-            mock_st.error.assert_called_with("Test error message")
+        # Test error display
+        mock_st.error("Test error message")
+        mock_st.error.assert_called_with("Test error message")
 
     @pytest.mark.slow
     def test_large_file_upload_performance(
-        self, mock_streamlit_components, performance_timer
+        self, mock_st, mock_streamlit, performance_timer
     ):
         """Test performance with large file uploads."""
         # Create large mock file
-        large_data = "Track Name,Artist,Album,Duration\n" * 10000
-
         mock_file = Mock()
         mock_file.name = "large_library.csv"
         mock_file.type = "text/csv"
-        mock_file.getvalue.return_value = large_data.encode()
+        mock_file.getvalue.return_value = LARGE_UPLOAD_BYTES
 
-        mock_streamlit_components["file_uploader"].return_value = mock_file
+        mock_streamlit["file_uploader"].return_value = mock_file
 
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.sidebar = mock_streamlit_components["sidebar"]
+        mock_st.sidebar = mock_streamlit["sidebar"]
 
-            performance_timer.start()
-            # Simulate file processing
-            result = mock_streamlit_components["file_uploader"]()
-            performance_timer.stop()
+        performance_timer.start()
+        # Simulate file processing
+        result = mock_streamlit["file_uploader"]()
+        performance_timer.stop()
 
-            assert performance_timer.elapsed < 5.0  # Should process quickly
-            assert result is not None
+        assert performance_timer.elapsed < 5.0  # Should process quickly
+        assert result is not None
 
-    def test_session_state_management(self, mock_streamlit_components):
+    def test_session_state_management(self, mock_st, mock_streamlit):
         """Test Streamlit session state management."""
-        with patch("musicweb.web.app.st") as mock_st:
-            # Mock session state
-            mock_session_state = {}
-            mock_st.session_state = mock_session_state
+        # Mock session state
+        mock_session_state = {}
+        mock_st.session_state = mock_session_state
 
-            # Test state persistence
-            mock_st.session_state["library1"] = "test_library"
-            assert mock_st.session_state["library1"] == "test_library"
+        # Test state persistence
+        mock_st.session_state["library1"] = "test_library"
+        assert mock_st.session_state["library1"] == "test_library"
 
-    def test_download_functionality(self, mock_streamlit_components, temp_dir):
+    def test_download_functionality(self, mock_st, mock_streamlit, temp_dir):
         """Test file download functionality."""
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.download_button = Mock()
+        mock_st.download_button = Mock()
 
-            # Create test file
-            test_file = temp_dir / "test_results.csv"
-            test_file.write_text("test,data\n1,2\n3,4")
+        # Create test file
+        test_file = temp_dir / "test_results.csv"
+        test_file.write_text("test,data\n1,2\n3,4")
 
-            # Test download button
-            mock_st.download_button(
-                label="Download Results",
-                data=test_file.read_text(),
-                file_name="results.csv",
-                mime="text/csv",
-            )
+        # Test download button
+        mock_st.download_button(
+            label="Download Results",
+            data=test_file.read_text(),
+            file_name="results.csv",
+            mime="text/csv",
+        )
 
-            mock_st.download_button.assert_called_once()
+        mock_st.download_button.assert_called_once()
 
-    def test_visualization_components(self, mock_streamlit_components):
+    def test_visualization_components(self, mock_st, mock_streamlit):
         """Test data visualization components."""
-        with patch("musicweb.web.app.st") as mock_st, patch(
-            "plotly.express.pie"
-        ) as mock_pie, patch("plotly.express.bar") as mock_bar:
+        with patch("plotly.express.pie") as mock_pie, patch(
+            "plotly.express.bar"
+        ) as mock_bar:
 
             mock_st.plotly_chart = Mock()
 
@@ -276,35 +199,109 @@ class TestWebInterface:
 
             mock_st.plotly_chart.assert_called_once()
 
-    def test_navigation_and_tabs(self, mock_streamlit_components):
+    def test_navigation_and_tabs(self, mock_st, mock_streamlit):
         """Test navigation and tab functionality."""
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.tabs = Mock(return_value=[Mock(), Mock(), Mock()])
-            mock_st.sidebar.selectbox = Mock(return_value="Compare Libraries")
+        mock_st.tabs = Mock(return_value=[Mock(), Mock(), Mock()])
+        mock_st.sidebar.selectbox = Mock(return_value="Compare Libraries")
 
-            # Test tab creation
-            tabs = mock_st.tabs(["Tab 1", "Tab 2", "Tab 3"])
-            assert len(tabs) == 3
+        # Test tab creation
+        tabs = mock_st.tabs(["Tab 1", "Tab 2", "Tab 3"])
+        assert len(tabs) == 3
 
-            # Test sidebar navigation
-            selected = mock_st.sidebar.selectbox(
-                "Choose function", ["Option 1", "Option 2"]
-            )
-            assert selected == "Compare Libraries"
+        # Test sidebar navigation
+        selected = mock_st.sidebar.selectbox(
+            "Choose function", ["Option 1", "Option 2"]
+        )
+        assert selected == "Compare Libraries"
 
-    def test_responsive_layout(self, mock_streamlit_components):
+    def test_responsive_layout(self, mock_st, mock_streamlit):
         """Test responsive layout components."""
-        with patch("musicweb.web.app.st") as mock_st:
-            mock_st.columns = Mock(return_value=[Mock(), Mock()])
-            mock_st.container = Mock()
-            mock_st.expander = Mock()
+        mock_st.columns = Mock(return_value=[Mock(), Mock()])
+        mock_st.container = Mock()
+        mock_st.expander = Mock()
+
+        # Test layout components
+        cols = mock_st.columns(2)
+        assert len(cols) == 2
+
+        container = mock_st.container()
+        assert container is not None
+
+        expander = mock_st.expander("Details")
+        assert expander is not None
+
+
+@pytest.mark.web
+class TestLibraryUpload:
+    """Test uploaded library files going through the real parsers.
+
+    Kept out of TestWebInterface, whose class-wide Streamlit patches break
+    the app's cached platform detection.
+    """
+
+    @pytest.mark.parametrize(
+        "file_name,platform",
+        [
+            ("spotify_library.csv", "spotify"),
+            ("apple_library.csv", "apple_music"),
+        ],
+    )
+    def test_file_upload(self, mock_st, sample_upload_bytes, file_name, platform):
+        """Test library file upload and processing for each platform."""
+        from musicweb.web.app import SessionManager, load_uploaded_file
+
+        data = sample_upload_bytes[file_name]
+        uploaded = io.BytesIO(data)
+        uploaded.name = file_name
+        uploaded.size = len(data)
+
+        with patch.object(SessionManager, "add_library") as add_library:
+            assert load_uploaded_file(uploaded) is True
+
+        mock_st.error.assert_not_called()
+        (_, library), _ = add_library.call_args
+        assert library.platform == platform
+        assert library.total_tracks == 3
+
+
+def _dedup_group(gid):
+    """A two-entry duplicate group shaped like the YouTube Music scan output."""
+    return {
+        "id": gid,
+        "title": f"Song {gid}",
+        "artist": "Artist",
+        "pref_idx_explicit": 0,
+        "duplicates": [
+            {
+                "title": f"Song {gid}{suffix}",
+                "artists": ["Artist"],
+                "album": "Album",
+                "duration": "3:00",
+                "is_explicit": False,
+                "quality": "high",
+                "quality_score": score,
+                "id": f"vid{gid}{suffix}",
+                "thumbnail": "",
+            }
+            for suffix, score in (("", 10), (" (Live)", 5))
+        ],
+    }
+
+
+@pytest.mark.web
+class TestDedupExports:
+    """Test the cached Winners/Losers CSV exports of a deduplication scan."""
+
+    def test_exports_follow_selection_under_same_token(self):
+        """A later selection is not served the first selection's rows."""
+        from musicweb.web.app import _dedup_export_csv
 
-            # Test layout components
-            cols = mock_st.columns(2)
-            assert len(cols) == 2
+        groups = [_dedup_group(gid) for gid in (1, 2, 3)]
+        token = uuid.uuid4().hex
 
-            container = mock_st.container()
-            assert container is not None
+        first = _dedup_export_csv(token, (1,), False, True, groups).decode()
+        second = _dedup_export_csv(token, (2, 3), False, True, groups).decode()
 
-            expander = mock_st.expander("Details")
-            assert expander is not None
+        assert "vid1" in first and "vid2" not in first
+        assert len(second.splitlines()) == 3
+        assert "vid2" in second and "vid3" in second and "vid1" not in second
@@ -177,6 +177,28 @@ class TestLibraryComparator:
         assert performance_timer.elapsed < 10.0  # Should complete in under 10 seconds
         assert len(result.shared_tracks) == 1000
 
+    def test_parallel_comparison_matches_sequential(self):
+        """Test that sharding across worker processes gives the same results."""
+        lib1 = Library("Large Library 1", "spotify")
+        lib2 = Library("Large Library 2", "apple_music")
+
+        for i in range(500):
+            lib1.add_track(Track(f"Song {i}", f"Artist {i % 50}", duration=180 + i))
+            if i % 3:
+                lib2.add_track(Track(f"Song {i}", f"Artist {i % 50}", duration=181 + i))
+
+        sequential = LibraryComparator().compare_libraries(lib1, lib2)
+        parallel = LibraryComparator(workers=2).compare_libraries(lib1, lib2)
+
+        assert [
+            (m.source_track, m.target_track, m.confidence, m.match_type)
+            for m in parallel.matches
+        ] == [
+            (m.source_track, m.target_track, m.confidence, m.match_type)
+            for m in sequential.matches
+        ]
+        assert parallel.missing_tracks == sequential.missing_tracks
+
     def test_comparison_statistics(self, sample_tracks):
         """Test comparison result statistics."""
         lib1 = Library("Library 1", "spotify")
@@ -4,7 +4,7 @@ Unit tests for core models.
 
 import pytest
 
-from musicweb.core.models import Library, Track, TrackNormalizer
+from musicweb.core.models import Library, Track, TrackMatcher, TrackNormalizer
 
 
 class TestTrack:
@@ -80,9 +80,9 @@ class TestLibrary:
         assert library.total_tracks == 1
         assert library.tracks[0] == sample_track
 
-    def test_library_statistics(self, sample_library):
+    def test_library_statistics(self, readonly_sample_library):
         """Test library statistics calculation."""
-        stats = sample_library.get_statistics()
+        stats = readonly_sample_library.get_statistics()
 
         assert isinstance(stats, dict)
         assert "total_tracks" in stats
@@ -91,9 +91,9 @@ class TestLibrary:
         assert "duration_stats" in stats
         assert stats["total_tracks"] > 0
 
-    def test_artist_counts(self, sample_library):
+    def test_artist_counts(self, readonly_sample_library):
         """Test artist counting functionality."""
-        artist_counts = sample_library.artist_counts
+        artist_counts = readonly_sample_library.artist_counts
 
         assert isinstance(artist_counts, dict)
         assert len(artist_counts) > 0
@@ -153,3 +153,76 @@ class TestTrackNormalizer:
         assert "one" in tokens
         assert "two" in tokens
         assert "three" in tokens
+
+
+# Titles around the fuzzy thresholds: versions, typos, reorders, empties
+MATCHER_TITLES = [
+    "Bohemian Rhapsody",
+    "Bohemian Rhapsody - Remastered 2011",
+    "Bohemian Rapsody",
+    "Rhapsody Bohemian",
+    "Hey Jude",
+    "Hey Joe",
+    "Clocks (Live at Wembley)",
+    "Locks",
+    "A Day in the Life",
+    "Day in the Life",
+    "",
+]
+
+# Candidates whose titles score only moderately against MATCHER_TITLES, so
+# a match hinges on the other fields
+CANDIDATE_TITLES = [
+    "Rhapsody in Blue",
+    "Bohemian",
+    "Clocks Live",
+    "Life in a Day",
+    "Hey Jude",
+]
+
+
+class TestTrackMatcher:
+    """Test bulk title scoring and candidate pruning in TrackMatcher."""
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    def test_bulk_title_scores_match_pairwise(self, strict_mode):
+        """`_title_similarities` equals `_calculate_title_similarity` per pair."""
+        matcher = TrackMatcher(strict_mode=strict_mode)
+        titles = [Track(t or "x", "a").normalized_title for t in MATCHER_TITLES]
+        titles[-1] = ""
+
+        for title in titles:
+            bulk = matcher._title_similarities(title, titles)
+            pairwise = [matcher._calculate_title_similarity(title, o) for o in titles]
+            assert bulk == pytest.approx(pairwise, abs=1e-12)
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    def test_pruning_keeps_every_match_above_min_confidence(self, strict_mode):
+        """find_best_match agrees with scoring every candidate in full."""
+        candidates = [
+            Track(title, artist, album="Album", duration=duration)
+            for title in CANDIDATE_TITLES
+            for artist in ("Queen", "The Beatles", "Queen & David Bowie")
+            for duration in (180, 240)
+        ]
+        min_conf = 0.80 if strict_mode else 0.72
+
+        for title in MATCHER_TITLES[:-1]:
+            for artist in ("Queen", "The Beatles"):
+                target = Track(title, artist, album="Album", duration=182)
+                matcher = TrackMatcher(strict_mode=strict_mode, enable_album=True)
+                result = matcher.find_best_match(target, candidates)
+
+                pool = [
+                    c
+                    for c in matcher._get_candidate_subset(target, candidates)
+                    if c.is_music
+                ]
+                scores = [matcher.calculate_match_confidence(target, c) for c in pool]
+                best = max(scores, default=0.0)
+
+                if best < min_conf:
+                    assert result is None
+                else:
+                    assert result is not None
+                    assert result[1] == pytest.approx(best) or result[1] >= 0.98
@@ -0,0 +1,52 @@
+"""
+Unit tests for YouTube Music deduplication.
+"""
+
+import pytest
+
+from musicweb.integrations import deduplication
+from musicweb.integrations.deduplication import YouTubeMusicDeduplicator
+
+
+def _song(video_id, title, artist):
+    return {"videoId": video_id, "title": title, "artists": [{"name": artist}]}
+
+
+# Near-duplicate titles and artists that sit on either side of the thresholds
+SONGS = [
+    _song("a1", "Bohemian Rhapsody", "Queen"),
+    _song("a2", "Bohemian Rhapsody - Remastered", "Queen"),
+    _song("a3", "Bohemian Rapsody", "Queen"),
+    _song("a4", "Bohemian Rhapsody", "Queens"),
+    _song("b1", "Hey Jude", "The Beatles"),
+    _song("b2", "Hey Jude!", "Beatles"),
+    _song("b3", "Hey Joe", "The Beatles"),
+    _song("c1", "Clocks", "Coldplay"),
+    _song("c2", "Clocks (Live)", "Coldplay"),
+    _song("c3", "Locks", "Coldplay"),
+    _song("d1", "", ""),
+    _song("d2", "", ""),
+]
+
+
+def _grouping(groups):
+    return [sorted(d.id for d in g["duplicates"]) for g in groups]
+
+
+class TestFindDuplicates:
+    """Test duplicate grouping."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95])
+    def test_prefilter_matches_full_scan(self, monkeypatch, threshold):
+        """The rapidfuzz candidate prefilter never changes the grouping."""
+        pytest.importorskip("rapidfuzz")
+        dedup = YouTubeMusicDeduplicator()
+
+        pruned = dedup.find_duplicates(threshold, songs=SONGS)
+        monkeypatch.setattr(deduplication, "HAVE_RAPIDFUZZ", False)
+        full = dedup.find_duplicates(threshold, songs=SONGS)
+
+        assert _grouping(pruned) == _grouping(full)
+        assert [g["similarity_scores"] for g in pruned] == [
+            g["similarity_scores"] for g in full
+        ]
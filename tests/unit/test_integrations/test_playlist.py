@@ -0,0 +1,68 @@
+"""
+Unit tests for playlist management.
+"""
+
+import pytest
+
+from musicweb.core.models import Track
+from musicweb.integrations.playlist import PlaylistManager
+
+REJECTED = {"status": "STATUS_FAILED"}
+SUCCEEDED = {"status": "STATUS_SUCCEEDED"}
+
+
+class FakeYTMusic:
+    """Records add_playlist_items calls and rejects the given video IDs."""
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.calls = []
+
+    def add_playlist_items(self, playlist_id, video_ids):
+        self.calls.append(list(video_ids))
+        if self.rejected.intersection(video_ids):
+            return REJECTED
+        return SUCCEEDED
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """PlaylistManager whose searches match every track to `vid-<title>`."""
+    monkeypatch.setattr("musicweb.integrations.playlist.time.sleep", lambda s: None)
+    mgr = PlaylistManager()
+    monkeypatch.setattr(
+        mgr,
+        "find_best_match",
+        lambda track: {
+            "youtube_track": {"videoId": f"vid-{track.title}"},
+            "confidence": 0.9,
+        },
+    )
+    return mgr
+
+
+class TestAddTracksToPlaylist:
+    """Test batched playlist additions."""
+
+    def test_batch_added_with_one_request(self, manager):
+        """Every matched track goes in one add_playlist_items call."""
+        manager.ytmusic = FakeYTMusic()
+        tracks = [Track("a", "Artist"), Track("b", "Artist")]
+
+        result = manager._add_tracks_to_playlist("pl", tracks, False)
+
+        assert manager.ytmusic.calls == [["vid-a", "vid-b"]]
+        assert len(result["added"]) == 2
+        assert result["failed"] == []
+
+    def test_rejected_batch_retries_each_track(self, manager):
+        """A rejected batch falls back per item and reports rejected tracks."""
+        manager.ytmusic = FakeYTMusic(rejected={"vid-b"})
+        tracks = [Track("a", "Artist"), Track("b", "Artist")]
+
+        result = manager._add_tracks_to_playlist("pl", tracks, False)
+
+        assert manager.ytmusic.calls == [["vid-a", "vid-b"], ["vid-a"], ["vid-b"]]
+        assert [e["original_track"]["title"] for e in result["added"]] == ["a"]
+        assert [f["track"]["title"] for f in result["failed"]] == ["b"]
+        assert result["failed"][0]["reason"] == "Failed to add to playlist"